@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Запись игры в последовательность кадров PNG или анимированный GIF.
+
+Главный поток только копирует готовый кадр в байты и кладет его в очередь
+ограниченного размера; кодирование и запись на диск выполняет фоновый поток.
+PNG собирается вручную через zlib: сжатие отпускает GIL, поэтому поток записи
+почти не отнимает время у игрового цикла (pygame.image.save держит GIL).
+Если поток записи не успевает, новые кадры отбрасываются (еще до копирования),
+а игровой цикл не ждет. Кадры берутся не чаще capture_fps раз в секунду.
+
+GIF собирается из записанных кадров при остановке записи и требует Pillow
+(pip install pillow); без него остается последовательность PNG. Кадры читаются
+с диска по одному, а длинная запись прореживается до GIF_MAX_FRAMES кадров:
+Pillow держит в памяти все кадры собираемого GIF.
+"""
+
+import math
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+from typing import Iterator, List, Optional, Tuple
+
+import pygame
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+CAPTURE_FPS = 15  # Кадров записи в секунду (отрисовка идет чаще)
+QUEUE_SIZE = 32  # Кадров в очереди на запись; при переполнении кадры пропускаются
+PNG_COMPRESSION = 6
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+FORMATS = ("png", "gif")
+GIF_MAX_FRAMES = 300  # Кадров в GIF; более длинная запись прореживается равномерно
+
+_to_bytes = getattr(pygame.image, "tobytes", None) or pygame.image.tostring  # tobytes - с pygame 2.1.3
+
+Frame = Tuple[bytes, Tuple[int, int], float]  # (пиксели RGB, размер, время)
+
+
+def _png_chunk(tag: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(data, zlib.crc32(tag)))
+
+
+def encode_png(pixels: bytes, size: Tuple[int, int]) -> bytes:
+    """PNG из пикселей RGB (8 бит на канал, без фильтров строк)"""
+    width, height = size
+    stride = width * 3
+    # Каждая строка начинается с байта фильтра (0 - без фильтра)
+    raw = b"".join(b"\x00" + pixels[y * stride:(y + 1) * stride] for y in range(height))
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (PNG_SIGNATURE + _png_chunk(b"IHDR", header)
+            + _png_chunk(b"IDAT", zlib.compress(raw, PNG_COMPRESSION)) + _png_chunk(b"IEND", b""))
+
+
+class FrameCapture:
+    """Очередь кадров и фоновый поток, записывающий их на диск"""
+
+    def __init__(self, out_dir: str, fmt: str = "png", fps: float = CAPTURE_FPS, queue_size: int = QUEUE_SIZE):
+        if fmt == "gif" and Image is None:
+            print("⚠ Для записи GIF нужен Pillow (pip install pillow), записываем кадры PNG")
+            fmt = "png"
+        self.out_dir = out_dir
+        self.format = fmt
+        self.step = 1.0 / fps
+        self.next_frame = 0.0
+        self.frames = 0  # Записано кадров
+        self.dropped = 0  # Пропущено из-за переполнения очереди
+        self._times: List[float] = []  # Время кадров - для длительностей GIF
+        self._queue: "queue.Queue[Optional[Frame]]" = queue.Queue(maxsize=queue_size)
+        os.makedirs(out_dir, exist_ok=True)
+        self._worker = threading.Thread(target=self._run, name="capture", daemon=True)
+        self._worker.start()
+
+    def offer(self, backend):
+        """Предлагает текущий кадр бэкенда; вызывается перед выводом кадра на экран"""
+        now = time.perf_counter()
+        if now < self.next_frame:
+            return
+        self.next_frame = max(self.next_frame + self.step, now)
+        if self._queue.full():
+            # Поток записи отстает - не копируем кадр вовсе
+            self.dropped += 1
+            return
+        surface = backend.frame_surface()
+        if surface is None:
+            return
+        try:
+            self._queue.put_nowait((_to_bytes(surface, "RGB"), surface.get_size(), now))
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self):
+        while True:
+            frame = self._queue.get()
+            if frame is None:
+                break
+            pixels, size, timestamp = frame
+            try:
+                with open(self._frame_path(self.frames), "wb") as f:
+                    f.write(encode_png(pixels, size))
+                self._times.append(timestamp)
+                self.frames += 1
+            except OSError as e:
+                print(f"⚠ Не удалось записать кадр: {e}")
+
+    def _frame_path(self, index: int) -> str:
+        return os.path.join(self.out_dir, f"frame_{index:06d}.png")
+
+    def close(self):
+        """Дописывает очередь и, для GIF, собирает анимацию"""
+        self._queue.put(None)
+        self._worker.join()
+        if self.format == "gif" and self.frames:
+            self._write_gif()
+        print(f"✓ Запись: {self.frames} кадров в {self.out_dir}, пропущено {self.dropped}")
+
+    def _gif_frames(self, indices: List[int]) -> Iterator["Image.Image"]:
+        """Кадры GIF по одному: файл закрывается до чтения следующего (иначе в Windows его не удалить)"""
+        for i in indices:
+            with Image.open(self._frame_path(i)) as image:
+                frame = image.copy()
+            yield frame
+
+    def _write_gif(self):
+        stride = math.ceil(self.frames / GIF_MAX_FRAMES)
+        indices = list(range(0, self.frames, stride))
+        # Длительность кадра - до следующего взятого (пропуски и прореживание не ускоряют анимацию)
+        times = [self._times[i] for i in indices]
+        durations = [int((b - a) * 1000) for a, b in zip(times, times[1:])]
+        durations.append(int((self._times[-1] - times[-1] + self.step) * 1000))
+        frames = self._gif_frames(indices)
+        try:
+            first = next(frames)
+            first.save(os.path.join(self.out_dir, "capture.gif"), save_all=True,
+                       append_images=frames, duration=durations, loop=0)
+        except (OSError, ValueError, Image.UnidentifiedImageError) as e:
+            print(f"⚠ Не удалось собрать GIF, кадры остались в PNG: {e}")
+            return
+        finally:
+            frames.close()
+        try:
+            for i in range(self.frames):
+                os.remove(self._frame_path(i))
+        except OSError as e:
+            print(f"⚠ GIF записан, но кадры PNG не удалены: {e}")
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Проверка бюджета выделения памяти за кадр (tracemalloc).
+
+Игра запускается без окна, в каждом режиме проходит разогрев (кэши текста и
+раскладок заполняются), затем измеряются кадры игры: тик симуляции и отрисовка.
+Автопилот ведет змейку к нужному яблоку, поэтому в измерение попадают и
+события - поедание, новый вопрос или слово, новый раунд. Так же измеряются
+главное меню и экран конца игры. Для каждого кадра считаются
+    пик  - на сколько память Python поднималась внутри кадра (временные строки,
+           кортежи, списки, Rect, поверхности);
+    рост - сколько памяти осталось занятым после кадра (утечки, растущие кэши).
+Бюджеты:
+    PEAK_BUDGET       - пик в 95% кадров без событий (выделение в каждом кадре
+                        или в заметной части кадров);
+    EVENT_PEAK_BUDGET - пик в любом кадре, в том числе с событием (новые надписи
+                        рисуются один раз, но не целые поверхности на каждое яблоко);
+    GROWTH_BUDGET     - средний рост в кадрах без событий (утечки). В кадрах с
+                        событиями рост законен: змейка удлиняется, кэши пополняются.
+Если бюджет превышен, скрипт завершается с кодом 1 и печатает места, где память
+осталась занятой.
+
+Статистика пишется во временную базу, чтобы не попасть в таблицу рекордов.
+
+    python check_allocations.py [--renderer sdl2] [--frames 300]
+
+Проверка входит в тесты (tests/test_allocations.py) с меньшим числом кадров.
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from array import array
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+PEAK_BUDGET = 384  # Байт временных объектов в 95% кадров без событий
+EVENT_PEAK_BUDGET = 64 * 1024  # Байт временных объектов в любом кадре (новый вопрос, новое слово)
+GROWTH_BUDGET = 4  # Байт, остающихся занятыми после кадра без событий, в среднем
+WARMUP_FRAMES = 60
+FRAMES = 300
+CONTENT_TIMEOUT = 30.0
+
+
+def target_cell(game):
+    """Клетка яблока, которое нужно съесть: обычного, с правильным ответом или правильной буквой"""
+    plugin = game.mode
+    apples = getattr(plugin, "apples", None)
+    if apples is None:
+        apple = getattr(plugin, "apple", None)
+        return apple.position if apple else None
+    correct_number = getattr(plugin, "correct_number", None)
+    for apple in apples:
+        if getattr(apple, "is_correct", False) or getattr(apple, "answer_number", None) == correct_number:
+            return apple.position
+    return None
+
+
+def steer(game):
+    """Автопилот: ведет змейку к нужному яблоку, чтобы в измерение попадали поедание и новые расклады"""
+    from entities import Direction
+
+    target = target_cell(game)
+    snake = game.snake
+    if target is None:
+        return
+    head_x, head_y = snake.body[0]
+    dx, dy = target[0] - head_x, target[1] - head_y
+    if dx:
+        want = Direction.RIGHT if dx > 0 else Direction.LEFT
+        if want.value[0] == -snake.direction.value[0]:
+            want = Direction.DOWN if dy >= 0 else Direction.UP  # Яблоко позади - сначала в сторону
+    elif dy:
+        want = Direction.DOWN if dy > 0 else Direction.UP
+        if want.value[1] == -snake.direction.value[1]:
+            want = Direction.RIGHT
+    else:
+        return
+    if want != snake.direction:
+        snake.queue_turn(want, time.perf_counter())
+
+
+def measure_mode(game, mode: str, frames: int):
+    """Возвращает (пики по кадрам, рост по кадрам, признаки событий, снимки до и после) для режима"""
+    game.start_game(mode)
+    deadline = time.monotonic() + CONTENT_TIMEOUT
+    # Ждем и необязательный контент (например, индекс слов), иначе он придет посреди измерения
+    while (game.pending_mode or game._pending_content) and time.monotonic() < deadline:
+        game._poll_content()
+        time.sleep(0.05)
+    if game.current_screen != "game":
+        raise RuntimeError(f"режим {mode} не запустился")
+
+    def restart() -> bool:
+        restarted = game.current_screen != "game"
+        if restarted:
+            game.start_game(mode)  # Змейка врезалась - начинаем заново (вне измерения)
+        steer(game)
+        return restarted
+
+    def state() -> int:
+        # Съедено яблоко, раунд закончился или начался заново (новый расклад, новые надписи)
+        return game.score + len(game.snake.body) if game.current_screen == "game" else -1
+
+    return measure_frames(game, frames, restart, state)
+
+
+def measure_screen(game, screen: str, frames: int):
+    """То же для экрана без игры (меню, конец игры): событий нет, только отрисовка"""
+    def restart() -> bool:
+        restarted = game.current_screen != screen
+        game.current_screen = screen
+        return restarted
+
+    return measure_frames(game, frames, restart, lambda: 0)
+
+
+def measure_frames(game, frames: int, restart, state):
+    """Разогрев и измерение кадров; restart() перед кадром возвращает, начат ли раунд заново,
+    state() до и после кадра отличаются, если в кадре было событие"""
+    # Трассировка включается до разогрева: объекты, созданные до нее, при освобождении
+    # не вычитаются, и кадр выглядел бы растущим (так выглядит любая замена хвоста змейки)
+    tracemalloc.start(8)
+    for _ in range(WARMUP_FRAMES):
+        restart()
+        game.update()
+        game.draw()
+    # Массивы заранее, чтобы само измерение не занимало память между кадрами.
+    # Кадр 0 не учитывается: в нем впервые создаются переменные самого цикла
+    peaks = array("q", bytes(8 * (frames + 1)))
+    growth = array("q", bytes(8 * (frames + 1)))
+    events = array("b", bytes(frames + 1))
+    before = tracemalloc.take_snapshot()
+    for i in range(frames + 1):
+        restarted = restart()
+        previous = state()
+        tracemalloc.reset_peak()
+        size = tracemalloc.get_traced_memory()[0]
+        game.update()
+        game.draw()
+        current, peak = tracemalloc.get_traced_memory()
+        peaks[i] = peak - size
+        growth[i] = current - size
+        events[i] = restarted or previous != state()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    return peaks[1:], growth[1:], events[1:], before, after
+
+
+def percentile(values, share: float) -> int:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * share))] if ordered else 0
+
+
+def main() -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Бюджет выделения памяти за кадр")
+    parser.add_argument("--renderer", default="software", help="бэкенд отрисовки (software или sdl2)")
+    parser.add_argument("--frames", type=int, default=FRAMES, help=f"измеряемых кадров на режим ({FRAMES})")
+    args = parser.parse_args()
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import snake_game
+    import stats_store
+    from stats_store import StatsStore
+
+    # Поток записи статистики выделяет память параллельно кадрам, и tracemalloc приписал бы ее
+    # случайному кадру; записи копятся в очереди и попадают в базу при закрытии, после измерений
+    stats_store.FLUSH_INTERVAL = 24 * 3600.0
+    stats_store.BATCH_SIZE = sys.maxsize
+    stats = StatsStore(os.path.join(tempfile.mkdtemp(prefix="clever_snake_"), "stats.sqlite3"))
+    stats.start()
+    game = snake_game.Game(renderer=args.renderer, stats=stats)
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+    failed = False
+    runs = [(mode, measure_mode) for mode in game.mode_names] + [("menu", measure_screen),
+                                                                 ("game_over", measure_screen)]
+    for mode, measure in runs:
+        peaks, growth, events, before, after = measure(game, mode, args.frames)
+        quiet = [i for i in range(len(peaks)) if not events[i]]
+        quiet_peak = percentile([peaks[i] for i in quiet], 0.95)
+        quiet_growth = sum(growth[i] for i in quiet) / max(1, len(quiet))
+        max_peak = max(peaks)
+        ok = quiet_peak <= PEAK_BUDGET and quiet_growth <= GROWTH_BUDGET and max_peak <= EVENT_PEAK_BUDGET
+        failed = failed or not ok
+        print(f"{'✓' if ok else '✗'} {mode}: пик {percentile(peaks, 0.5)} Б (медиана), {quiet_peak} Б (95% кадров "
+              f"без событий), {max_peak} Б (макс., {len(peaks) - len(quiet)} кадров с событиями); "
+              f"рост {quiet_growth:.1f} Б/кадр без событий, {sum(growth) / len(growth):.1f} Б/кадр всего")
+        if not ok:
+            stats_diff = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), "traceback")
+            for stat in stats_diff[:5]:
+                print(f"    {stat.size_diff:+} Б, {stat.count_diff:+} объектов")
+                for line in stat.traceback.format()[-4:]:
+                    print(f"      {line}")
+    print(f"Бюджет: пик {PEAK_BUDGET} Б (95% кадров без событий), {EVENT_PEAK_BUDGET} Б (любой кадр); "
+          f"рост {GROWTH_BUDGET} Б/кадр (в среднем без событий)")
+    game.close()
+    stats.close()
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
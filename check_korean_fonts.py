@@ -4,58 +4,34 @@
 Скрипт для проверки и установки корейских шрифтов
 """
 
-import pygame
 import sys
 import os
 import platform
 
 def check_korean_fonts():
-    """Проверяет доступность корейских шрифтов"""
+    """Проверяет доступность корейских шрифтов по индексу шрифтов"""
+    # Индекс шрифтов импортирует pygame, поэтому подключается после проверки pygame в main()
+    from font_index import FontIndex, required_scripts
+
     print("Проверка корейских шрифтов...")
-    
-    pygame.font.init()
-    
-    # Список корейских шрифтов для проверки
-    korean_fonts = [
-        "Malgun Gothic",
-        "맑은 고딕", 
-        "Gulim",
-        "굴림",
-        "Dotum",
-        "돋움",
-        "Batang",
-        "바탕",
-        "Arial Unicode MS",
-        "Noto Sans CJK KR",
-        "AppleGothic"
-    ]
-    
+
+    index = FontIndex()
+    index.load()
+    scanned = index.update()
+    print(f"Шрифтов в индексе: {len(index.fonts)}, проверено заново: {scanned}")
+
     available_fonts = []
-    
-    for font_name in korean_fonts:
-        try:
-            font = pygame.font.Font(font_name, 12)
-            test_surface = font.render("한글", True, (255, 255, 255))
-            if test_surface.get_width() > 0:
-                available_fonts.append(font_name)
-                print(f"✓ {font_name} - доступен")
-            else:
-                print(f"✗ {font_name} - недоступен")
-        except:
-            print(f"✗ {font_name} - недоступен")
-    
-    # Проверяем системный шрифт
-    try:
-        system_font = pygame.font.Font(None, 12)
-        test_surface = system_font.render("한글", True, (255, 255, 255))
-        if test_surface.get_width() > 0:
-            available_fonts.append("System Font")
-            print("✓ System Font - поддерживает корейские символы")
-        else:
-            print("✗ System Font - не поддерживает корейские символы")
-    except:
-        print("✗ System Font - ошибка при проверке")
-    
+    for path in index.covering("hangul"):
+        coverage = index.coverage(path)
+        names = ", ".join(index.fonts[path].get("names", [])) or os.path.basename(path)
+        # Кириллица нужна для интерфейса на русском
+        extra = "" if coverage.get("cyrillic", 0.0) >= 1.0 else " (без кириллицы)"
+        available_fonts.append(names)
+        print(f"✓ {names} - доступен{extra}")
+
+    best = index.best_font(required_scripts("ru"))
+    if best:
+        print(f"Игра будет использовать: {best}")
     return available_fonts
 
 def get_installation_instructions():
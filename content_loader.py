@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Фоновая загрузка контента игры (шрифты, вопросы, слова).
+
+Задачи выполняются в пуле потоков, а игровой цикл только опрашивает их состояние,
+поэтому меню появляется сразу, а режимы открываются по мере готовности данных.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Tuple
+
+
+class ContentLoader:
+    """Запускает загрузчики в фоне и отдает результаты по имени"""
+
+    def __init__(self, max_workers: int = 2):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="content")
+        self._tasks: Dict[str, Future] = {}
+        # Счетчик готовых задач ведут сами задачи: меню спрашивает прогресс каждый кадр
+        self._done = 0
+        self._done_lock = threading.Lock()
+
+    def submit(self, name: str, loader: Callable[[], Any]) -> Future:
+        """Ставит загрузчик в очередь под указанным именем"""
+        future = self._executor.submit(loader)
+        self._tasks[name] = future
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, future: Future):
+        with self._done_lock:
+            self._done += 1
+
+    def submit_once(self, name: str, loader: Callable[[], Any]) -> Future:
+        """Ставит загрузчик, только если под этим именем еще ничего не грузилось (общий загрузчик игр)"""
+        future = self._tasks.get(name)
+        return future if future is not None else self.submit(name, loader)
+
+    def is_ready(self, name: str) -> bool:
+        """Проверяет, завершилась ли загрузка (успешно или с ошибкой)"""
+        future = self._tasks.get(name)
+        return future is not None and future.done()
+
+    def result(self, name: str, default: Any = None) -> Any:
+        """Возвращает результат готовой загрузки или default"""
+        future = self._tasks.get(name)
+        if future is None or not future.done():
+            return default
+        error = future.exception()
+        if error is not None:
+            print(f"⚠ Ошибка при загрузке '{name}': {error}")
+            return default
+        return future.result()
+
+    def progress(self) -> Tuple[int, int]:
+        """Возвращает (завершено, всего) задач"""
+        return self._done, len(self._tasks)
+
+    @property
+    def all_ready(self) -> bool:
+        done, total = self.progress()
+        return done == total
+
+    def shutdown(self):
+        """Останавливает пул, не дожидаясь незавершенных задач"""
+        self._executor.shutdown(wait=False)
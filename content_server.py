@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Пульт учителя: раздача пакетов вопросов и слов запущенным играм по локальной сети класса.
+
+Учитель кладет пакеты (JSON) в папку и запускает сервер:
+    python content_server.py --packs packs/ --listen 127.0.0.1:8765
+Игры подключаются с --content-server 127.0.0.1:8765. Вместо TCP можно
+использовать Unix-сокет: --listen unix:/tmp/clever_snake.sock.
+
+По умолчанию пульт слушает только этот компьютер. Чтобы раздавать пакеты по сети
+класса (--listen 0.0.0.0:8765), нужен общий токен: пульт запускается с --token,
+игры - с --content-token; игру с другим токеном пульт отключает.
+
+Пакет - файл <имя>.json:
+    {"target": "quiz.questions", "data": {"ru": [{"question": "...", "correct": "...", "wrong": ["..."]}]}}
+target - контент режима из PACK_TARGETS, data - списки по языкам. Пакеты
+одного target объединяются по порядку имен и заменяют встроенный контент
+своих языков.
+
+Протокол - строки JSON. Клиент при подключении сообщает хэши своих пакетов
+({"have": {имя: хэш}}), сервер отвечает только изменившимися пакетами и
+именами удаленных, а затем присылает такие же разницы при каждом изменении
+папки. Неизменившиеся пакеты не пересылаются, в том числе после перезапуска
+игры: полученные пакеты хранятся в кэше на диске.
+
+Игра подменяет контент только между раундами (при старте игры), поэтому
+текущий раунд доигрывается на прежних вопросах.
+"""
+
+import hashlib
+import hmac
+import ipaddress
+import json
+import os
+import select
+import socket
+import socketserver
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_ADDRESS = "127.0.0.1:8765"
+POLL_INTERVAL = 1.0  # Как часто сервер проверяет папку пакетов
+RETRY_SECONDS = 5.0  # Пауза перед повторным подключением клиента
+PACK_CACHE = os.path.join(os.path.expanduser("~"), ".clever_snake", "cache", "packs.json")
+
+Pack = Dict[str, Any]
+Content = Dict[str, Dict[str, List[Any]]]  # target -> язык -> список
+
+
+def pack_hash(pack: Pack) -> str:
+    """Хэш содержимого пакета (не зависит от порядка ключей и форматирования файла)"""
+    text = json.dumps(pack, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _check_question(item: Any) -> Optional[str]:
+    if not isinstance(item, dict):
+        return "вопрос должен быть объектом"
+    if not isinstance(item.get("question"), str) or not isinstance(item.get("correct"), str):
+        return "у вопроса нужны строки question и correct"
+    wrong = item.get("wrong")
+    if not isinstance(wrong, list) or not wrong or not all(isinstance(answer, str) for answer in wrong):
+        return "у вопроса нужен непустой список строк wrong"
+    return None
+
+
+def _check_word(item: Any) -> Optional[str]:
+    return None if isinstance(item, str) and item else "слово должно быть непустой строкой"
+
+
+# Контент, который можно заменить пакетом, и проверка элементов его списков; другие target отклоняются
+PACK_TARGETS = {
+    "quiz.questions": _check_question,
+    "word_collection.words": _check_word,
+}
+
+
+def validate_pack(pack: Any) -> Pack:
+    """Проверяет форму пакета и его элементов; ошибка - ValueError"""
+    if not isinstance(pack, dict):
+        raise ValueError("пакет должен быть объектом JSON")
+    target = pack.get("target")
+    if target not in PACK_TARGETS:
+        raise ValueError(f"поле target - одно из: {', '.join(PACK_TARGETS)}")
+    data = pack.get("data")
+    if not isinstance(data, dict) or not all(isinstance(items, list) for items in data.values()):
+        raise ValueError("поле data - объект {язык: [...]}")
+    check = PACK_TARGETS[target]
+    for lang, items in data.items():
+        for i, item in enumerate(items):
+            error = check(item)
+            if error:
+                raise ValueError(f"{lang}[{i}]: {error}")
+    return pack
+
+
+def merge_packs(packs: Dict[str, Pack]) -> Content:
+    """Объединяет пакеты по target: списки одного языка склеиваются по порядку имен пакетов"""
+    content: Content = {}
+    for name in sorted(packs):
+        pack = packs[name]
+        target = content.setdefault(pack["target"], {})
+        for lang, items in pack["data"].items():
+            target.setdefault(lang, []).extend(items)
+    return content
+
+
+def _parse_address(address: str) -> Tuple[int, Any]:
+    """'host:port' -> TCP, 'unix:/путь' -> Unix-сокет"""
+    if address.startswith("unix:"):
+        if not hasattr(socket, "AF_UNIX"):
+            raise ValueError("Unix-сокеты не поддерживаются в этой системе")
+        return socket.AF_UNIX, address[len("unix:"):]
+    host, _, port = address.rpartition(":")
+    return socket.AF_INET, (host or "127.0.0.1", int(port))
+
+
+def _is_local(host: str) -> bool:
+    """Слушает ли адрес только этот компьютер"""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False  # Имя хоста может указывать на сетевой интерфейс
+
+
+def _send(stream, message: Dict[str, Any]):
+    stream.write((json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8"))
+    stream.flush()
+
+
+class PackServer:
+    """Сервер пакетов: следит за папкой и рассылает клиентам разницы"""
+
+    def __init__(self, pack_dir: str, address: str = DEFAULT_ADDRESS, token: Optional[str] = None):
+        self.pack_dir = pack_dir
+        self.address = address
+        self.token = token  # Общий секрет с играми; без него пульт доступен только с этого компьютера
+        self.packs: Dict[str, Tuple[str, Pack]] = {}  # Имя -> (хэш, пакет)
+        self.version = 0
+        self.clients = 0
+        self.changed = threading.Condition()
+        self.stopping = False
+        self._signature: Optional[List[Tuple[str, int, int]]] = None
+        self._server: Optional[socketserver.BaseServer] = None
+
+    def _signature_now(self) -> List[Tuple[str, int, int]]:
+        signature = []
+        try:
+            for name in sorted(os.listdir(self.pack_dir)):
+                if name.endswith(".json"):
+                    stat = os.stat(os.path.join(self.pack_dir, name))
+                    signature.append((name, stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            pass
+        return signature
+
+    def poll(self) -> bool:
+        """Перечитывает папку, если в ней что-то изменилось; возвращает, изменились ли пакеты"""
+        signature = self._signature_now()
+        if signature == self._signature:
+            return False
+        self._signature = signature
+        packs = {}
+        for name, _, _ in signature:
+            path = os.path.join(self.pack_dir, name)
+            try:
+                with open(path, encoding="utf-8") as f:
+                    pack = validate_pack(json.load(f))
+            except (OSError, ValueError) as e:
+                # Недописанный или ошибочный файл: остается прежняя версия пакета, если она была
+                print(f"⚠ Пакет {name}: {e}")
+                previous = self.packs.get(name[:-len(".json")])
+                if previous:
+                    packs[name[:-len(".json")]] = previous
+                continue
+            packs[name[:-len(".json")]] = (pack_hash(pack), pack)
+        if {name: entry[0] for name, entry in packs.items()} == {name: entry[0] for name, entry in self.packs.items()}:
+            return False
+        for name in sorted(set(packs) | set(self.packs)):
+            if name not in packs:
+                print(f"✓ Пакет {name} удален")
+            elif self.packs.get(name, ("",))[0] != packs[name][0]:
+                print(f"✓ Пакет {name} ({packs[name][1]['target']}): {packs[name][0][:12]}")
+        with self.changed:
+            self.packs = packs
+            self.version += 1
+            self.changed.notify_all()
+        return True
+
+    def _handler(self):
+        server = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                try:
+                    hello = json.loads(self.rfile.readline() or b"{}")
+                    known: Dict[str, str] = dict(hello.get("have", {}))
+                    token = str(hello.get("token") or "")
+                except (ValueError, TypeError, AttributeError):
+                    return
+                if server.token and not hmac.compare_digest(token.encode("utf-8"), server.token.encode("utf-8")):
+                    print(f"⚠ Игра {self.client_address or 'unix'} отклонена: неверный токен")
+                    try:
+                        _send(self.wfile, {"error": "неверный токен пульта"})
+                    except OSError:
+                        pass
+                    return
+                with server.changed:
+                    server.clients += 1
+                print(f"✓ Подключилась игра ({server.clients} всего)")
+                version = -1
+                try:
+                    while True:
+                        with server.changed:
+                            server.changed.wait_for(lambda: server.stopping or server.version != version,
+                                                    timeout=POLL_INTERVAL)
+                            if server.stopping:
+                                return
+                            version, packs = server.version, server.packs
+                        # После приветствия игра ничего не пишет: готовность к чтению - это закрытие
+                        if select.select([self.connection], [], [], 0)[0] and not self.connection.recv(1):
+                            return
+                        # Только изменившиеся пакеты; хэши совпали - пакет не пересылается
+                        changed = {name: pack for name, (digest, pack) in packs.items() if known.get(name) != digest}
+                        removed = [name for name in known if name not in packs]
+                        if changed or removed:
+                            _send(self.wfile, {"packs": changed, "removed": removed})
+                            known = {name: digest for name, (digest, _) in packs.items()}
+                except OSError:
+                    pass  # Игра закрылась
+                finally:
+                    with server.changed:
+                        server.clients -= 1
+                    print(f"✓ Игра отключилась ({server.clients} осталось)")
+
+        return Handler
+
+    def start(self):
+        """Открывает сокет и начинает принимать игры в фоне"""
+        family, address = _parse_address(self.address)
+        if family == socket.AF_INET and not _is_local(address[0]) and not self.token:
+            raise ValueError(f"пульт на сетевом адресе {self.address} запускается только с --token")
+        self.poll()
+        if family == socket.AF_INET:
+            server_class = socketserver.ThreadingTCPServer
+            server_class.allow_reuse_address = True
+        else:
+            server_class = socketserver.ThreadingUnixStreamServer
+            if os.path.exists(address):
+                os.remove(address)  # Сокет, оставшийся от прошлого запуска
+        server_class.daemon_threads = True
+        self._server = server_class(address, self._handler())
+        threading.Thread(target=self._server.serve_forever, name="pack-server", daemon=True).start()
+
+    def serve(self):
+        """Следит за папкой пакетов до Ctrl+C"""
+        try:
+            while True:
+                time.sleep(POLL_INTERVAL)
+                self.poll()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.close()
+
+    def close(self):
+        with self.changed:
+            self.stopping = True
+            self.changed.notify_all()
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+
+class PackClient:
+    """Клиент игры: держит полученные пакеты и их объединение для режимов"""
+
+    def __init__(self, address: str = DEFAULT_ADDRESS, cache_path: Optional[str] = PACK_CACHE,
+                 token: Optional[str] = None):
+        self.address = address
+        self.cache_path = cache_path
+        self.token = token
+        self.packs: Dict[str, Pack] = self._load_cache()
+        # Объединенный контент; заменяется целиком новым словарем, игра читает его между раундами
+        self.content: Content = merge_packs(self.packs)
+        self._socket: Optional[socket.socket] = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="pack-client", daemon=True)
+        self._thread.start()
+
+    def _load_cache(self) -> Dict[str, Pack]:
+        if not self.cache_path:
+            return {}
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                return {name: validate_pack(pack) for name, pack in json.load(f).items()}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"⚠ Кэш пакетов поврежден, получим пакеты заново: {e}")
+            return {}
+
+    def _save_cache(self):
+        if not self.cache_path:
+            return
+        try:
+            cache_dir = os.path.dirname(self.cache_path)
+            os.makedirs(cache_dir, exist_ok=True)
+            # Кэш общий для всех игр на компьютере: у каждой записи свой временный файл,
+            # иначе одновременные сохранения перезаписали бы его друг у друга
+            with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=cache_dir, prefix="packs.",
+                                             suffix=".tmp", delete=False) as f:
+                tmp_path = f.name
+                json.dump(self.packs, f, ensure_ascii=False)
+            try:
+                os.replace(tmp_path, self.cache_path)
+            except OSError:
+                os.remove(tmp_path)
+                raise
+        except OSError as e:
+            print(f"⚠ Не удалось сохранить кэш пакетов: {e}")
+
+    def _run(self):
+        warned = False
+        while not self._closed:
+            try:
+                family, address = _parse_address(self.address)
+                with socket.socket(family, socket.SOCK_STREAM) as sock:
+                    sock.connect(address)
+                    self._socket = sock
+                    stream = sock.makefile("rwb")
+                    _send(stream, {"have": {name: pack_hash(pack) for name, pack in self.packs.items()},
+                                   "token": self.token})
+                    print(f"✓ Подключено к пульту учителя {self.address}")
+                    warned = False
+                    for line in stream:
+                        self._apply(json.loads(line))
+            except (OSError, ValueError) as e:
+                if not warned and not self._closed:
+                    print(f"⚠ Пульт учителя недоступен ({e}), повторим через {RETRY_SECONDS:.0f} с")
+                    warned = True
+            finally:
+                self._socket = None
+            if not self._closed:
+                time.sleep(RETRY_SECONDS)
+
+    def _apply(self, message: Dict[str, Any]):
+        if "error" in message:
+            raise ValueError(message["error"])
+        packs = dict(self.packs)
+        for name in message.get("removed", []):
+            packs.pop(name, None)
+        for name, pack in message.get("packs", {}).items():
+            try:
+                packs[name] = validate_pack(pack)
+            except ValueError as e:
+                print(f"⚠ Пакет {name} отклонен: {e}")
+        self.packs = packs
+        self.content = merge_packs(packs)  # Одно присваивание - игра видит либо старый, либо новый контент
+        self._save_cache()
+        print(f"✓ Пакеты обновлены: {', '.join(sorted(message.get('packs', {}))) or '-'}")
+
+    def close(self):
+        self._closed = True
+        sock = self._socket
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Пульт учителя Clever Snake: раздача пакетов вопросов и слов")
+    parser.add_argument("--packs", default="packs", help="папка с пакетами *.json (по умолчанию packs)")
+    parser.add_argument("--listen", default=DEFAULT_ADDRESS,
+                        help=f"адрес host:port или unix:/путь (по умолчанию {DEFAULT_ADDRESS})")
+    parser.add_argument("--token", default=os.environ.get("CLEVER_SNAKE_PACK_TOKEN"),
+                        help="общий токен игр класса; обязателен, если пульт слушает сетевой адрес")
+    args = parser.parse_args()
+
+    os.makedirs(args.packs, exist_ok=True)
+    pack_server = PackServer(args.packs, args.listen, args.token)
+    try:
+        pack_server.start()
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"✓ Пульт учителя слушает {args.listen}, пакеты в {os.path.abspath(args.packs)} (Ctrl+C - выход)")
+    pack_server.serve()
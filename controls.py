@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Слой ввода: клавиатура и геймпады (pygame.joystick) для нескольких игроков.
+
+События устройств превращаются в действия игроков (вверх, пауза, ...) по
+таблицам привязок. Привязки можно переопределить файлом bindings.json:
+    {"players": [{"keys": {"w": "up", "c": "pause"}, "buttons": {"7": "pause"}}]}
+Ключи "keys" - имена клавиш pygame (pygame.key.name), "buttons" - номера кнопок геймпада.
+
+Геймпады назначаются игрокам по порядку подключения. Крестовина и левый стик
+дают направления, кнопки - остальные действия. Все устройства обрабатываются
+через process_event, поэтому ввод можно проверять синтетическими событиями
+pygame.event.Event без реального оборудования.
+
+Опрос событий SDL возможен только в главном потоке, поэтому отдельного потока
+нет: игровой цикл опрашивает устройства по своему расписанию (TickScheduler,
+параметр poll_rate) и непосредственно перед каждым тиком симуляции.
+"""
+
+import json
+import time
+from enum import Enum
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+AXIS_DEADZONE = 0.5  # Отклонение стика, после которого оно считается нажатием
+MAX_PLAYERS = 4
+
+
+class Action(Enum):
+    UP = "up"
+    DOWN = "down"
+    LEFT = "left"
+    RIGHT = "right"
+    PAUSE = "pause"
+    RESUME = "resume"
+    BACK = "back"
+
+
+# Игрок 1 - WASD, игрок 2 - стрелки
+DEFAULT_KEY_BINDINGS: List[Dict[int, Action]] = [
+    {pygame.K_w: Action.UP, pygame.K_s: Action.DOWN, pygame.K_a: Action.LEFT, pygame.K_d: Action.RIGHT,
+     pygame.K_c: Action.PAUSE, pygame.K_v: Action.RESUME},
+    {pygame.K_UP: Action.UP, pygame.K_DOWN: Action.DOWN, pygame.K_LEFT: Action.LEFT,
+     pygame.K_RIGHT: Action.RIGHT},
+]
+# Раскладка Xbox/SDL: 0 - A, 1 - B, 7 - Start
+DEFAULT_BUTTON_BINDINGS: Dict[int, Action] = {0: Action.RESUME, 1: Action.BACK, 7: Action.PAUSE}
+
+HAT_DIRECTIONS = {(0, 1): Action.UP, (0, -1): Action.DOWN, (-1, 0): Action.LEFT, (1, 0): Action.RIGHT}
+
+JOYSTICK_EVENTS = (pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED, pygame.JOYBUTTONDOWN,
+                   pygame.JOYHATMOTION, pygame.JOYAXISMOTION)
+
+InputAction = Tuple[int, Action, float]  # (номер игрока, действие, время нажатия)
+
+
+class InputManager:
+    """Превращает события клавиатуры и геймпадов в действия игроков"""
+
+    def __init__(self, bindings_path: Optional[str] = None):
+        self.key_bindings: List[Dict[int, Action]] = [dict(keys) for keys in DEFAULT_KEY_BINDINGS]
+        self.button_bindings: List[Dict[int, Action]] = [dict(DEFAULT_BUTTON_BINDINGS) for _ in range(MAX_PLAYERS)]
+        self.joysticks: Dict[int, object] = {}  # instance_id -> pygame.joystick.Joystick
+        self.joystick_players: Dict[int, int] = {}  # instance_id -> номер игрока
+        self._axis_state: Dict[Tuple[int, int], int] = {}  # (instance_id, ось) -> -1, 0, 1
+        self._keys: Dict[int, Tuple[int, Action]] = {}  # Клавиша -> (игрок, действие)
+        if bindings_path:
+            self.load_bindings(bindings_path)
+        self._rebuild_keys()
+
+    # --- Привязки ---
+
+    def load_bindings(self, path: str):
+        """Загружает переопределенные привязки; отсутствующий файл - не ошибка"""
+        try:
+            with open(path, encoding="utf-8") as f:
+                config = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"⚠ Не удалось прочитать привязки клавиш: {e}")
+            return
+        for player, bindings in enumerate(config.get("players", [])[:MAX_PLAYERS]):
+            try:
+                if "keys" in bindings:
+                    keys = {pygame.key.key_code(name): Action(action) for name, action in bindings["keys"].items()}
+                    while len(self.key_bindings) <= player:
+                        self.key_bindings.append({})
+                    self.key_bindings[player] = keys
+                if "buttons" in bindings:
+                    self.button_bindings[player] = {int(button): Action(action)
+                                                    for button, action in bindings["buttons"].items()}
+            except (ValueError, KeyError) as e:
+                print(f"⚠ Ошибка в привязках игрока {player + 1}: {e}")
+        self._rebuild_keys()
+
+    def bind_key(self, player: int, key: int, action: Action):
+        """Переназначает клавишу игрока"""
+        while len(self.key_bindings) <= player:
+            self.key_bindings.append({})
+        for bindings in self.key_bindings:
+            bindings.pop(key, None)
+        self.key_bindings[player][key] = action
+        self._rebuild_keys()
+
+    def _rebuild_keys(self):
+        # Одна таблица на все клавиши: поиск действия по нажатию - один словарь
+        self._keys = {}
+        for player, bindings in enumerate(self.key_bindings):
+            for key, action in bindings.items():
+                self._keys.setdefault(key, (player, action))
+
+    @property
+    def player_count(self) -> int:
+        """Сколько игроков может управлять (клавиатурные раскладки и подключенные геймпады)"""
+        return max(len(self.key_bindings), max(self.joystick_players.values(), default=-1) + 1)
+
+    # --- Устройства ---
+
+    def _add_joystick(self, device_index: int):
+        try:
+            joystick = pygame.joystick.Joystick(device_index)
+            joystick.init()
+        except pygame.error as e:
+            print(f"⚠ Не удалось подключить геймпад: {e}")
+            return
+        instance_id = joystick.get_instance_id()
+        used = set(self.joystick_players.values())
+        player = next((p for p in range(MAX_PLAYERS) if p not in used), MAX_PLAYERS - 1)
+        self.joysticks[instance_id] = joystick
+        self.joystick_players[instance_id] = player
+        print(f"✓ Геймпад {joystick.get_name()} - игрок {player + 1}")
+
+    def _remove_joystick(self, instance_id: int):
+        self.joysticks.pop(instance_id, None)
+        self.joystick_players.pop(instance_id, None)
+        for key in [key for key in self._axis_state if key[0] == instance_id]:
+            del self._axis_state[key]
+
+    def _joystick_player(self, event: pygame.event.Event) -> int:
+        # Синтетические события могут прийти без подключения устройства - тогда это игрок 1
+        return self.joystick_players.get(getattr(event, "instance_id", -1), 0)
+
+    # --- События ---
+
+    def handles(self, event: pygame.event.Event) -> bool:
+        """Относится ли событие к устройствам ввода игроков"""
+        return event.type in JOYSTICK_EVENTS or (event.type == pygame.KEYDOWN and event.key in self._keys)
+
+    def process_event(self, event: pygame.event.Event, timestamp: Optional[float] = None) -> List[InputAction]:
+        """Превращает событие в действия игроков"""
+        if timestamp is None:
+            timestamp = time.perf_counter()
+        kind = event.type
+        if kind == pygame.KEYDOWN:
+            bound = self._keys.get(event.key)
+            return [(bound[0], bound[1], timestamp)] if bound else []
+        if kind == pygame.JOYHATMOTION:
+            action = HAT_DIRECTIONS.get(tuple(event.value))
+            return [(self._joystick_player(event), action, timestamp)] if action else []
+        if kind == pygame.JOYAXISMOTION:
+            return self._axis_action(event, timestamp)
+        if kind == pygame.JOYBUTTONDOWN:
+            player = self._joystick_player(event)
+            action = self.button_bindings[player].get(event.button)
+            return [(player, action, timestamp)] if action else []
+        if kind == pygame.JOYDEVICEADDED:
+            self._add_joystick(event.device_index)
+        elif kind == pygame.JOYDEVICEREMOVED:
+            self._remove_joystick(event.instance_id)
+        return []
+
+    def _axis_action(self, event: pygame.event.Event, timestamp: float) -> List[InputAction]:
+        """Стик срабатывает один раз при выходе из мертвой зоны, а не на каждое движение"""
+        if event.axis > 1:
+            return []  # Только левый стик
+        state = 0
+        if event.value > AXIS_DEADZONE:
+            state = 1
+        elif event.value < -AXIS_DEADZONE:
+            state = -1
+        key = (getattr(event, "instance_id", -1), event.axis)
+        if self._axis_state.get(key, 0) == state:
+            return []
+        self._axis_state[key] = state
+        if state == 0:
+            return []
+        if event.axis == 0:
+            action = Action.RIGHT if state > 0 else Action.LEFT
+        else:
+            action = Action.DOWN if state > 0 else Action.UP
+        return [(self._joystick_player(event), action, timestamp)]
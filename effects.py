@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Эффекты поля: частицы, вспышка растущего сегмента и тряска экрана.
+
+Частицы и вспышки лежат в заранее выделенных массивах (array, по массиву на
+поле), живые занимают первые count ячеек. Новый эффект берет свободные ячейки,
+умерший заменяется последним живым, поэтому за кадр ничего не создается и не
+удаляется, а все частицы обновляются одним проходом. Если пул заполнен, лишние
+частицы просто не появляются - на слабых ноутбуках эффекты не отнимают время
+кадра сверх заданного бюджета.
+
+Эффекты обновляются и рисуются вместе с полем, по времени кадра.
+"""
+
+import math
+import random
+from array import array
+from typing import Dict, List, Tuple
+
+import pygame
+
+from entities import GREEN, ORANGE, RED, WHITE, YELLOW
+
+Color = Tuple[int, int, int]
+Cell = Tuple[int, int]
+
+PARTICLE_CAPACITY = 256  # Больше частиц одновременно не бывает
+TWEEN_CAPACITY = 16
+PARTICLE_SIZE = 5  # Размер новой частицы в пикселях; к концу жизни уменьшается до 1
+PARTICLE_DRAG = 3.0  # Торможение частиц (доля скорости в секунду)
+PARTICLE_GRAVITY = 120.0  # Пикселей в секунду за секунду
+TWEEN_SECONDS = 0.25
+TWEEN_GROWTH = 1.0  # Рамка вырастает до (1 + TWEEN_GROWTH) клеток
+MAX_STEP = 0.1  # Длиннее шага не считаем (например, после перетаскивания окна)
+TAU = 2 * math.pi
+
+
+def _floats(capacity: int) -> array:
+    return array("f", bytes(4 * capacity))
+
+
+class ParticlePool:
+    """Частицы: координаты, скорости и время жизни в параллельных массивах"""
+
+    def __init__(self, capacity: int = PARTICLE_CAPACITY):
+        self.capacity = capacity
+        self.count = 0  # Живые частицы - индексы [0, count)
+        self.x = _floats(capacity)
+        self.y = _floats(capacity)
+        self.vx = _floats(capacity)
+        self.vy = _floats(capacity)
+        self.life = _floats(capacity)  # Осталось жить, секунд
+        self.ttl = _floats(capacity)  # Полное время жизни
+        self.color = array("B", bytes(capacity))  # Индекс цвета в палитре Effects
+        self._rect = pygame.Rect(0, 0, 0, 0)  # Один прямоугольник на все частицы
+
+    def emit(self, x: float, y: float, color: int, count: int, speed: float, ttl: float):
+        """Разлет count частиц из точки (x, y); сверх емкости пула частицы не создаются"""
+        start = self.count
+        end = min(self.capacity, start + count)
+        for i in range(start, end):
+            angle = random.uniform(0.0, TAU)
+            velocity = speed * random.uniform(0.3, 1.0)
+            life = ttl * random.uniform(0.6, 1.0)
+            self.x[i] = x
+            self.y[i] = y
+            self.vx[i] = math.cos(angle) * velocity
+            self.vy[i] = math.sin(angle) * velocity
+            self.life[i] = life
+            self.ttl[i] = life
+            self.color[i] = color
+        self.count = end
+
+    def update(self, dt: float):
+        """Один проход по всем живым частицам"""
+        x, y, vx, vy, life, ttl, color = self.x, self.y, self.vx, self.vy, self.life, self.ttl, self.color
+        drag = max(0.0, 1.0 - PARTICLE_DRAG * dt)
+        gravity = PARTICLE_GRAVITY * dt
+        count = self.count
+        i = 0
+        while i < count:
+            remaining = life[i] - dt
+            if remaining <= 0.0:
+                # На место умершей частицы - последняя живая
+                count -= 1
+                x[i], y[i], vx[i], vy[i] = x[count], y[count], vx[count], vy[count]
+                life[i], ttl[i], color[i] = life[count], ttl[count], color[count]
+                continue
+            life[i] = remaining
+            vx[i] *= drag
+            vy[i] = vy[i] * drag + gravity
+            x[i] += vx[i] * dt
+            y[i] += vy[i] * dt
+            i += 1
+        self.count = count
+
+    def draw(self, canvas, palette: List[Color]):
+        rect = self._rect
+        x, y, life, ttl, color = self.x, self.y, self.life, self.ttl, self.color
+        for i in range(self.count):
+            size = 1 + int(PARTICLE_SIZE * life[i] / ttl[i])
+            rect.width = rect.height = size
+            rect.x = int(x[i]) - size // 2
+            rect.y = int(y[i]) - size // 2
+            canvas.draw_rect(rect, palette[color[i]])
+
+
+class TweenPool:
+    """Вспышки: рамка вокруг клетки вырастает и исчезает (растущий сегмент змейки)"""
+
+    def __init__(self, capacity: int = TWEEN_CAPACITY):
+        self.capacity = capacity
+        self.count = 0
+        self.x = _floats(capacity)  # Центр клетки в пикселях
+        self.y = _floats(capacity)
+        self.age = _floats(capacity)
+        self.color = array("B", bytes(capacity))
+        self._rect = pygame.Rect(0, 0, 0, 0)
+
+    def start(self, x: float, y: float, color: int):
+        if self.count < self.capacity:
+            i = self.count
+            self.x[i] = x
+            self.y[i] = y
+            self.age[i] = 0.0
+            self.color[i] = color
+            self.count += 1
+
+    def update(self, dt: float):
+        x, y, age, color = self.x, self.y, self.age, self.color
+        count = self.count
+        i = 0
+        while i < count:
+            elapsed = age[i] + dt
+            if elapsed >= TWEEN_SECONDS:
+                count -= 1
+                x[i], y[i], age[i], color[i] = x[count], y[count], age[count], color[count]
+                continue
+            age[i] = elapsed
+            i += 1
+        self.count = count
+
+    def draw(self, canvas, palette: List[Color], cell_size: int):
+        rect = self._rect
+        x, y, age, color = self.x, self.y, self.age, self.color
+        for i in range(self.count):
+            # Плавное замедление к концу: 1 - (1 - t)^2
+            t = age[i] / TWEEN_SECONDS
+            size = int(cell_size * (1.0 + TWEEN_GROWTH * (1.0 - (1.0 - t) ** 2)))
+            rect.width = rect.height = size
+            rect.x = int(x[i]) - size // 2
+            rect.y = int(y[i]) - size // 2
+            canvas.draw_rect(rect, palette[color[i]], 2)
+
+
+class Effects:
+    """Все эффекты поля и готовые наборы для событий игры"""
+
+    def __init__(self, cell_size: int, particle_capacity: int = PARTICLE_CAPACITY,
+                 tween_capacity: int = TWEEN_CAPACITY):
+        self.cell_size = cell_size
+        self.particles = ParticlePool(particle_capacity)
+        self.tweens = TweenPool(tween_capacity)
+        self.palette: List[Color] = []  # Индекс в массивах -> цвет
+        self._color_index: Dict[Color, int] = {}
+        self.shake_amplitude = 0.0
+        self.shake_duration = 0.0
+        self.shake_left = 0.0
+        self.offset: Tuple[int, int] = (0, 0)  # Сдвиг поля в этом кадре
+
+    @property
+    def active(self) -> bool:
+        return bool(self.particles.count or self.tweens.count or self.shake_left > 0)
+
+    def clear(self):
+        self.particles.count = 0
+        self.tweens.count = 0
+        self.shake_left = 0.0
+        self.offset = (0, 0)
+
+    def _color(self, color: Color) -> int:
+        index = self._color_index.get(color)
+        if index is None:
+            if len(self.palette) >= 256:
+                return 0  # Индекс хранится в байте
+            index = len(self.palette)
+            self.palette.append(color)
+            self._color_index[color] = index
+        return index
+
+    def _center(self, cell: Cell) -> Tuple[float, float]:
+        return (cell[0] + 0.5) * self.cell_size, (cell[1] + 0.5) * self.cell_size
+
+    def burst(self, cell: Cell, color: Color, count: int, speed: float, ttl: float = 0.6):
+        """Разлет частиц из клетки"""
+        x, y = self._center(cell)
+        self.particles.emit(x, y, self._color(color), count, speed, ttl)
+
+    def pulse(self, cell: Cell, color: Color):
+        """Вспышка-рамка вокруг клетки"""
+        x, y = self._center(cell)
+        self.tweens.start(x, y, self._color(color))
+
+    def shake(self, amplitude: float, duration: float):
+        """Тряска поля; более сильная тряска перекрывает текущую"""
+        if amplitude >= self.shake_amplitude * self.shake_left / max(self.shake_duration, 1e-6):
+            self.shake_amplitude = amplitude
+            self.shake_duration = duration
+            self.shake_left = duration
+
+    def apple_eaten(self, cell: Cell):
+        self.pulse(cell, WHITE)
+        self.burst(cell, YELLOW, 12, 90.0, 0.4)
+
+    def correct(self, cell: Cell):
+        self.pulse(cell, GREEN)
+        self.burst(cell, GREEN, 40, 160.0)
+
+    def wrong(self, cell: Cell):
+        self.burst(cell, RED, 40, 140.0)
+        self.shake(6.0, 0.3)
+
+    def game_over(self, cell: Cell):
+        self.burst(cell, ORANGE, 60, 200.0, 0.9)
+        self.shake(10.0, 0.5)
+
+    def update(self, dt: float):
+        """Продвигает все эффекты на dt секунд (0 - пауза)"""
+        dt = min(dt, MAX_STEP)
+        if dt <= 0.0:
+            return
+        if self.particles.count:
+            self.particles.update(dt)
+        if self.tweens.count:
+            self.tweens.update(dt)
+        if self.shake_left > 0:
+            self.shake_left = max(0.0, self.shake_left - dt)
+            amplitude = self.shake_amplitude * self.shake_left / self.shake_duration
+            self.offset = (int(random.uniform(-amplitude, amplitude)), int(random.uniform(-amplitude, amplitude)))
+
+    def draw(self, canvas):
+        if self.tweens.count:
+            self.tweens.draw(canvas, self.palette, self.cell_size)
+        if self.particles.count:
+            self.particles.draw(canvas, self.palette)
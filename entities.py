@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Игровые объекты: змейка, яблоки, направления и общие константы.
+
+Вынесены из snake_game.py, чтобы их могли использовать и модули режимов
+(пакет modes/), и сама игра без циклического импорта.
+"""
+
+import random
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+import pygame
+
+from levels import LevelMap
+from render_backends import Canvas
+
+GRID_SIZE = 20
+TURN_QUEUE_SIZE = 3  # Сколько поворотов можно нажать заранее, до следующего шага змейки
+TURN_MAX_AGE = 0.5  # Повороты старше этого (в секундах) считаются устаревшими и отбрасываются
+
+# Цвета
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+GREEN = (0, 255, 0)
+RED = (255, 0, 0)
+BLUE = (0, 0, 255)
+YELLOW = (255, 255, 0)
+PURPLE = (128, 0, 128)
+ORANGE = (255, 165, 0)
+GRAY = (50, 50, 50)
+LIGHT_GRAY = (200, 200, 200)
+DARK_GREEN = (0, 150, 0)
+WALL_COLOR = (120, 120, 120)
+
+class Language(Enum):
+    RUSSIAN = "ru"
+    ENGLISH = "en"
+    KOREAN = "ko"
+
+class Direction(Enum):
+    UP = (0, -1)
+    DOWN = (0, 1)
+    LEFT = (-1, 0)
+    RIGHT = (1, 0)
+
+class Snake:
+    def __init__(self, x: int, y: int, grid_width: int, grid_height: int, level: Optional[LevelMap] = None):
+        self.body = [(x, y)]
+        self.direction = Direction.RIGHT
+        self.grow_pending = False
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        self.level = level  # Карта уровня; None - пустое поле без краев. Змейка отмечает на ней занятые клетки
+        if level is not None:
+            level.occupy(x, y)
+        self.crashed = False  # Врезалась в стену или край поля
+        # Очередь нажатых поворотов (направление, время нажатия): за один шаг применяется один поворот
+        self.turns: Deque[Tuple[Direction, float]] = deque()
+        # Пачка для Canvas.draw_cells: пары (спрайт, прямоугольник), по одной на сегмент.
+        # Обновляется при движении: меняются только голова и хвост
+        self._cells: List[Tuple[Any, pygame.Rect]] = []
+        self._head_sprite = None
+        self._body_sprite = None
+
+    def move(self):
+        """Двигает змейку"""
+        self._apply_next_turn()
+        head_x, head_y = self.body[0]
+        dx, dy = self.direction.value
+        new_head = (head_x + dx, head_y + dy)
+
+        # Проверка выхода за границы (телепортация) — используем размеры текущего поля
+        level = self.level
+        if level is None or level.wrap:
+            new_head = (new_head[0] % self.grid_width, new_head[1] % self.grid_height)
+        # Стены и края поля без телепортации - по карте проходимости, O(1)
+        if level is not None and not level.is_free(*new_head):
+            self.crashed = True
+            return
+
+        self.body.insert(0, new_head)
+        if level is not None:
+            level.occupy(*new_head)
+
+        if not self.grow_pending:
+            tail = self.body.pop()
+            if level is not None:
+                level.release(*tail)
+            # Прямоугольник хвоста переиспользуется для новой головы
+            rect = self._cells.pop()[1] if self._cells else None
+        else:
+            self.grow_pending = False
+            rect = None
+
+        # Пачка еще не собрана - ее соберет draw; змейка из одного сегмента отдает хвост под голову
+        if self._head_sprite is not None:
+            if self._cells:
+                self._cells[0] = (self._body_sprite, self._cells[0][1])
+            if rect is None:
+                rect = pygame.Rect(0, 0, GRID_SIZE, GRID_SIZE)
+            rect.x = new_head[0] * GRID_SIZE
+            rect.y = new_head[1] * GRID_SIZE
+            self._cells.insert(0, (self._head_sprite, rect))
+
+    def grow(self):
+        """Увеличивает змейку"""
+        self.grow_pending = True
+
+    @staticmethod
+    def _is_reverse(direction: Direction, other: Direction) -> bool:
+        return direction.value[0] == -other.value[0] and direction.value[1] == -other.value[1]
+
+    def queue_turn(self, new_direction: Direction, timestamp: float):
+        """Ставит поворот в очередь; проверка идет относительно последнего поворота в очереди"""
+        last = self.turns[-1][0] if self.turns else self.direction
+        # Повтор того же направления и разворот на 180 градусов не нужны; полная очередь не растет
+        if new_direction == last or self._is_reverse(new_direction, last) or len(self.turns) >= TURN_QUEUE_SIZE:
+            return
+        self.turns.append((new_direction, timestamp))
+
+    def clear_turns(self):
+        self.turns.clear()
+
+    def _apply_next_turn(self):
+        """Применяет один поворот из очереди, пропуская устаревшие"""
+        now = time.perf_counter()
+        while self.turns:
+            direction, pressed_at = self.turns.popleft()
+            if now - pressed_at <= TURN_MAX_AGE and not self._is_reverse(direction, self.direction):
+                self.direction = direction
+                return
+
+    def check_collision(self) -> bool:
+        """Проверяет столкновение с собой, стеной или краем поля"""
+        head = self.body[0]
+        return self.crashed or head in self.body[1:]
+
+    def _rebuild_cells(self, canvas: Canvas):
+        """Полностью пересобирает пачку клеток (первая отрисовка или смена холста)"""
+        self._head_sprite = canvas.cell_sprite(DARK_GREEN)
+        self._body_sprite = canvas.cell_sprite(GREEN)
+        self._cells = [
+            (self._head_sprite if i == 0 else self._body_sprite,
+             pygame.Rect(x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE))
+            for i, (x, y) in enumerate(self.body)
+        ]
+
+    def draw(self, canvas: Canvas):
+        """Отрисовывает змейку одной пачкой заранее отрисованных клеток"""
+        if self._head_sprite is not canvas.cell_sprite(DARK_GREEN) or len(self._cells) != len(self.body):
+            self._rebuild_cells(canvas)
+        canvas.draw_cells(self._cells)
+
+class Apple:
+    # Яблок на поле много и они пересоздаются при каждом раскладе - без __dict__
+    __slots__ = ("grid_width", "grid_height", "level", "position", "color")
+
+    def __init__(self, grid_width: int, grid_height: int, level: Optional[LevelMap] = None,
+                 position: Optional[Tuple[int, int]] = None):
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        self.level = level
+        # Позицию можно передать сразу, чтобы не генерировать ее впустую
+        self.position = position if position is not None else self.generate_position()
+        self.color = RED
+
+    def generate_position(self, occupied: Sequence[Tuple[int, int]] = ()) -> Optional[Tuple[int, int]]:
+        """Генерирует случайную позицию для яблока вне occupied; None, если свободных клеток нет"""
+        if self.level is not None:
+            return self.level.random_free_cell(occupied)  # Среди проходимых клеток, не занятых змейкой
+        while True:
+            position = (random.randint(0, self.grid_width - 1), random.randint(0, self.grid_height - 1))
+            if position not in occupied:
+                return position
+
+    def respawn(self, occupied: Sequence[Tuple[int, int]] = ()) -> bool:
+        """Перемещает яблоко в новую позицию; False, если свободных клеток не осталось"""
+        position = self.generate_position(occupied)
+        if position is None:
+            return False
+        self.position = position
+        return True
+
+    def draw(self, canvas: Canvas):
+        """Отрисовывает яблоко"""
+        x, y = self.position
+        canvas.draw_cell(x, y, self.color)
+
+class QuizQuestion:
+    """Данные вопроса, общие для всех яблок-ответов (легковес)"""
+    __slots__ = ("question", "correct_answer", "wrong_answers")
+
+    def __init__(self, question: str, correct_answer: str, wrong_answers: List[str]):
+        self.question = question
+        self.correct_answer = correct_answer
+        self.wrong_answers = tuple(wrong_answers)
+
+class QuizApple(Apple):
+    __slots__ = ("data", "answer_number")
+
+    def __init__(self, grid_width: int, grid_height: int, data: QuizQuestion, answer_number: int,
+                 position: Optional[Tuple[int, int]] = None):
+        super().__init__(grid_width, grid_height, position=position)
+        self.data = data  # Вопрос хранится один раз на все яблоки
+        self.answer_number = answer_number  # Номер ответа (1, 2, 3, 4)
+
+    @property
+    def question(self) -> str:
+        return self.data.question
+
+    @property
+    def correct_answer(self) -> str:
+        return self.data.correct_answer
+
+    @property
+    def wrong_answers(self) -> List[str]:
+        return list(self.data.wrong_answers)
+
+    def get_answers(self) -> List[str]:
+        """Возвращает перемешанные ответы"""
+        answers = [self.data.correct_answer, *self.data.wrong_answers]
+        random.shuffle(answers)
+        return answers
+
+    def draw(self, canvas: Canvas):
+        """Отрисовывает яблоко с номером ответа"""
+        x, y = self.position
+        canvas.draw_cell_text(x, y, self.color, str(self.answer_number), 24, WHITE)
+
+class WordApple(Apple):
+    __slots__ = ("letter", "is_correct")
+
+    def __init__(self, grid_width: int, grid_height: int, letter: str, is_correct: bool = False,
+                 position: Optional[Tuple[int, int]] = None):
+        super().__init__(grid_width, grid_height, position=position)
+        self.letter = letter
+        self.is_correct = is_correct
+        # Все яблоки одного цвета (RED), чтобы не выдавать правильную букву
+
+    def draw(self, canvas: Canvas):
+        """Отрисовывает яблоко с буквой"""
+        x, y = self.position
+        canvas.draw_cell_text(x, y, self.color, self.letter, 24, WHITE)
+
+class ApplePool:
+    """Пул яблок: при новом раскладе старые объекты используются повторно, а не создаются заново"""
+
+    def __init__(self):
+        self._free: Dict[type, List[Apple]] = {}
+
+    def acquire(self, cls: type, *args: Any) -> Apple:
+        free = self._free.get(cls)
+        if free:
+            apple = free.pop()
+            apple.__init__(*args)  # Переинициализация того же объекта
+            return apple
+        return cls(*args)
+
+    def release(self, apples: List[Apple]):
+        """Возвращает яблоки в пул (список очищается)"""
+        for apple in apples:
+            self._free.setdefault(type(apple), []).append(apple)
+        apples.clear()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Индекс установленных шрифтов с покрытием хангыля, кириллицы и латиницы.
+
+Шрифты из pygame.font.get_fonts() проверяются параллельно в пуле процессов
+отдельного процесса font_probe.py: для каждого считается доля символов-образцов,
+для которых в шрифте есть глиф (pygame.freetype возвращает None для отсутствующих).
+Результат сохраняется в JSON и привязан к времени изменения и размеру файла
+шрифта, поэтому при следующих запусках заново проверяются только новые и
+измененные шрифты.
+
+Игра, run_game.py и check_korean_fonts.py берут выбор шрифта из этого индекса:
+шрифт должен покрывать хангыль и письменность языка интерфейса (required_scripts).
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pygame
+
+from font_probe import SCRIPT_SAMPLES, measure_font
+
+INDEX_VERSION = 1
+DEFAULT_INDEX_PATH = os.path.join(os.path.expanduser("~"), ".clever_snake", "cache", "font_index.json")
+MAX_WORKERS = 8
+PARALLEL_THRESHOLD = 8  # Меньше шрифтов проверяем без пула процессов
+PROBE_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "font_probe.py")
+PROBE_TIMEOUT = 300.0  # Секунд на проверку всех шрифтов в отдельном процессе
+
+SCRIPTS = tuple(SCRIPT_SAMPLES)
+# Письменность строк интерфейса по языку контента; хангыль нужен всегда (корейские слова в игре)
+LANGUAGE_SCRIPTS = {"ru": "cyrillic", "en": "latin", "ko": "hangul"}
+
+# Предпочтительные шрифты при одинаковом покрытии (в порядке приоритета)
+KOREAN_FONTS = [
+    # Windows шрифты
+    "Malgun Gothic",  # Windows 10/11
+    "맑은 고딕",  # Korean name
+    "Gulim",  # Windows Korean font
+    "굴림",  # Korean name
+    "Dotum",  # Windows Korean font
+    "돋움",  # Korean name
+    "Batang",  # Windows Korean font
+    "바탕",  # Korean name
+    "Arial Unicode MS",  # Cross-platform
+    # Linux шрифты
+    "Noto Sans CJK KR",  # Google Noto font (Linux)
+    "Nanum Gothic",  # Linux Korean font
+    "NanumBarunGothic",  # Linux Korean font
+    "Nanum Myeongjo",  # Linux Korean font
+    "DejaVu Sans",  # Linux fallback
+    "Liberation Sans",  # Linux fallback
+    # macOS шрифты
+    "AppleGothic",  # macOS
+    "Apple SD Gothic Neo",  # macOS
+    # Общие fallback
+    "Helvetica",  # Fallback
+    "Arial"  # Fallback
+]
+
+
+def required_scripts(lang: str) -> Tuple[str, ...]:
+    """Письменности, которые должен покрывать шрифт игры при языке интерфейса lang"""
+    script = LANGUAGE_SCRIPTS.get(lang, "latin")
+    return ("hangul",) if script == "hangul" else ("hangul", script)
+
+
+def system_fonts() -> Dict[str, List[str]]:
+    """Файлы установленных шрифтов и их имена в pygame.font.SysFont"""
+    pygame.font.init()
+    fonts: Dict[str, List[str]] = {}
+    for name in pygame.font.get_fonts():
+        try:
+            path = pygame.font.match_font(name)
+        except Exception:
+            continue
+        if path:
+            fonts.setdefault(path, []).append(name)
+    return fonts
+
+
+class FontIndex:
+    """Сохраняемый индекс покрытия шрифтов"""
+
+    def __init__(self, path: str = DEFAULT_INDEX_PATH):
+        self.path = path
+        self.fonts: Dict[str, Dict] = {}  # Путь к файлу -> {"mtime", "size", "names", "coverage"}
+
+    def load(self) -> bool:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == INDEX_VERSION:
+                self.fonts = data.get("fonts", {})
+                return True
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"⚠ Индекс шрифтов поврежден, перестраиваем: {e}")
+        return False
+
+    def save(self):
+        tmp_path = None
+        try:
+            index_dir = os.path.dirname(self.path)
+            os.makedirs(index_dir, exist_ok=True)
+            # Свой временный файл у каждой записи: индекс могут одновременно сохранять несколько игр
+            with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=index_dir, prefix="font_index.",
+                                             suffix=".tmp", delete=False) as f:
+                tmp_path = f.name
+                json.dump({"version": INDEX_VERSION, "fonts": self.fonts}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            print(f"⚠ Не удалось сохранить индекс шрифтов: {e}")
+
+    def update(self, fonts: Optional[Dict[str, List[str]]] = None, max_workers: Optional[int] = None) -> int:
+        """Проверяет новые и измененные шрифты; возвращает, сколько шрифтов проверено"""
+        if fonts is None:
+            fonts = system_fonts()
+        stale: List[str] = []
+        stats: Dict[str, Tuple[int, int]] = {}
+        for path in fonts:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            stats[path] = (stat.st_mtime_ns, stat.st_size)
+            entry = self.fonts.get(path)
+            if entry is None or (entry.get("mtime"), entry.get("size")) != stats[path]:
+                stale.append(path)
+
+        changed = len(stale) > 0 or any(path not in stats for path in self.fonts)
+        results = self._measure(stale, max_workers)
+        self.fonts = {path: entry for path, entry in self.fonts.items() if path in stats}
+        for path, coverage in zip(stale, results):
+            mtime, size = stats[path]
+            self.fonts[path] = {"mtime": mtime, "size": size, "names": fonts[path], "coverage": coverage}
+        for path, names in fonts.items():
+            if path in self.fonts and self.fonts[path]["names"] != names:
+                self.fonts[path]["names"] = names
+                changed = True
+        if changed or not os.path.exists(self.path):
+            self.save()
+        return len(stale)
+
+    @staticmethod
+    def _measure(paths: List[str], max_workers: Optional[int]) -> List[Optional[Dict[str, float]]]:
+        if len(paths) < PARALLEL_THRESHOLD:
+            return [measure_font(path) for path in paths]
+        workers = max_workers or min(MAX_WORKERS, os.cpu_count() or 1)
+        try:
+            # Пул создается в отдельном процессе с главным модулем font_probe.py: рабочие процессы spawn
+            # (не fork - индекс строится из фонового потока игры) не импортируют snake_game.py заново
+            result = subprocess.run([sys.executable, PROBE_SCRIPT, str(workers)], input=json.dumps(paths),
+                                    capture_output=True, text=True, check=True, timeout=PROBE_TIMEOUT)
+            results = json.loads(result.stdout)
+            if not isinstance(results, list) or len(results) != len(paths):
+                raise ValueError("ответ не совпадает со списком шрифтов")
+            return results
+        except (OSError, ValueError, subprocess.SubprocessError) as e:
+            print(f"⚠ Параллельная проверка шрифтов недоступна ({e}), проверяем по очереди")
+            return [measure_font(path) for path in paths]
+
+    def coverage(self, path: str) -> Dict[str, float]:
+        entry = self.fonts.get(path)
+        return (entry or {}).get("coverage") or {}
+
+    def covering(self, script: str, threshold: float = 1.0) -> List[str]:
+        """Шрифты, покрывающие письменность не меньше чем на threshold"""
+        return sorted(path for path in self.fonts if self.coverage(path).get(script, 0.0) >= threshold)
+
+    def best_font(self, required: Sequence[str] = ("hangul",), prefer: Sequence[str] = KOREAN_FONTS) -> Optional[str]:
+        """Лучший шрифт: полное покрытие required, затем покрытие остальных письменностей,
+        затем порядок имен из prefer"""
+        preferred = {name.lower().replace(" ", ""): i for i, name in enumerate(prefer)}
+
+        def rank(path: str) -> Tuple[float, int, str]:
+            coverage = self.coverage(path)
+            names = self.fonts[path].get("names", [])
+            order = min((preferred.get(name, len(preferred)) for name in names), default=len(preferred))
+            return (-sum(coverage.get(script, 0.0) for script in SCRIPTS), order, path)
+
+        candidates = [path for path in self.fonts
+                      if all(self.coverage(path).get(script, 0.0) >= 1.0 for script in required)]
+        return min(candidates, key=rank) if candidates else None
+
+
+def load_index(path: str = DEFAULT_INDEX_PATH) -> FontIndex:
+    """Загружает индекс и досканирует изменившиеся шрифты"""
+    index = FontIndex(path)
+    index.load()
+    index.update()
+    return index
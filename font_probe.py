@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Проверка покрытия письменностей шрифтами для индекса шрифтов (font_index.py).
+
+Модуль не импортирует игру. Пул процессов spawn заново импортирует главный модуль
+в каждом рабочем процессе, поэтому индекс шрифтов не создает пул из процесса игры
+(иначе каждый рабочий процесс выполнял бы настройку pygame из snake_game.py),
+а запускает этот файл главным модулем:
+    python font_probe.py [процессов] < пути.json > покрытие.json
+На входе - JSON-список путей к шрифтам, на выходе - список покрытий в том же порядке.
+"""
+
+import json
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+# Символы-образцы: слоги и отдельные чамо (в режиме сбора слов буквы показываются по одной)
+SCRIPT_SAMPLES = {
+    "hangul": "한글가나다라마바사아자차카타파하뱀단어게임점수ㄱㄴㄷㄹㅁㅂㅅㅇㅈㅊㅋㅌㅍㅎㄲㅆㅏㅑㅓㅕㅗㅛㅜㅠㅡㅣㅐㅔ",
+    "cyrillic": "АБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯабвгдеёжзийклмнопрстуфхцчшщъыьэюя",
+    "latin": "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789",
+}
+
+
+def measure_font(path: str) -> Optional[Dict[str, float]]:
+    """Доля символов каждой письменности, которые есть в шрифте"""
+    import pygame.freetype
+    try:
+        pygame.freetype.init()
+        font = pygame.freetype.Font(path, 16)
+        coverage = {}
+        for script, sample in SCRIPT_SAMPLES.items():
+            present = sum(1 for char in sample if font.get_metrics(char)[0] is not None)
+            coverage[script] = round(present / len(sample), 3)
+        return coverage
+    except Exception:
+        return None  # Не шрифт или поврежденный файл
+
+
+def measure_fonts(paths: List[str], workers: int) -> List[Optional[Dict[str, float]]]:
+    """Покрытие шрифтов в пуле процессов; вызывается только из главного модуля этого файла"""
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        return list(executor.map(measure_font, paths, chunksize=max(1, len(paths) // (workers * 4))))
+
+
+if __name__ == "__main__":
+    # Приветствие pygame в рабочих процессах испортило бы JSON в stdout
+    os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    font_paths = json.load(sys.stdin)
+    json.dump(measure_fonts(font_paths, int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1),
+              sys.stdout)
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Разбор и сборка слогов хангыля для режима сбора слов.
+
+Слоги U+AC00..U+D7A3 вычисляются по формуле Unicode:
+    код = 0xAC00 + (начальная * 21 + гласная) * 28 + конечная
+Все таблицы строятся один раз при импорте, поэтому разбор и сборка
+сводятся к обращению к списку по индексу.
+"""
+
+from typing import List, Optional, Tuple
+
+SYLLABLE_BASE = 0xAC00
+SYLLABLE_COUNT = 11172
+VOWEL_COUNT = 21
+FINAL_COUNT = 28  # Включая "нет конечной согласной"
+
+# Совместимые чамо (как в KOREAN_ALPHABET) в порядке стандарта Unicode
+INITIALS = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+VOWELS = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+FINALS = ("", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ",
+          "ㄿ", "ㅀ", "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ")
+
+# Составные конечные согласные: перед гласной вторая часть уходит в начало следующего слога (닭+ㅏ -> 달가)
+FINAL_SPLITS = {"ㄳ": ("ㄱ", "ㅅ"), "ㄵ": ("ㄴ", "ㅈ"), "ㄶ": ("ㄴ", "ㅎ"), "ㄺ": ("ㄹ", "ㄱ"),
+                "ㄻ": ("ㄹ", "ㅁ"), "ㄼ": ("ㄹ", "ㅂ"), "ㄽ": ("ㄹ", "ㅅ"), "ㄾ": ("ㄹ", "ㅌ"),
+                "ㄿ": ("ㄹ", "ㅍ"), "ㅀ": ("ㄹ", "ㅎ"), "ㅄ": ("ㅂ", "ㅅ")}
+
+# Обратные таблицы: символ чамо -> индекс (или -1)
+INITIAL_INDEX = {jamo: i for i, jamo in enumerate(INITIALS)}
+VOWEL_INDEX = {jamo: i for i, jamo in enumerate(VOWELS)}
+FINAL_INDEX = {jamo: i for i, jamo in enumerate(FINALS) if jamo}
+
+# Роль чамо в слоге (см. decompose_word_kinds)
+INITIAL = "initial"
+VOWEL = "vowel"
+FINAL = "final"
+
+# Предвычисленный разбор каждого слога: (начальная, гласная, конечная)
+_DECOMPOSED: List[Tuple[str, str, str]] = [
+    (INITIALS[i // (VOWEL_COUNT * FINAL_COUNT)],
+     VOWELS[(i // FINAL_COUNT) % VOWEL_COUNT],
+     FINALS[i % FINAL_COUNT])
+    for i in range(SYLLABLE_COUNT)
+]
+
+
+def is_syllable(char: str) -> bool:
+    """Проверяет, является ли символ готовым слогом хангыля"""
+    return len(char) == 1 and 0 <= ord(char) - SYLLABLE_BASE < SYLLABLE_COUNT
+
+
+def is_vowel(jamo: str) -> bool:
+    """Проверяет, является ли чамо гласной"""
+    return jamo in VOWEL_INDEX
+
+
+def is_consonant(jamo: str) -> bool:
+    """Проверяет, является ли чамо согласной (начальной или конечной)"""
+    return jamo in INITIAL_INDEX or jamo in FINAL_INDEX
+
+
+def compose(initial: str, vowel: str, final: str = "") -> str:
+    """Собирает слог из начальной согласной, гласной и необязательной конечной"""
+    code = SYLLABLE_BASE + (INITIAL_INDEX[initial] * VOWEL_COUNT + VOWEL_INDEX[vowel]) * FINAL_COUNT
+    if final:
+        code += FINAL_INDEX[final]
+    return chr(code)
+
+
+def decompose(char: str) -> Tuple[str, ...]:
+    """Разбирает слог на чамо; остальные символы возвращаются как есть"""
+    index = ord(char) - SYLLABLE_BASE
+    if 0 <= index < SYLLABLE_COUNT:
+        initial, vowel, final = _DECOMPOSED[index]
+        return (initial, vowel, final) if final else (initial, vowel)
+    return (char,)
+
+
+def decompose_word(word: str) -> List[str]:
+    """Разбирает слово в последовательность чамо для сбора по одному"""
+    jamo: List[str] = []
+    for char in word:
+        jamo.extend(decompose(char))
+    return jamo
+
+
+def decompose_word_kinds(word: str) -> List[str]:
+    """Роли чамо из decompose_word(): INITIAL, VOWEL, FINAL или "" для прочих символов"""
+    kinds: List[str] = []
+    for char in word:
+        parts = decompose(char)
+        if len(parts) == 1:
+            kinds.append("")
+        else:
+            kinds.extend((INITIAL, VOWEL, FINAL)[:len(parts)])
+    return kinds
+
+
+class HangulAssembler:
+    """Собирает слоги из поступающих по одному чамо (как корейская раскладка).
+
+    Каждое чамо атомарно: двойные согласные и составные гласные не склеиваются,
+    поэтому результат совпадает с исходным словом, разобранным decompose_word().
+    Гласная после составной конечной забирает ее вторую часть (닭+ㅏ -> 달가).
+    """
+
+    def __init__(self):
+        self.committed = ""
+        self.text = ""
+        self._jamo: List[str] = []  # Все чамо по порядку, для backspace()
+        self._initial: Optional[str] = None
+        self._vowel: Optional[str] = None
+        self._final: Optional[str] = None
+
+    def reset(self):
+        """Очищает собранный текст"""
+        self.__init__()
+
+    def push(self, jamo: str):
+        """Добавляет чамо и обновляет собранный текст"""
+        self._jamo.append(jamo)
+        if jamo in VOWEL_INDEX:
+            self._push_vowel(jamo)
+        elif jamo in INITIAL_INDEX or jamo in FINAL_INDEX:
+            self._push_consonant(jamo)
+        else:
+            self._commit()
+            self.committed += jamo
+        self.text = self.committed + self._pending()
+
+    def backspace(self):
+        """Удаляет последнее чамо; текст собирается заново (слова короткие, а стирание редкое)"""
+        jamo = self._jamo[:-1]
+        self.reset()
+        for item in jamo:
+            self.push(item)
+
+    def _push_consonant(self, jamo: str):
+        if self._initial is not None and self._vowel is not None and self._final is None \
+                and jamo in FINAL_INDEX:
+            # Пока считаем согласную конечной; следующая гласная может её забрать
+            self._final = jamo
+            return
+        self._commit()
+        if jamo in INITIAL_INDEX:
+            self._initial = jamo
+        else:
+            self.committed += jamo
+
+    def _push_vowel(self, jamo: str):
+        if self._initial is not None and self._vowel is None:
+            self._vowel = jamo
+            return
+        if self._final is not None and (self._final in INITIAL_INDEX or self._final in FINAL_SPLITS):
+            # Конечная согласная (или вторая часть составной) переходит в начало нового слога
+            if self._final in FINAL_SPLITS:
+                self._final, moved = FINAL_SPLITS[self._final]
+            else:
+                moved, self._final = self._final, None
+            self._commit()
+            self._initial = moved
+            self._vowel = jamo
+            return
+        self._commit()
+        self.committed += jamo
+
+    def _pending(self) -> str:
+        if self._initial is None:
+            return ""
+        if self._vowel is None:
+            return self._initial
+        return compose(self._initial, self._vowel, self._final or "")
+
+    def _commit(self):
+        self.committed += self._pending()
+        self._initial = self._vowel = self._final = None
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Тепловые карты и аналитика игр: где ходит змейка, где погибает и где ест яблоки.
+
+Накопление включается параметром игры --heatmaps и требует NumPy
+(pip install numpy); без него игра работает как обычно. Для каждого режима,
+карты и размера поля ведутся массивы счетчиков по клеткам:
+    head  - сколько тиков голова змейки провела в клетке;
+    death - где игра закончилась столкновением;
+    eat   - где съедены яблоки;
+и гистограмма времени до следующего яблока (секунды игры без пауз).
+
+Тик стоит одной записи номера клетки в заранее выделенный буфер (array);
+буфер сворачивается в счетчики одним np.bincount, когда заполнится или игра
+закончится. Массивы хранятся в ~/.clever_snake/heatmaps/ (по файлу .npz на
+режим, карту и поле) и при сохранении складываются с тем, что уже на диске,
+поэтому копятся между запусками. Папки с разных компьютеров объединяются так же:
+    python heatmaps.py merge класс_1/ класс_2/ --into итог/
+    python heatmaps.py summary итог/ --json summary.json
+    python heatmaps.py render итог/ --out images/
+"""
+
+import json
+import os
+from array import array
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+HEATMAP_DIR = os.path.join(os.path.expanduser("~"), ".clever_snake", "heatmaps")
+HEATMAP_FORMAT = 1  # Версия файлов .npz; файлы другой версии пропускаются
+HEAD_BUFFER = 4096  # Тиков в буфере до свертки в счетчики
+EAT_TIME_STEP = 0.5  # Ширина столбца гистограммы времени до яблока, секунд
+EAT_TIME_BINS = 121  # Последний столбец - все, что дольше минуты
+TOP_CELLS = 5  # Сколько самых частых клеток попадает в сводку
+RENDER_SCALE = 8  # Пикселей на клетку в картинке
+LAYERS = ("head", "death", "eat")
+# Цветовая шкала картинок: от темно-синего (редко) через красный и желтый к белому (чаще всего)
+HEAT_STOPS = (0.0, 0.35, 0.7, 1.0)
+HEAT_COLORS = ((20, 20, 60), (200, 30, 30), (250, 210, 40), (255, 255, 255))
+
+
+class GridCounts:
+    """Счетчики одного режима на одном поле: массивы по клеткам и гистограмма времени до яблока"""
+
+    def __init__(self, mode: str, level: str, width: int, height: int):
+        self.mode = mode
+        self.level = level
+        self.width = width
+        self.height = height
+        self.sessions = 0  # Сыграно раундов
+        shape = (height, width)  # Индекс [y, x]
+        self.head = np.zeros(shape, np.int64)
+        self.death = np.zeros(shape, np.int64)
+        self.eat = np.zeros(shape, np.int64)
+        self.eat_time = np.zeros(EAT_TIME_BINS, np.int64)
+
+    @property
+    def key(self) -> str:
+        """Имя файла счетчиков (без расширения)"""
+        return f"{self.mode}_{self.level}_{self.width}x{self.height}"
+
+    @property
+    def empty(self) -> bool:
+        return not self.sessions and not self.head.any()
+
+    def add(self, other: "GridCounts"):
+        """Прибавляет счетчики другого накопителя того же поля"""
+        self.sessions += other.sessions
+        self.head += other.head
+        self.death += other.death
+        self.eat += other.eat
+        self.eat_time += other.eat_time
+
+    def reset(self):
+        """Обнуляет счетчики на месте (записывающие раунды продолжают писать в те же массивы)"""
+        self.sessions = 0
+        for counts in (self.head, self.death, self.eat, self.eat_time):
+            counts.fill(0)
+
+    def save(self, path: str):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez_compressed(f, version=HEATMAP_FORMAT, mode=self.mode, level=self.level,
+                                sessions=self.sessions, head=self.head, death=self.death, eat=self.eat,
+                                eat_time=self.eat_time)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "GridCounts":
+        """Читает счетчики из файла .npz; ошибка формата - ValueError"""
+        with np.load(path, allow_pickle=False) as data:
+            if int(data["version"]) != HEATMAP_FORMAT:
+                raise ValueError(f"версия {int(data['version'])}, нужна {HEATMAP_FORMAT}")
+            height, width = data["head"].shape
+            grid = cls(str(data["mode"]), str(data["level"]), width, height)
+            grid.sessions = int(data["sessions"])
+            for name in LAYERS:
+                if data[name].shape != grid.head.shape:
+                    raise ValueError(f"размер {name} не совпадает с полем")
+                getattr(grid, name)[...] = data[name]
+            if data["eat_time"].shape != grid.eat_time.shape:
+                raise ValueError("другая гистограмма времени до яблока")
+            grid.eat_time[...] = data["eat_time"]
+        return grid
+
+
+class HeatRecorder:
+    """Запись одного раунда; вызывается из игрового цикла"""
+
+    def __init__(self, grid: GridCounts):
+        self.grid = grid
+        self.width = grid.width
+        self._buffer = array("i", bytes(4 * HEAD_BUFFER))  # Номера клеток головы (y * width + x)
+        self._count = 0
+
+    def tick(self, x: int, y: int):
+        """Голова змейки в клетке (x, y); только запись в буфер"""
+        self._buffer[self._count] = y * self.width + x
+        self._count += 1
+        if self._count == HEAD_BUFFER:
+            self.flush()
+
+    def eat(self, x: int, y: int, seconds: float):
+        """Съедено яблоко; seconds - время игры с прошлого яблока или начала раунда"""
+        self.grid.eat[y, x] += 1
+        self.grid.eat_time[min(int(seconds / EAT_TIME_STEP), EAT_TIME_BINS - 1)] += 1
+
+    def death(self, x: int, y: int):
+        self.grid.death[y, x] += 1
+
+    def flush(self):
+        """Сворачивает буфер тиков в счетчики головы одной векторной операцией"""
+        if not self._count:
+            return
+        grid = self.grid
+        cells = np.frombuffer(self._buffer, dtype=np.intc, count=self._count)
+        grid.head += np.bincount(cells, minlength=grid.head.size).reshape(grid.head.shape)
+        self._count = 0
+
+
+class HeatmapStore:
+    """Счетчики всех режимов и полей; общий для игр на разделенном экране"""
+
+    def __init__(self, directory: str = HEATMAP_DIR):
+        self.directory = directory
+        self.grids: Dict[str, GridCounts] = {}
+
+    def _grid(self, mode: str, level: str, width: int, height: int) -> GridCounts:
+        key = f"{mode}_{level}_{width}x{height}"
+        grid = self.grids.get(key)
+        if grid is None:
+            grid = GridCounts(mode, level, width, height)
+            self.grids[key] = grid
+        return grid
+
+    def recorder(self, mode: str, level: str, width: int, height: int) -> HeatRecorder:
+        """Начинает запись раунда"""
+        grid = self._grid(mode, level, width, height)
+        grid.sessions += 1
+        return HeatRecorder(grid)
+
+    def add(self, other: GridCounts):
+        self._grid(other.mode, other.level, other.width, other.height).add(other)
+
+    def add_dir(self, directory: str) -> int:
+        """Прибавляет все счетчики из папки (например, с другого компьютера); возвращает число файлов"""
+        added = 0
+        for path in _grid_files(directory):
+            try:
+                self.add(GridCounts.load(path))
+                added += 1
+            except (OSError, ValueError, KeyError) as e:
+                print(f"⚠ Пропущен {path}: {e}")
+        return added
+
+    def save(self):
+        """Складывает накопленное с файлами на диске и обнуляет счетчики в памяти"""
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            for grid in self.grids.values():
+                if grid.empty:
+                    continue
+                path = os.path.join(self.directory, grid.key + ".npz")
+                total = GridCounts(grid.mode, grid.level, grid.width, grid.height)
+                if os.path.exists(path):
+                    try:
+                        total.add(GridCounts.load(path))
+                    except (OSError, ValueError, KeyError) as e:
+                        print(f"⚠ Файл {path} поврежден, начинаем его заново: {e}")
+                total.add(grid)
+                total.save(path)
+                grid.reset()
+        except OSError as e:
+            print(f"⚠ Не удалось сохранить тепловые карты: {e}")
+
+
+def _grid_files(directory: str) -> List[str]:
+    try:
+        names = sorted(os.listdir(directory))
+    except FileNotFoundError:
+        return []
+    return [os.path.join(directory, name) for name in names if name.endswith(".npz")]
+
+
+def open_store(directory: str = HEATMAP_DIR) -> Optional[HeatmapStore]:
+    """Включает накопление тепловых карт; без NumPy игра работает без них"""
+    if np is None:
+        print("⚠ Для тепловых карт нужен NumPy (pip install numpy), аналитика отключена")
+        return None
+    return HeatmapStore(directory)
+
+
+def _top_cells(counts, limit: int = TOP_CELLS) -> List[List[int]]:
+    """Самые частые клетки [[x, y, счет], ...] по убыванию"""
+    flat = counts.ravel()
+    limit = min(limit, int(np.count_nonzero(flat)))
+    if not limit:
+        return []
+    top = np.argpartition(flat, -limit)[-limit:]
+    top = top[np.argsort(flat[top])[::-1]]
+    ys, xs = np.unravel_index(top, counts.shape)
+    return [[int(x), int(y), int(flat[i])] for x, y, i in zip(xs, ys, top)]
+
+
+def _histogram_quantile(histogram, q: float) -> Optional[float]:
+    """Квантиль по гистограмме времени (середина столбца), None - яблок не было"""
+    total = int(histogram.sum())
+    if not total:
+        return None
+    index = int(np.searchsorted(np.cumsum(histogram), q * total))
+    return (index + 0.5) * EAT_TIME_STEP
+
+
+def summarize(grid: GridCounts) -> Dict[str, Any]:
+    """Сводка по счетчикам: итоги, охват поля, самые частые клетки, время до яблока"""
+    return {
+        "mode": grid.mode,
+        "level": grid.level,
+        "board": [grid.width, grid.height],
+        "sessions": grid.sessions,
+        "ticks": int(grid.head.sum()),
+        "deaths": int(grid.death.sum()),
+        "apples": int(grid.eat.sum()),
+        "coverage": round(float(np.count_nonzero(grid.head)) / grid.head.size, 3),  # Доля посещенных клеток
+        "hot_cells": _top_cells(grid.head),
+        "death_cells": _top_cells(grid.death),
+        "eat_seconds": {"median": _histogram_quantile(grid.eat_time, 0.5),
+                        "p90": _histogram_quantile(grid.eat_time, 0.9)},
+    }
+
+
+def heat_colors(counts):
+    """Массив счетчиков -> картинка RGB (высота, ширина, 3); шкала логарифмическая"""
+    values = np.log1p(counts.astype(np.float64))
+    peak = values.max()
+    if peak > 0:
+        values /= peak
+    rgb = np.empty(counts.shape + (3,), np.uint8)
+    for channel in range(3):
+        rgb[..., channel] = np.interp(values, HEAT_STOPS, [color[channel] for color in HEAT_COLORS])
+    return rgb
+
+
+def render(grid: GridCounts, out_dir: str, scale: int = RENDER_SCALE) -> List[str]:
+    """Сохраняет картинки PNG всех слоев; возвращает пути"""
+    import pygame
+
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for name in LAYERS:
+        rgb = heat_colors(getattr(grid, name)).repeat(scale, axis=0).repeat(scale, axis=1)
+        surface = pygame.surfarray.make_surface(rgb.swapaxes(0, 1))  # surfarray индексирует [x, y]
+        path = os.path.join(out_dir, f"{grid.key}_{name}.png")
+        pygame.image.save(surface, path)
+        paths.append(path)
+    return paths
+
+
+def load_dirs(directories: Iterable[str]) -> HeatmapStore:
+    """Счетчики из нескольких папок, сложенные в памяти"""
+    store = HeatmapStore()
+    for directory in directories:
+        store.add_dir(directory)
+    return store
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Тепловые карты Clever Snake: объединение, сводка и картинки")
+    commands = parser.add_subparsers(dest="command", required=True)
+    merge_parser = commands.add_parser("merge", help="сложить папки счетчиков (с разных компьютеров) в одну")
+    merge_parser.add_argument("sources", nargs="+", help="папки с файлами .npz")
+    merge_parser.add_argument("--into", default=HEATMAP_DIR, help=f"папка результата (по умолчанию {HEATMAP_DIR})")
+    summary_parser = commands.add_parser("summary", help="сводка по режимам и полям")
+    summary_parser.add_argument("dirs", nargs="*", default=[HEATMAP_DIR], help="папки с файлами .npz")
+    summary_parser.add_argument("--json", metavar="FILE", help="записать сводку в компактный JSON")
+    render_parser = commands.add_parser("render", help="картинки PNG тепловых карт")
+    render_parser.add_argument("dirs", nargs="*", default=[HEATMAP_DIR], help="папки с файлами .npz")
+    render_parser.add_argument("--out", default="heatmaps", help="папка для картинок (по умолчанию heatmaps)")
+    render_parser.add_argument("--scale", type=int, default=RENDER_SCALE,
+                               help=f"пикселей на клетку (по умолчанию {RENDER_SCALE})")
+    args = parser.parse_args()
+
+    if np is None:
+        print("⚠ Нужен NumPy: pip install numpy")
+        sys.exit(1)
+
+    if args.command == "merge":
+        into = os.path.abspath(args.into)
+        sources = [source for source in args.sources if os.path.abspath(source) != into]
+        store = load_dirs(sources)
+        store.directory = args.into
+        store.save()  # Складывается с тем, что уже лежит в папке результата
+        print(f"✓ Объединено полей: {len(store.grids)} -> {args.into}")
+    elif args.command == "summary":
+        summaries = [summarize(grid) for grid in load_dirs(args.dirs).grids.values()]
+        for item in summaries:
+            median = item["eat_seconds"]["median"]
+            print(f"{item['mode']} / {item['level']} {item['board'][0]}x{item['board'][1]}: "
+                  f"раундов {item['sessions']}, тиков {item['ticks']}, яблок {item['apples']}, "
+                  f"гибелей {item['deaths']}, охват {item['coverage']:.0%}, "
+                  f"до яблока {'-' if median is None else f'{median:.1f} с'} (медиана)")
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as f:
+                json.dump(summaries, f, ensure_ascii=False, separators=(",", ":"))
+            print(f"✓ Сводка записана в {args.json}")
+    else:
+        count = 0
+        for grid in load_dirs(args.dirs).grids.values():
+            count += len(render(grid, args.out, args.scale))
+        print(f"✓ Картинок: {count} в {args.out}")
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Карты уровней: стены, препятствия и границы поля.
+
+Карты лежат в папке levels/ текстовыми файлами:
+    # name: Комнаты
+    # wrap: no
+    ########
+    #..S...#
+    ########
+'#' - стена, '.' или пробел - свободная клетка, 'S' - старт змейки.
+wrap: yes - змейка проходит сквозь края поля, no - край поля смертелен.
+
+Для каждой карты заранее считается карта проходимости (bytearray, клетка = байт),
+поэтому проверка клетки стоит O(1). Рядом с ней карта хранит занятость клеток
+змейкой (счетчики в bytearray) и список клеток, проходимых и не занятых: змейка
+отмечает голову и хвост на каждом шаге за O(1), а случайная свободная клетка
+берется прямо из списка. Перебор нужен, только если почти все свободные клетки
+лежат у края или заняты яблоками, и идет по этому списку, а не по всему полю.
+Разобранная карта сохраняется в двоичный кэш (zlib) и при следующем запуске
+загружается без разбора текста.
+"""
+
+import os
+import random
+import struct
+import tempfile
+import zlib
+from array import array
+from typing import Collection, Dict, List, Optional, Tuple
+
+CACHE_MAGIC = b"CSLV"
+CACHE_VERSION = 1
+# magic, версия, ширина, высота, флаги, старт x, старт y, mtime_ns и размер исходника, длины блоков
+CACHE_HEADER = struct.Struct("<4sHHHBHHqqII")
+FLAG_WRAP = 1
+DENSE_FREE_SHARE = 0.25  # Если свободных клеток меньше этой доли, храним их список
+RANDOM_TRIES = 32  # Случайных попыток перед перебором свободных клеток
+
+WALL = "#"
+START = "S"
+
+
+class LevelMap:
+    """Карта уровня с заранее посчитанной проходимостью клеток"""
+
+    def __init__(self, name: str, width: int, height: int, blocked: bytearray, wrap: bool = True,
+                 start: Optional[Tuple[int, int]] = None, free: Optional[array] = None, title: str = ""):
+        self.name = name
+        self.title = title or name
+        self.width = width
+        self.height = height
+        self.wrap = wrap
+        self.blocked = blocked  # blocked[y * width + x] == 1 - стена
+        self.free_count = len(blocked) - blocked.count(1)
+        if free is None and self.free_count < len(blocked) * DENSE_FREE_SHARE:
+            free = array("I", (i for i, cell in enumerate(blocked) if not cell))
+        self.free = free  # Номера свободных клеток (только для плотных карт, хранятся в кэше)
+        self.start = start if start is not None else self._default_start()
+        # Занятость клеток змейкой: taken[i] - сколько сегментов в клетке (больше одного - столкновение).
+        # _vacant[:_vacant_count] - проходимые незанятые клетки, _slot[i] - место клетки i в этом списке
+        passable = free if free is not None else array("I", (i for i, cell in enumerate(blocked) if not cell))
+        self.taken = bytearray(len(blocked))
+        self._vacant = array("I", passable)
+        self._vacant_count = len(self._vacant)
+        self._slot = array("q", [-1]) * len(blocked)
+        for position, index in enumerate(self._vacant):
+            self._slot[index] = position
+
+    def _default_start(self) -> Tuple[int, int]:
+        """Ближайшая к центру свободная клетка (поиск расширяющимися квадратами)"""
+        cx, cy = self.width // 2, self.height // 2
+        for r in range(max(self.width, self.height)):
+            for x in range(cx - r, cx + r + 1):
+                for y in ((cy - r, cy + r) if r else (cy,)):
+                    if self.is_free(x, y):
+                        return x, y
+            for y in range(cy - r + 1, cy + r):
+                for x in (cx - r, cx + r):
+                    if self.is_free(x, y):
+                        return x, y
+        return cx, cy
+
+    def is_free(self, x: int, y: int) -> bool:
+        """Можно ли находиться в клетке (клетки за краем поля непроходимы)"""
+        return 0 <= x < self.width and 0 <= y < self.height and not self.blocked[y * self.width + x]
+
+    def occupy(self, x: int, y: int):
+        """Отмечает сегмент змейки в клетке, O(1)"""
+        index = y * self.width + x
+        self.taken[index] += 1
+        position = self._slot[index]
+        if position >= 0:
+            # Клетка уходит из списка свободных: на ее место встает последняя
+            self._vacant_count -= 1
+            last = self._vacant[self._vacant_count]
+            self._vacant[position] = last
+            self._slot[last] = position
+            self._slot[index] = -1
+
+    def release(self, x: int, y: int):
+        """Снимает сегмент змейки с клетки, O(1)"""
+        index = y * self.width + x
+        self.taken[index] -= 1
+        if not self.taken[index] and not self.blocked[index]:
+            self._vacant[self._vacant_count] = index
+            self._slot[index] = self._vacant_count
+            self._vacant_count += 1
+
+    def is_taken(self, x: int, y: int) -> bool:
+        return self.taken[y * self.width + x] > 0
+
+    def random_free_cell(self, occupied: Collection[Tuple[int, int]] = (),
+                         margin: int = 0) -> Optional[Tuple[int, int]]:
+        """Случайная проходимая клетка, не занятая змейкой и не из occupied (яблоки), не ближе
+        margin к краю; None, если таких нет"""
+        width, height, vacant, count = self.width, self.height, self._vacant, self._vacant_count
+        if not count:
+            return None
+        if not isinstance(occupied, (set, frozenset)):
+            occupied = set(occupied)
+        for _ in range(RANDOM_TRIES):
+            index = vacant[random.randrange(count)]
+            x, y = index % width, index // width
+            if (x, y) not in occupied and margin <= x < width - margin and margin <= y < height - margin:
+                return x, y
+        # Попытки не помогли: подходящих клеток мало, перебираем только свободные
+        cells = [(index % width, index // width) for index in vacant[:count]]
+        cells = [(x, y) for x, y in cells
+                 if (x, y) not in occupied and margin <= x < width - margin and margin <= y < height - margin]
+        return random.choice(cells) if cells else None
+
+    def walls(self) -> List[Tuple[int, int]]:
+        """Клетки стен (для отрисовки)"""
+        width = self.width
+        walls = []
+        index = self.blocked.find(1)
+        while index != -1:
+            walls.append((index % width, index // width))
+            index = self.blocked.find(1, index + 1)
+        return walls
+
+    # --- Встроенные карты ---
+
+    @classmethod
+    def open(cls, width: int, height: int) -> "LevelMap":
+        """Поле без стен, змейка проходит сквозь края (карта classic)"""
+        return cls("classic", width, height, bytearray(width * height))
+
+    @classmethod
+    def box(cls, width: int, height: int) -> "LevelMap":
+        """Поле, обнесенное стеной, без прохода сквозь края"""
+        blocked = bytearray(width * height)
+        blocked[:width] = b"\x01" * width
+        blocked[-width:] = b"\x01" * width
+        blocked[::width] = b"\x01" * height
+        blocked[width - 1::width] = b"\x01" * height
+        return cls("box", width, height, blocked, wrap=False)
+
+    # --- Текстовый формат и двоичный кэш ---
+
+    @classmethod
+    def parse(cls, name: str, text: str) -> "LevelMap":
+        """Разбирает текстовую карту"""
+        options: Dict[str, str] = {}
+        rows: List[str] = []
+        for line in text.splitlines():
+            if line.startswith("#") and ":" in line and not rows:
+                key, _, value = line[1:].partition(":")
+                options[key.strip().lower()] = value.strip()
+            elif line.strip():
+                rows.append(line.rstrip())
+        if not rows:
+            raise ValueError(f"карта '{name}' пуста")
+
+        width = max(len(row) for row in rows)
+        height = len(rows)
+        blocked = bytearray(width * height)
+        start = None
+        for y, row in enumerate(rows):
+            for x, cell in enumerate(row):
+                if cell == WALL:
+                    blocked[y * width + x] = 1
+                elif cell == START:
+                    start = (x, y)
+        wrap = options.get("wrap", "yes").lower() not in ("no", "false", "0")
+        return cls(name, width, height, blocked, wrap=wrap, start=start, title=options.get("name", name))
+
+    def to_bytes(self, source_mtime: int, source_size: int) -> bytes:
+        title = self.title.encode("utf-8")
+        blocked = zlib.compress(bytes(self.blocked))
+        free = zlib.compress(self.free.tobytes()) if self.free is not None else b""
+        header = CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, self.width, self.height,
+                                   FLAG_WRAP if self.wrap else 0, self.start[0], self.start[1],
+                                   source_mtime, source_size, len(title), len(blocked))
+        return header + title + blocked + free
+
+    @classmethod
+    def from_bytes(cls, name: str, data: bytes, source_mtime: int, source_size: int) -> Optional["LevelMap"]:
+        """Восстанавливает карту из кэша; None, если кэш устарел или другой версии"""
+        (magic, version, width, height, flags, start_x, start_y,
+         mtime, size, title_length, blocked_length) = CACHE_HEADER.unpack_from(data)
+        if magic != CACHE_MAGIC or version != CACHE_VERSION or (mtime, size) != (source_mtime, source_size):
+            return None
+        offset = CACHE_HEADER.size
+        title = data[offset:offset + title_length].decode("utf-8")
+        offset += title_length
+        blocked = bytearray(zlib.decompress(data[offset:offset + blocked_length]))
+        free = None
+        if len(data) > offset + blocked_length:
+            free = array("I")
+            free.frombytes(zlib.decompress(data[offset + blocked_length:]))
+        return cls(name, width, height, blocked, wrap=bool(flags & FLAG_WRAP), start=(start_x, start_y),
+                   free=free, title=title)
+
+
+def list_levels(levels_dir: str) -> List[str]:
+    """Имена карт из папки levels/"""
+    if not os.path.isdir(levels_dir):
+        return []
+    return sorted(name[:-len(".txt")] for name in os.listdir(levels_dir) if name.endswith(".txt"))
+
+
+def load_level(name: str, levels_dir: str, cache_dir: Optional[str] = None) -> LevelMap:
+    """Загружает карту из двоичного кэша или разбирает текст и обновляет кэш"""
+    path = os.path.join(levels_dir, name + ".txt")
+    stat = os.stat(path)
+    cache_path = os.path.join(cache_dir, name + ".bin") if cache_dir else None
+
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path, "rb") as f:
+                level = LevelMap.from_bytes(name, f.read(), stat.st_mtime_ns, stat.st_size)
+            if level is not None:
+                return level
+        except (OSError, struct.error, zlib.error, ValueError) as e:
+            print(f"⚠ Кэш карты '{name}' поврежден, перестраиваем: {e}")
+
+    with open(path, encoding="utf-8") as f:
+        level = LevelMap.parse(name, f.read())
+    if cache_path:
+        tmp_path = None
+        try:
+            data = level.to_bytes(stat.st_mtime_ns, stat.st_size)
+            os.makedirs(cache_dir, exist_ok=True)
+            # Свой временный файл у каждой записи: карту могут одновременно кэшировать несколько игр
+            with tempfile.NamedTemporaryFile("wb", dir=cache_dir, prefix=name + ".", suffix=".tmp",
+                                             delete=False) as f:
+                tmp_path = f.name
+                f.write(data)
+            os.replace(tmp_path, cache_path)
+        except (OSError, struct.error) as e:
+            # struct.error - карта не помещается в заголовок кэша (размер больше 65535)
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            print(f"⚠ Не удалось сохранить кэш карты: {e}")
+    return level
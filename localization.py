@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Локализация интерфейса Clever Snake.
+
+Строки интерфейса адресуются целыми идентификаторами (T.PLAY, T.SCORE, ...).
+Переводы каждого языка заранее собираются в список, где индекс - идентификатор
+строки, поэтому при отрисовке не нужны поиски по словарям и проверки fallback.
+
+Дополнительные языки и правки переводов лежат в папке lang/ файлами <код>.json:
+    {"name": "Deutsch", "base": "en", "strings": {"play": "Spielen", ...}}
+base - язык, из которого берутся недостающие строки и контент (слова, вопросы).
+При включенной горячей перезагрузке изменения файлов подхватываются на лету.
+"""
+
+import json
+import os
+import time
+from enum import IntEnum
+from typing import Callable, Dict, List, Optional, Tuple
+
+FALLBACK_LANG = "en"
+RELOAD_INTERVAL = 1.0  # Как часто (в секундах) проверять файлы переводов
+
+
+class T(IntEnum):
+    """Идентификаторы строк интерфейса; имя в нижнем регистре - ключ в файлах переводов"""
+    TITLE = 0
+    CLASSIC_MODE = 1
+    QUIZ_MODE = 2
+    WORD_MODE = 3
+    PLAY = 4
+    SETTINGS = 5
+    EXIT = 6
+    SCORE = 7
+    PAUSE = 8
+    RESUME = 9
+    GAME_OVER = 10
+    FINAL_SCORE = 11
+    RESTART = 12
+    BACK_TO_MENU = 13
+    LANGUAGE = 14
+    INTERFACE_LANG = 15
+    GAME_LANG = 16
+    RESOLUTION = 17
+    QUESTION = 18
+    ANSWER = 19
+    CORRECT = 20
+    WRONG = 21
+    COLLECT_WORD = 22
+    WORD = 23
+    CONTROLS = 24
+    UP = 25
+    DOWN = 26
+    LEFT = 27
+    RIGHT = 28
+    PAUSE_KEY = 29
+    RESUME_KEY = 30
+    QUIT_KEY = 31
+    LOADING = 32
+    LEADERBOARD = 33
+    NO_RECORDS = 34
+    BACK_HINT = 35
+    WELL_DONE = 36
+    QUIZ_ALL_ANSWERED = 37
+    MORE_LANGUAGES = 38
+    LEVEL = 39
+    LEVEL_CLASSIC = 40
+    LEVEL_BOX = 41
+
+
+BUILTIN_NAMES = {"ru": "Русский", "en": "English", "ko": "한국어"}
+
+BUILTIN_TRANSLATIONS: Dict[str, Dict[str, str]] = {
+    "ru": {
+        "title": "Clever Snake",
+        "classic_mode": "Классическая змейка",
+        "quiz_mode": "Викторина",
+        "word_mode": "Змейка со словами",
+        "play": "Играть",
+        "settings": "Настройки",
+        "exit": "Выход",
+        "score": "Счет",
+        "pause": "Пауза",
+        "resume": "Продолжить",
+        "game_over": "Игра окончена",
+        "final_score": "Финальный счет",
+        "restart": "Перезапустить",
+        "back_to_menu": "В главное меню",
+        "language": "Язык",
+        "interface_lang": "Язык интерфейса",
+        "game_lang": "Язык игры",
+        "resolution": "Разрешение экрана",
+        "question": "Вопрос",
+        "answer": "Ответ",
+        "correct": "Правильно!",
+        "wrong": "Неправильно!",
+        "collect_word": "Соберите слово",
+        "word": "Слово",
+        "controls": "Управление",
+        "up": "Вверх - W",
+        "down": "Вниз - S",
+        "left": "Влево - A",
+        "right": "Вправо - D",
+        "pause_key": "Пауза - C",
+        "resume_key": "Продолжить - V",
+        "quit_key": "Выход - Q",
+        "loading": "Загрузка...",
+        "leaderboard": "Рекорды",
+        "no_records": "Рекордов пока нет",
+        "back_hint": "ESC - Назад в меню",
+        "well_done": "Молодец!",
+        "quiz_all_answered": "Ты ответил на все вопросы и прошел игру!",
+        "more_languages": "Другие языки",
+        "level": "Карта",
+        "level_classic": "Без препятствий",
+        "level_box": "Коробка",
+    },
+    "en": {
+        "title": "Clever Snake",
+        "classic_mode": "Classic Snake",
+        "quiz_mode": "Quiz",
+        "word_mode": "Snake with Words",
+        "play": "Play",
+        "settings": "Settings",
+        "exit": "Exit",
+        "score": "Score",
+        "pause": "Pause",
+        "resume": "Resume",
+        "game_over": "Game Over",
+        "final_score": "Final Score",
+        "restart": "Restart",
+        "back_to_menu": "Back to Menu",
+        "language": "Language",
+        "interface_lang": "Interface Language",
+        "game_lang": "Game Language",
+        "resolution": "Screen Resolution",
+        "question": "Question",
+        "answer": "Answer",
+        "correct": "Correct!",
+        "wrong": "Wrong!",
+        "collect_word": "Collect the word",
+        "word": "Word",
+        "controls": "Controls",
+        "up": "Up - W",
+        "down": "Down - S",
+        "left": "Left - A",
+        "right": "Right - D",
+        "pause_key": "Pause - C",
+        "resume_key": "Resume - V",
+        "quit_key": "Quit - Q",
+        "loading": "Loading...",
+        "leaderboard": "High Scores",
+        "no_records": "No records yet",
+        "back_hint": "ESC - Back to menu",
+        "well_done": "Well done!",
+        "quiz_all_answered": "You answered all the questions and beat the game!",
+        "more_languages": "More languages",
+        "level": "Map",
+        "level_classic": "No obstacles",
+        "level_box": "Box",
+    },
+    "ko": {
+        "title": "클리버 스네이크",
+        "classic_mode": "클래식 뱀",
+        "quiz_mode": "퀴즈",
+        "word_mode": "단어 뱀",
+        "play": "플레이",
+        "settings": "설정",
+        "exit": "종료",
+        "score": "점수",
+        "pause": "일시정지",
+        "resume": "계속",
+        "game_over": "게임 오버",
+        "final_score": "최종 점수",
+        "restart": "다시 시작",
+        "back_to_menu": "메뉴로 돌아가기",
+        "language": "언어",
+        "interface_lang": "인터페이스 언어",
+        "game_lang": "게임 언어",
+        "resolution": "화면 해상도",
+        "question": "문제",
+        "answer": "답",
+        "correct": "정답!",
+        "wrong": "오답!",
+        "collect_word": "단어를 모으세요",
+        "word": "단어",
+        "controls": "조작법",
+        "up": "위 - W",
+        "down": "아래 - S",
+        "left": "왼쪽 - A",
+        "right": "오른쪽 - D",
+        "pause_key": "일시정지 - C",
+        "resume_key": "계속 - V",
+        "quit_key": "종료 - Q",
+        "loading": "로딩 중...",
+        "leaderboard": "최고 기록",
+        "no_records": "아직 기록이 없습니다",
+        "back_hint": "ESC - 메뉴로 돌아가기",
+        "well_done": "잘했어요!",
+        "quiz_all_answered": "모든 문제에 답하고 게임을 완료했습니다!",
+        "more_languages": "다른 언어",
+        "level": "맵",
+        "level_classic": "장애물 없음",
+        "level_box": "상자",
+    },
+}
+
+
+class Localization:
+    def __init__(self, pack_dir: Optional[str] = None, hot_reload: bool = False):
+        self.pack_dir = pack_dir
+        self.hot_reload = hot_reload
+        self.current_lang = "ru"
+        self.names: Dict[str, str] = {}  # Код языка -> название на этом языке
+        self.bases: Dict[str, str] = {}  # Код языка -> язык контента и недостающих строк
+        self.tables: Dict[str, List[str]] = {}  # Код языка -> строки по идентификаторам
+        self.texts: List[str] = []  # Строки текущего языка: texts[T.PLAY]
+        self._listeners: List[Callable[[], None]] = []
+        self._signature: List[Tuple[str, int]] = []
+        self._next_check = 0.0
+        self.reload()
+
+    # --- Загрузка ---
+
+    def _pack_files(self) -> List[str]:
+        if not self.pack_dir or not os.path.isdir(self.pack_dir):
+            return []
+        return sorted(os.path.join(self.pack_dir, name) for name in os.listdir(self.pack_dir)
+                      if name.endswith(".json"))
+
+    def _pack_signature(self) -> List[Tuple[str, int]]:
+        signature = []
+        for path in self._pack_files():
+            try:
+                signature.append((path, os.stat(path).st_mtime_ns))
+            except OSError:
+                pass
+        return signature
+
+    def reload(self):
+        """Собирает таблицы строк из встроенных переводов и файлов lang/"""
+        strings = {lang: dict(table) for lang, table in BUILTIN_TRANSLATIONS.items()}
+        names = dict(BUILTIN_NAMES)
+        bases = {lang: lang for lang in BUILTIN_TRANSLATIONS}
+
+        self._signature = self._pack_signature()
+        for path, _ in self._signature:
+            lang = os.path.splitext(os.path.basename(path))[0]
+            try:
+                with open(path, encoding="utf-8") as f:
+                    pack = json.load(f)
+                strings.setdefault(lang, {}).update(pack.get("strings", {}))
+                names[lang] = pack.get("name", names.get(lang, lang))
+                base = pack.get("base", bases.get(lang, FALLBACK_LANG))
+                bases[lang] = base if base in BUILTIN_TRANSLATIONS else FALLBACK_LANG
+            except Exception as e:
+                print(f"⚠ Не удалось загрузить перевод {path}: {e}")
+
+        self.tables = {lang: self._compile(table, strings.get(bases.get(lang, FALLBACK_LANG), {}))
+                       for lang, table in strings.items() if lang in names}
+        self.names = {lang: name for lang, name in names.items() if lang in self.tables}
+        self.bases = bases
+        if self.current_lang not in self.tables:
+            self.current_lang = "ru"
+        self._activate()
+
+    @staticmethod
+    def _compile(table: Dict[str, str], base: Dict[str, str]) -> List[str]:
+        """Раскладывает переводы по идентификаторам; пропуски - из базового языка или английского"""
+        fallback = BUILTIN_TRANSLATIONS[FALLBACK_LANG]
+        compiled = []
+        for text_id in T:
+            key = text_id.name.lower()
+            compiled.append(table.get(key) or base.get(key) or fallback.get(key, key))
+        return compiled
+
+    def reload_if_changed(self):
+        """Перечитывает файлы переводов, если они изменились (не чаще раза в секунду)"""
+        if not self.hot_reload:
+            return
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        self._next_check = now + RELOAD_INTERVAL
+        if self._pack_signature() != self._signature:
+            self.reload()
+            print("✓ Переводы перезагружены")
+
+    # --- Выбор языка ---
+
+    @property
+    def languages(self) -> List[str]:
+        """Коды доступных языков интерфейса: сначала встроенные, затем из файлов"""
+        return [lang for lang in BUILTIN_NAMES if lang in self.tables] + \
+               sorted(lang for lang in self.tables if lang not in BUILTIN_NAMES)
+
+    def content_language(self, lang: Optional[str] = None) -> str:
+        """Язык контента (слова, вопросы) для языка интерфейса"""
+        return self.bases.get(lang or self.current_lang, FALLBACK_LANG)
+
+    def add_listener(self, callback: Callable[[], None]):
+        """Подписывает на смену языка или перезагрузку переводов"""
+        self._listeners.append(callback)
+
+    def _activate(self):
+        self.texts = self.tables[self.current_lang]
+        for callback in self._listeners:
+            callback()
+
+    def set_language(self, lang: str):
+        """Устанавливает язык"""
+        if lang in self.tables and lang != self.current_lang:
+            self.current_lang = lang
+            self._activate()
+
+    def get(self, text_id: T) -> str:
+        """Получает переведенный текст по идентификатору"""
+        return self.texts[text_id]
+
+    def get_text(self, key: str) -> str:
+        """Получает переведенный текст по строковому ключу (медленнее, чем texts[T...])"""
+        try:
+            return self.texts[T[key.upper()]]
+        except KeyError:
+            return key
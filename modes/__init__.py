@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+Режимы игры как подключаемые модули.
+
+Каждый модуль пакета описывает один режим: класс Mode, наследник GameModePlugin.
+Имя модуля - это имя режима: под ним пишется статистика и выбирается профиль
+сложности. Модули находятся без импорта (pkgutil) и импортируются только при
+выборе режима; тогда же в фоне запускаются загрузчики их контента.
+
+Свои режимы (например, для уроков) можно держать вне игры: папки из переменной
+окружения CLEVER_SNAKE_MODES_PATH (через os.pathsep) добавляются в пакет.
+
+Хуки режима:
+    loaders()        - фоновые загрузчики контента {имя: функция}
+    on_content(...)  - результат загрузчика, в главном потоке
+    start()          - начало игры (змейка и поле уже созданы)
+    update()         - шаг после движения змейки (поедание яблок)
+    draw(canvas)     - объекты режима на поле
+    draw_hud(canvas) - подсказки поверх поля
+"""
+
+import importlib
+import os
+import pkgutil
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+MODES_PATH_ENV = "CLEVER_SNAKE_MODES_PATH"
+BUILTIN_ORDER = ("classic", "quiz", "word_collection")  # Порядок в меню; остальные режимы - по алфавиту
+
+for _path in os.environ.get(MODES_PATH_ENV, "").split(os.pathsep):
+    if _path and os.path.isdir(_path) and _path not in __path__:
+        __path__.append(_path)
+
+
+class GameModePlugin:
+    """Базовый класс режима игры"""
+
+    name = ""
+    title: Optional[str] = None  # Название в меню для режимов без перевода
+    required: Tuple[str, ...] = ()  # Загрузчики, без которых режим не запускается
+
+    def __init__(self, game):
+        self.game = game
+
+    def loaders(self) -> Dict[str, Callable[[], Any]]:
+        return {}
+
+    def on_content(self, name: str, result: Any):
+        pass
+
+    def start(self):
+        pass
+
+    def update(self):
+        pass
+
+    def draw(self, canvas):
+        pass
+
+    def draw_hud(self, canvas):
+        pass
+
+
+def available_modes() -> List[str]:
+    """Имена всех режимов (модули при этом не импортируются)"""
+    names = {module.name for module in pkgutil.iter_modules(__path__) if not module.name.startswith("_")}
+    builtin = [name for name in BUILTIN_ORDER if name in names]
+    return builtin + sorted(names - set(builtin))
+
+
+def load_mode(name: str) -> Type[GameModePlugin]:
+    """Импортирует модуль режима и возвращает его класс"""
+    module = importlib.import_module(f"{__name__}.{name}")
+    mode_class = module.Mode
+    mode_class.name = name
+    return mode_class
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""Классическая змейка: одно яблоко, очко за каждое"""
+
+from typing import Optional
+
+from entities import Apple
+from modes import GameModePlugin
+from timing_wheel import Timer
+
+
+class Mode(GameModePlugin):
+    def __init__(self, game):
+        super().__init__(game)
+        self.apple = None
+        self.expiry: Optional[Timer] = None  # Переезд яблока на сложных профилях
+
+    def start(self):
+        game = self.game
+        self.apple = None
+        position = game._get_unique_position(())  # Змейку карта уровня учитывает сама
+        if position is None:
+            game._end_game("board_full")  # На карте нет свободной клетки для яблока
+            return
+        self.apple = Apple(game.board_width, game.board_height, game.level, position)
+        self._schedule_expiry()
+
+    def _schedule_expiry(self):
+        """Несъеденное яблоко переезжает через apple_lifetime секунд профиля сложности"""
+        game = self.game
+        game.timers.cancel(self.expiry)
+        lifetime = game.difficulty.apple_lifetime
+        self.expiry = game.timers.schedule(lifetime, self._expire) if lifetime > 0 else None
+
+    def _expire(self):
+        if not self.apple.respawn():
+            self.game._end_game("board_full")
+            return
+        self._schedule_expiry()
+
+    def update(self):
+        game = self.game
+        if game.snake.body[0] == self.apple.position:
+            game.snake.grow()
+            game.score += 1
+            game._emit_apple_eaten()
+            if not self.apple.respawn():
+                game._end_game("board_full")  # Змейка заняла все поле
+                return
+            self._schedule_expiry()
+
+    def draw(self, canvas):
+        if self.apple is not None:
+            self.apple.draw(canvas)
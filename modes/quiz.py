@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+"""Викторина: яблоки с номерами ответов, вопросы по интервальному повторению"""
+
+import random
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import pygame
+
+from entities import GRAY, GREEN, WHITE, QuizApple, QuizQuestion
+from localization import T
+from modes import GameModePlugin
+from quiz_scheduler import QuizScheduler, ReviewState
+from text_layout import TextLayout
+from timing_wheel import Timer
+
+QUIZ_TEXT_MARGIN = 20  # Отступ текста викторины от краев поля
+QUIZ_QUESTION_LINES = 3  # Сколько строк вопроса помещается без уменьшения шрифта
+QUIZ_ANSWER_LINES = 2  # То же для каждого варианта ответа
+QUIZ_RESULT_SECONDS = 3.0  # Сколько показывать "Правильно!" после ответа
+QUIZ_APPLE_MARGIN = 2  # Яблоки-ответы не ставятся вплотную к краю поля, если есть место
+
+
+def load_questions() -> Dict[str, List[Dict[str, Any]]]:
+    """Загружает вопросы для викторины"""
+    return {
+        "ru": [
+            # Вопросы о Южной Корее
+            {"question": "Как называется главный флаг Южной Кореи?", "correct": "Тхэгыкки", "wrong": ["Восходящее Солнце", "Четыре Дракона", "Звезда и Полумесяц"]},
+            {"question": "Какой цветок является национальным символом Кореи?", "correct": "Мугунхва (Гибискус)", "wrong": ["Сакура (Вишня)", "Лотос", "Роза"]},
+            {"question": "Какое животное считается священным в корейских мифах?", "correct": "Дракон/Тигр", "wrong": ["Единорог", "Змея", "Феникс"]},
+            {"question": "Как называется традиционная корейская одежда?", "correct": "Ханбок", "wrong": ["Кимоно", "Кипао", "Сари"]},
+            {"question": "Какой большой азиатский праздник отмечается осенью в честь сбора урожая?", "correct": "Чхусок", "wrong": ["Соллаль", "Дивали", "Тет"]},
+            {"question": "Как называется традиционное корейское боевое искусство?", "correct": "Тхэквондо", "wrong": ["Каратэ", "Кунг-фу", "Айкидо"]},
+            {"question": "Как называется корейский алфавит?", "correct": "Хангыль", "wrong": ["Кандзи", "Кириллица", "Иероглифы"]},
+            {"question": "Какое самое известное острое блюдо из ферментированной капусты?", "correct": "Кимчи", "wrong": ["Рамен", "Суши", "Пульгоги"]},
+            {"question": "Как называется популярное корейское блюдо из риса, мяса, овощей и острого соуса?", "correct": "Бибимбап", "wrong": ["Кимбап", "Чапчхэ", "Ттокпокки"]},
+            {"question": "Как называют корейские сериалы?", "correct": "Дорамы", "wrong": ["Аниме", "Теленовеллы", "Ситкомы"]},
+
+            # Вопросы об Англии
+            {"question": "Как называется знаменитый дворец в Лондоне, где живет король?", "correct": "Букингемский дворец", "wrong": ["Версаль", "Тауэр", "Виндзорский замок"]},
+            {"question": "Как называется самая известная достопримечательность Лондона — большая башня с часами?", "correct": "Биг-Бен (Башня Елизаветы)", "wrong": ["Эмпайр-стейт-билдинг", "Вестминстер", "Пизанская башня"]},
+            {"question": "Какое животное является национальным символом Англии?", "correct": "Лев", "wrong": ["Орел", "Бык", "Барсук"]},
+            {"question": "Как называется красный автобус с двумя этажами, который можно увидеть в Лондоне?", "correct": "Даблдекер", "wrong": ["Трамвай", "Метро", "Минивэн"]},
+            {"question": "Какое самое известное блюдо из жареной рыбы и картошки?", "correct": "Фиш энд чипс", "wrong": ["Пицца", "Гамбургер", "Плов"]},
+            {"question": "Как называется традиционный английский напиток, который англичане пьют с молоком?", "correct": "Чай", "wrong": ["Кофе", "Сок", "Лимонад"]},
+            {"question": "Как называется древнее сооружение из камней, расположенное на равнине?", "correct": "Стоунхендж", "wrong": ["Пирамиды", "Колизей", "Мачу-Пикчу"]},
+            {"question": "Какой сказочный король собрал вокруг себя рыцарей Круглого стола?", "correct": "Король Артур", "wrong": ["Король Ричард", "Король Лир", "Король Генрих"]},
+            {"question": "Какой вид спорта очень популярен в Англии?", "correct": "Футбол", "wrong": ["Баскетбол", "Бейсбол", "Крикет"]},
+            {"question": "Какую фразу говорят, чтобы пожелать кому-то удачи перед представлением?", "correct": "Break a leg!", "wrong": ["Good luck!", "Nice to meet you!", "See you later!"]},
+
+            # Вопросы о России
+            {"question": "Какое животное является одним из самых известных национальных символов России?", "correct": "Медведь", "wrong": ["Волк", "Лиса", "Олень"]},
+            {"question": "Какой самый большой город и столица России?", "correct": "Москва", "wrong": ["Санкт-Петербург", "Киев", "Казань"]},
+            {"question": "Как называется самая длинная река в Европе, которая протекает через Россию?", "correct": "Волга", "wrong": ["Дон", "Нева", "Обь"]},
+            {"question": "Как называется всемирно известный архитектурный комплекс в Москве, окруженный стенами?", "correct": "Кремль", "wrong": ["Эрмитаж", "Зимний Дворец", "Большой театр"]},
+            {"question": "Как называются расписные деревянные куклы, вложенные одна в другую?", "correct": "Матрешка", "wrong": ["Неваляшка", "Буратино", "Дымковская игрушка"]},
+            {"question": "Какой вид транспорта на тройке лошадей был популярен для зимних путешествий?", "correct": "Тройка (Санки)", "wrong": ["Карета", "Плот", "Дирижабль"]},
+            {"question": "Как называется традиционный русский суп из капусты и мяса?", "correct": "Щи", "wrong": ["Борщ", "Рассольник", "Уха"]},
+            {"question": "Как называются тонкие, круглые лепешки, которые часто едят со сметаной, вареньем или икрой?", "correct": "Блины", "wrong": ["Оладьи", "Пышки", "Лаваш"]},
+            {"question": "Как называется холодный летний суп, который готовят на квасе?", "correct": "Окрошка", "wrong": ["Гаспачо", "Свекольник", "Холодник"]},
+            {"question": "Какой сказочный персонаж умеет летать в ступе и живет в избушке на курьих ножках?", "correct": "Баба-Яга", "wrong": ["Кощей Бессмертный", "Змей Горыныч", "Леший"]},
+            {"question": "Как зовут девушку, которая помогает Деду Морозу и всегда одета в голубое или белое?", "correct": "Снегурочка", "wrong": ["Аленушка", "Василиса", "Снежная Королева"]},
+            {"question": "Какой музыкальный инструмент, похожий на треугольник, является символом русской народной музыки?", "correct": "Балалайка", "wrong": ["Гусли", "Гармонь", "Домра"]}
+        ],
+        "en": [
+            # South Korea Questions
+            {"question": "What is the name of South Korea's main flag?", "correct": "Taegukgi", "wrong": ["Rising Sun", "Four Dragons", "Star and Crescent"]},
+            {"question": "What flower is the national symbol of Korea?", "correct": "Mugunghwa (Rose of Sharon)", "wrong": ["Cherry Blossom (Sakura)", "Lotus", "Rose"]},
+            {"question": "Which animal is considered sacred or symbolic in Korean myths?", "correct": "Dragon/Tiger", "wrong": ["Unicorn", "Snake", "Phoenix"]},
+            {"question": "What is the name of the traditional Korean clothing with bright colors and full skirts?", "correct": "Hanbok", "wrong": ["Kimono", "Qipao", "Sari"]},
+            {"question": "What major Asian holiday is celebrated in the autumn to give thanks for the harvest?", "correct": "Chuseok", "wrong": ["Seollal", "Diwali", "Tet"]},
+            {"question": "What is the name of the traditional Korean martial art that involves a lot of kicking?", "correct": "Taekwondo", "wrong": ["Karate", "Kung Fu", "Aikido"]},
+            {"question": "What is the Korean alphabet called that looks like circles, squares, and sticks?", "correct": "Hangeul", "wrong": ["Kanji", "Cyrillic", "Hieroglyphs"]},
+            {"question": "What is the most famous spicy dish made of fermented cabbage, eaten with almost every meal?", "correct": "Kimchi", "wrong": ["Ramen", "Sushi", "Bulgogi"]},
+            {"question": "What is the popular Korean dish of rice, meat, vegetables, and spicy sauce served in a bowl?", "correct": "Bibimbap", "wrong": ["Gimbap", "Japchae", "Tteokbokki"]},
+            {"question": "What are Korean TV series called?", "correct": "Dramas", "wrong": ["Anime", "Telenovelas", "Sitcoms"]},
+
+            # England Questions
+            {"question": "What is the name of the famous palace in London where the King lives?", "correct": "Buckingham Palace", "wrong": ["Versailles", "The Tower", "Windsor Castle"]},
+            {"question": "What is the most famous landmark in London — the large clock tower?", "correct": "Big Ben (Elizabeth Tower)", "wrong": ["Empire State Building", "Westminster", "Leaning Tower of Pisa"]},
+            {"question": "Which animal is the national symbol of England, often shown on coats of arms?", "correct": "Lion", "wrong": ["Eagle", "Bull", "Badger"]},
+            {"question": "What is the name of the red, two-story bus seen in London?", "correct": "Double-decker", "wrong": ["Tram", "Subway", "Minivan"]},
+            {"question": "What is the most famous dish of deep-fried fish and potatoes, traditionally wrapped in newspaper?", "correct": "Fish and Chips", "wrong": ["Pizza", "Hamburger", "Pilaf"]},
+            {"question": "What is the traditional English drink that people often drink with milk?", "correct": "Tea", "wrong": ["Coffee", "Juice", "Lemonade"]},
+            {"question": "What is the name of the ancient stone structure located on a plain with many legends about it?", "correct": "Stonehenge", "wrong": ["The Pyramids", "The Colosseum", "Machu Picchu"]},
+            {"question": "What legendary king, according to legends, gathered knights of the Round Table around him?", "correct": "King Arthur", "wrong": ["King Richard", "King Lear", "King Henry"]},
+            {"question": "What sport, played with feet and a ball, is very popular in England?", "correct": "Football", "wrong": ["Basketball", "Baseball", "Cricket"]},
+            {"question": "What phrase is said to wish someone good luck before a performance?", "correct": "Break a leg!", "wrong": ["Good luck!", "Nice to meet you!", "See you later!"]},
+
+            # Russia Questions
+            {"question": "Which animal is one of the most famous national symbols of Russia?", "correct": "Bear", "wrong": ["Wolf", "Fox", "Deer"]},
+            {"question": "What is the largest city and capital of Russia?", "correct": "Moscow", "wrong": ["St. Petersburg", "Kyiv", "Kazan"]},
+            {"question": "What is the longest river in Europe that flows through Russia?", "correct": "Volga", "wrong": ["Don", "Neva", "Ob"]},
+            {"question": "What is the world-famous architectural complex in Moscow, surrounded by walls?", "correct": "The Kremlin", "wrong": ["The Hermitage", "The Winter Palace", "The Bolshoi Theatre"]},
+            {"question": "What are the painted wooden dolls, nested one inside the other, called?", "correct": "Matryoshka", "wrong": ["Tumbler doll", "Pinocchio", "Dymkovo toy"]},
+            {"question": "What is the three-horse sled that was popular for winter travel called?", "correct": "Troika (Sled)", "wrong": ["Carriage", "Raft", "Airship"]},
+            {"question": "What is the traditional Russian soup made of cabbage and meat?", "correct": "Shchi", "wrong": ["Borsch", "Rassolnik", "Ukha"]},
+            {"question": "What are the thin, round pancakes often eaten with sour cream, jam, or caviar called?", "correct": "Blini", "wrong": ["Oladyi", "Pyshki", "Lavash"]},
+            {"question": "What is the cold summer soup made with kvass called?", "correct": "Okroshka", "wrong": ["Gazpacho", "Svekólnik", "Kholodnik"]},
+            {"question": "What fairy tale character can fly in a mortar and lives in a hut on chicken legs?", "correct": "Baba Yaga", "wrong": ["Koschei the Deathless", "Zmey Gorynych", "Leshy"]},
+            {"question": "What is the name of the girl who helps Ded Moroz and is always dressed in blue or white?", "correct": "Snegurochka", "wrong": ["Alyonushka", "Vasilisa", "The Snow Queen"]},
+            {"question": "What musical instrument, shaped like a triangle, is a symbol of Russian folk music?", "correct": "Balalaika", "wrong": ["Gusli", "Garmon", "Domra"]}
+        ],
+        "ko": [
+            # 한국 문화 질문
+            {"question": "대한민국의 국기 이름은 무엇인가요?", "correct": "태극기", "wrong": ["떠오르는 태양", "네 마리의 용", "별과 초승달"]},
+            {"question": "한국의 나라를 상징하는 꽃은 무엇인가요?", "correct": "무궁화", "wrong": ["벚꽃", "연꽃", "장미"]},
+            {"question": "한국 신화에서 신성하거나 상징적인 동물은 무엇인가요?", "correct": "용/호랑이", "wrong": ["유니콘", "뱀", "불사조"]},
+            {"question": "화려한 색상과 풍성한 치마가 있는 전통 한국 옷은 무엇이라고 부르나요?", "correct": "한복", "wrong": ["기모노", "치파오", "사리"]},
+            {"question": "가을에 수확에 감사하며 기념하는 큰 명절은 무엇인가요?", "correct": "추석", "wrong": ["설날", "디왈리", "뗏"]},
+            {"question": "발차기 동작이 많은 전통 한국 무술은 무엇인가요?", "correct": "태권도", "wrong": ["가라데", "쿵푸", "아이키도"]},
+            {"question": "동그라미, 네모, 선 모양으로 이루어진 한국의 글자는 무엇인가요?", "correct": "한글", "wrong": ["한자", "키릴 문자", "상형 문자"]},
+            {"question": "거의 모든 식사에 곁들여 먹는 발효된 양배추로 만든 가장 유명하고 매운 음식은 무엇인가요?", "correct": "김치", "wrong": ["라면", "초밥", "불고기"]},
+            {"question": "밥, 고기, 채소, 매운 소스를 그릇에 담아 비벼 먹는 인기 있는 한국 음식은 무엇인가요?", "correct": "비빔밥", "wrong": ["김밥", "잡채", "떡볶이"]},
+            {"question": "한국 TV 드라마 시리즈는 무엇이라고 부르나요?", "correct": "드라마", "wrong": ["애니메이션", "텔레노벨라", "시트콤"]},
+
+            # 영국 문화 질문
+            {"question": "런던에 있는 왕이 사는 유명한 궁궐의 이름은 무엇인가요?", "correct": "버킹엄 궁전", "wrong": ["베르사유", "타워", "윈저 성"]},
+            {"question": "런던에서 가장 유명한 랜드마크인 큰 시계탑은 무엇이라고 부르나요?", "correct": "빅 벤", "wrong": ["엠파이어 스테이트 빌딩", "웨스트민스터", "피사의 사탑"]},
+            {"question": "문장에 자주 등장하는, 영국을 상징하는 동물은 무엇인가요?", "correct": "사자", "wrong": ["독수리", "황소", "오소리"]},
+            {"question": "런던에서 볼 수 있는 두 층짜리 빨간 버스는 무엇이라고 부르나요?", "correct": "이층 버스/더블데커", "wrong": ["전차", "지하철", "미니밴"]},
+            {"question": "튀긴 생선과 감자로 만든, 전통적으로 신문에 싸서 먹던 가장 유명한 음식은 무엇인가요?", "correct": "피시 앤 칩스", "wrong": ["피자", "햄버거", "필라프"]},
+            {"question": "영국 사람들이 우유와 함께 마시는 전통 음료는 무엇인가요?", "correct": "차", "wrong": ["커피", "주스", "레모네이드"]},
+            {"question": "평원에 위치하며 많은 전설이 전해지는, 돌로 만들어진 고대 구조물은 무엇인가요?", "correct": "스톤헨지", "wrong": ["피라미드", "콜로세움", "마추픽추"]},
+            {"question": "전설에 따르면 원탁의 기사들을 모았다고 하는 전설적인 왕은 누구인가요?", "correct": "아더 왕", "wrong": ["리처드 왕", "리어 왕", "헨리 왕"]},
+            {"question": "발을 사용하여 공을 차는 스포츠로, 영국에서 매우 인기 있는 종목은 무엇인가요?", "correct": "축구", "wrong": ["농구", "야구", "크리켓"]},
+            {"question": "공연 전에 누군가에게 행운을 빌어줄 때 하는 말은 무엇인가요?", "correct": "Break a leg!", "wrong": ["Good luck!", "Nice to meet you!", "See you later!"]},
+
+            # 러시아 문화 질문
+            {"question": "러시아의 가장 유명한 국가 상징 중 하나이며 동화에 자주 등장하는 동물은 무엇인가요?", "correct": "곰", "wrong": ["늑대", "여우", "사슴"]},
+            {"question": "러시아의 가장 큰 도시이자 수도는 어디인가요?", "correct": "모스크바", "wrong": ["상트페테르부르크", "키이우", "카잔"]},
+            {"question": "유럽을 가로질러 흐르는 가장 긴 강은 무엇인가요?", "correct": "볼가 강", "wrong": ["돈 강", "네바 강", "오브 강"]},
+            {"question": "벽으로 둘러싸여 있으며 궁전과 성당이 있는 모스크바의 세계적으로 유명한 건축 단지는 무엇인가요?", "correct": "크렘린", "wrong": ["에르미타주", "겨울 궁전", "볼쇼이 극장"]},
+            {"question": "가장 큰 것부터 가장 작은 것까지, 하나 안에 다른 인형들이 들어 있는 칠해진 나무 인형은 무엇이라고 부르나요?", "correct": "마트료시카", "wrong": ["오뚝이 인형", "피노키오", "딤코보 장난감"]},
+            {"question": "세 마리 말이 끄는 썰매는 겨울철 여행에 인기 있는 운송 수단이었습니다. 이것을 무엇이라고 부르나요?", "correct": "트로이카/썰매", "wrong": ["마차", "뗏목", "비행선"]},
+            {"question": "양배추와 고기로 만든 전통 러시아 수프는 무엇인가요?", "correct": "시", "wrong": ["보르시", "라솔니크", "우하"]},
+            {"question": "사워 크림, 잼 또는 캐비어와 함께 자주 먹는 얇고 둥근 팬케이크는 무엇이라고 부르나요?", "correct": "블리니", "wrong": ["올라디", "푸시키", "라바시"]},
+            {"question": "크바스(발효 음료)로 만드는 차가운 여름 수프는 무엇인가요?", "correct": "오크로시카", "wrong": ["가스파초", "스베콜니크", "홀로드니크"]},
+            {"question": "절구통을 타고 날아다니고 닭다리 위에 지어진 오두막에 사는 동화 속 캐릭터는 누구인가요?", "correct": "바바 야가", "wrong": ["코셰이", "즈메이 고리니치", "레시"]},
+            {"question": "데드 모로즈(Ded Moroz, 러시아판 산타클로스)를 돕고 항상 파란색이나 흰색 옷을 입는 소녀의 이름은 무엇인가요?", "correct": "스네구로치카", "wrong": ["알료누시카", "바실리사", "눈의 여왕"]},
+            {"question": "삼각형처럼 생겼으며 러시아 민속 음악의 상징인 악기는 무엇인가요?", "correct": "발랄라이카", "wrong": ["구슬리", "가르몬", "돔라"]}
+        ]
+    }
+
+
+class Mode(GameModePlugin):
+    required = ("questions",)
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.questions: Dict[str, List[Dict[str, Any]]] = {}
+        self.question = None
+        self.answers: List[str] = []
+        self.correct_answer = ""
+        self.correct_number = 0  # Номер правильного ответа
+        self.apples: List[QuizApple] = []  # Яблоки с номерами ответов
+        # (вопрос, правильный ответ, неправильные) -> общие данные вопроса
+        self.flyweights: Dict[Tuple[str, str, Tuple[str, ...]], QuizQuestion] = {}
+        self.show_result = False  # Показывать "Правильно!"
+        self.result_timer: Optional[Timer] = None  # Скрывает "Правильно!"
+        self.scheduler: Optional[QuizScheduler] = None  # Очередь вопросов текущей сессии
+        self.reviews: Dict[str, Dict[str, ReviewState]] = {}  # Язык -> прогресс повторения игрока
+        self.current_question: Optional[Dict[str, Any]] = None
+        # Раскладки вопроса и ответов и фон под ними пересчитываются при новом вопросе,
+        # другой ширине поля или после загрузки шрифта, а не в каждом кадре
+        self._overlay_stale = True  # Новый вопрос - раскладку нужно собрать заново
+        self._overlay_width = 0  # Ширина поля и шрифт, для которых собрана раскладка
+        self._overlay_font = None
+        self._question_layout: Optional[TextLayout] = None
+        self._answer_layouts: List[TextLayout] = []
+        self._overlay_rect = pygame.Rect(0, 0, 0, 0)
+
+    def loaders(self):
+        return {"questions": load_questions}
+
+    def on_content(self, name: str, result: Any):
+        self.questions = result or {}
+        self.flyweights.clear()  # Вопросы заменены (пакет учителя) - старые данные не нужны
+
+    def start(self):
+        lang = self.game.game_lang.value
+        self.show_result = False
+        self.result_timer = None
+        self.scheduler = QuizScheduler(self.questions.get(lang, []), self._get_reviews(lang), time.time())
+        self._spawn_apples()
+
+    def _get_reviews(self, lang: str) -> Dict[str, ReviewState]:
+        """Прогресс повторения игрока; из базы читается один раз за запуск, дальше живет в памяти"""
+        reviews = self.reviews.get(lang)
+        if reviews is None:
+            game = self.game
+            rows = game.stats.load_reviews(game.player, lang) if game.stats else []
+            reviews = {question: ReviewState(*state) for question, *state in rows}
+            self.reviews[lang] = reviews
+        return reviews
+
+    def _spawn_apples(self):
+        """Создает яблоки с номерами ответов для викторины"""
+        game = self.game
+        # Следующий вопрос выбирается планировщиком интервального повторения
+        q = self.scheduler.next_question() if self.scheduler else None
+
+        if q is None:
+            # Все вопросы заданы - игра завершена
+            game._end_game("quiz_completed")
+            return
+
+        self.current_question = q
+        self.question = q["question"]
+        self.answers = [q["correct"]] + q["wrong"]
+        random.shuffle(self.answers)
+        self.correct_answer = q["correct"]
+        self.correct_number = self.answers.index(q["correct"]) + 1
+        self._overlay_stale = True
+
+        # Создаем яблоки с номерами ответов (объекты берутся из пула, вопрос общий на все яблоки)
+        game.apple_pool.release(self.apples)
+        data = self._flyweight(q)
+        occupied: Set[Tuple[int, int]] = set()
+        for i in range(len(self.answers)):
+            # Размещаем яблоки в случайных свободных клетках, избегая змейки (ее клетки отмечены на карте)
+            # и других яблок
+            position = self._random_position(occupied)
+            if position is None:
+                game._end_game("board_full")  # Все ответы не помещаются на поле
+                return
+            occupied.add(position)
+            self.apples.append(game.apple_pool.acquire(
+                QuizApple, game.board_width, game.board_height, data, i + 1, position))
+
+    def _flyweight(self, q: Dict[str, Any]) -> QuizQuestion:
+        """Общий объект данных вопроса (создается один раз на вопрос)"""
+        # Ответы входят в ключ: тот же вопрос из другого пакета может иметь другие ответы
+        key = (q["question"], q["correct"], tuple(q["wrong"]))
+        data = self.flyweights.get(key)
+        if data is None:
+            data = QuizQuestion(q["question"], q["correct"], q["wrong"])
+            self.flyweights[key] = data
+        return data
+
+    def _random_position(self, occupied: Set[Tuple[int, int]]) -> Optional[Tuple[int, int]]:
+        """Свободная клетка для яблока викторины; по возможности не у самого края поля"""
+        game = self.game
+        return (game._get_unique_position(occupied, QUIZ_APPLE_MARGIN)
+                or game._get_unique_position(occupied))
+
+    def update(self):
+        # Проверяем столкновение с любым из яблок викторины
+        snake = self.game.snake
+        for apple in self.apples:
+            if snake.body[0] == apple.position:
+                snake.grow()
+                self.game._emit_apple_eaten()
+                self._check_answer(apple.answer_number)
+                break
+
+    def _check_answer(self, apple_number: int):
+        """Проверяет ответ на вопрос викторины по номеру съеденного яблока"""
+        game = self.game
+        lang = game.game_lang.value
+        correct = apple_number == self.correct_number
+        state = self.scheduler.answer(self.current_question, correct, time.time())
+        if game.stats:
+            game.stats.record_quiz_answer(game.player, lang, self.question, correct)
+            game.stats.record_review(game.player, lang, self.question, state.as_row())
+        if game.telemetry:
+            game.telemetry.emit("quiz_answer", game_lang=lang, question=self.question,
+                                correct=correct, reps=state.reps, lapses=state.lapses)
+        if game.effects:
+            if correct:
+                game.effects.correct(game.snake.body[0])
+            else:
+                game.effects.wrong(game.snake.body[0])
+        if correct:
+            game.score += 10
+            self.show_result = True
+            game.timers.cancel(self.result_timer)
+            self.result_timer = game.timers.schedule(QUIZ_RESULT_SECONDS, self._hide_result)
+            # Создаем новый вопрос
+            self._spawn_apples()
+        else:
+            # Неправильный ответ - игра заканчивается
+            game._end_game("wrong_answer")
+
+    def _hide_result(self):
+        self.show_result = False
+
+    def draw(self, canvas):
+        # Все яблоки с номерами
+        for apple in self.apples:
+            apple.draw(canvas)
+
+    def draw_hud(self, canvas):
+        # Результат ответа
+        if self.show_result:
+            board_width, board_height = canvas.get_size()
+            canvas.text(self.game.texts[T.CORRECT], 48, GREEN, center=(board_width // 2, board_height // 2))
+        # Вопрос отображается поверх игрового поля
+        if self.question:
+            self._draw_overlay(canvas)
+
+    def _layout_overlay(self, canvas, board_width: int):
+        """Раскладывает вопрос и ответы по ширине поля и задает высоту фона"""
+        max_width = board_width - 2 * QUIZ_TEXT_MARGIN
+        # Длинные вопросы и ответы переносятся по ширине поля; раскладка кэшируется холстом
+        question = canvas.layout_text(self.question, 28, max_width, max_lines=QUIZ_QUESTION_LINES)
+        answers = [canvas.layout_text(f"{i + 1}. {answer}", 24, max_width, max_lines=QUIZ_ANSWER_LINES)
+                   for i, answer in enumerate(self.answers)]
+        height = 55 + question.height + 10 + sum(answer.height for answer in answers) + 10
+        self._question_layout = question
+        self._answer_layouts = answers
+        self._overlay_rect.size = (board_width, max(200, height))
+
+    def _draw_overlay(self, canvas):
+        """Отрисовывает вопрос викторины поверх игрового поля"""
+        texts = self.game.texts
+        board_width = canvas.get_size()[0]
+        center_x = board_width // 2
+        # Шрифт тот же объект, пока его не заменит фоновый поиск или смена языка
+        font = canvas.font_getter(24)
+        if self._overlay_stale or board_width != self._overlay_width or font is not self._overlay_font:
+            self._overlay_stale = False
+            self._overlay_width = board_width
+            self._overlay_font = font
+            self._layout_overlay(canvas, board_width)
+
+        # Прозрачный фон для вопроса (такой же как игровое поле), чтобы была видна змейка
+        canvas.fill_alpha(self._overlay_rect, GRAY, 150)
+
+        # Вопрос
+        canvas.text_centered(texts[T.QUESTION], 36, WHITE, center_x, 30)
+
+        # Текст вопроса
+        y_offset = canvas.draw_layout(self._question_layout, WHITE, center_x, 55) + 10
+
+        # Ответы с номерами
+        for answer in self._answer_layouts:
+            y_offset = canvas.draw_layout(answer, WHITE, center_x, y_offset)
@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+"""Сбор слов: нужно съесть буквы слова по порядку, неправильная буква заканчивает игру"""
+
+import os
+import random
+import time
+from typing import Any, Dict, List, Set, Tuple
+
+import hangul
+from entities import WHITE, Language, WordApple
+from localization import T
+from modes import GameModePlugin
+from text_layout import Label
+from word_index import WordIndex
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WORDS_DIR = os.path.join(BASE_DIR, "words")  # Большие словари для режима сбора слов
+WORD_INDEX_CACHE = os.path.join(os.path.expanduser("~"), ".clever_snake", "cache", "word_index.pickle")
+WORDS_PER_LEVEL = 3  # Сколько слов нужно собрать для перехода на следующий уровень сложности
+
+
+class Mode(GameModePlugin):
+    required = ("words",)  # Большие словари необязательны; пока их нет, используются встроенные слова
+
+    RUSSIAN_ALPHABET = "АБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ"
+    ENGLISH_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    # Неправильные чамо берутся из полных таблиц хангыля той же роли, что и правильное
+    # (с двойными согласными и составными гласными), иначе правильное яблоко выделялось бы
+    KOREAN_LETTERS = {
+        hangul.INITIAL: hangul.INITIALS,
+        hangul.VOWEL: hangul.VOWELS,
+        hangul.FINAL: hangul.FINALS[1:],
+    }
+    KOREAN_ALPHABET = hangul.INITIALS + hangul.VOWELS
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.word_targets: Dict[str, List[str]] = {}
+        self.word_index = WordIndex()
+        self.apples: List[WordApple] = []
+        self.words_completed = 0
+        self.word_started_at = 0.0
+        self.current_word = ""  # Слово на языке интерфейса (для отображения)
+        self.current_word_game_lang = ""  # Слово на языке игры (для сбора букв)
+        self.collected_letters: List[str] = []
+        self.current_word_letters: List[str] = []  # Буквы (для корейского - чамо), которые нужно собрать
+        self.current_word_kinds: List[str] = []  # Для корейского - роль каждого чамо в слоге
+        self.word_assembler = hangul.HangulAssembler()  # Собирает слоги из чамо на лету
+        self._word_label = Label()  # Строки подсказок пересобираются только при изменениях
+        self._collected_label = Label()
+
+    def loaders(self):
+        return {
+            "words": self._load_word_targets,
+            "word_index": self._load_word_index,
+        }
+
+    def on_content(self, name: str, result: Any):
+        if name == "words":
+            self.word_targets = result or {}
+        elif name == "word_index" and result is not None:
+            # Индекс только читается, поэтому один на все игры в окне
+            self.word_index = result
+
+    @staticmethod
+    def _load_word_index() -> WordIndex:
+        index = WordIndex()
+        index.load(WORDS_DIR, WORD_INDEX_CACHE)
+        return index
+
+    def start(self):
+        self.current_word = ""
+        self.current_word_game_lang = ""
+        self.current_word_letters = []
+        self.current_word_kinds = []
+        self.collected_letters = []
+        self.word_assembler.reset()
+        self.words_completed = 0
+        self._spawn_apples()
+
+    @staticmethod
+    def _load_word_targets() -> Dict[str, List[str]]:
+        """Загружает слова для режима сбора слов"""
+        return {
+            "ru": ["КОД", "ИГРА", "ЗМЕЙКА", "ЯБЛОКО", "ПИТОН", "ПРОГРАММА", "БАБУШКА", "МАМА", "ПАПА", "СЫН", "ДОЧЬ"],
+            "en": ["CODE", "GAME", "SNAKE", "APPLE", "PYTHON", "PROGRAM", "GRANDMA", "MOM", "DAD", "SON", "DAUGHTER"],
+            "ko": ["코드", "게임", "뱀", "사과", "파이썬", "프로그램", "할머니", "엄마", "아빠", "아들", "딸"]
+        }
+
+    def _get_word_translation(self, word: str, from_lang: str, to_lang: str) -> str:
+        """Получает перевод слова из одного языка в другой"""
+        if self.word_index.ready:
+            translation = self.word_index.translate(word, from_lang, to_lang)
+            if translation:
+                return translation
+
+        word_dict = {
+            "КОД": {"en": "CODE", "ko": "코드"},
+            "ИГРА": {"en": "GAME", "ko": "게임"},
+            "ЗМЕЙКА": {"en": "SNAKE", "ko": "뱀"},
+            "ЯБЛОКО": {"en": "APPLE", "ko": "사과"},
+            "ПИТОН": {"en": "PYTHON", "ko": "파이썬"},
+            "ПРОГРАММА": {"en": "PROGRAM", "ko": "프로그램"},
+            "БАБУШКА": {"en": "GRANDMA", "ko": "할머니"},
+            "МАМА": {"en": "MOM", "ko": "엄마"},
+            "ПАПА": {"en": "DAD", "ko": "아빠"},
+            "СЫН": {"en": "SON", "ko": "아들"},
+            "ДОЧЬ": {"en": "DAUGHTER", "ko": "딸"},
+            # Обратные переводы
+            "CODE": {"ru": "КОД", "ko": "코드"},
+            "GAME": {"ru": "ИГРА", "ko": "게임"},
+            "SNAKE": {"ru": "ЗМЕЙКА", "ko": "뱀"},
+            "APPLE": {"ru": "ЯБЛОКО", "ko": "사과"},
+            "PYTHON": {"ru": "ПИТОН", "ko": "파이썬"},
+            "PROGRAM": {"ru": "ПРОГРАММА", "ko": "프로그램"},
+            "GRANDMA": {"ru": "БАБУШКА", "ko": "할머니"},
+            "MOM": {"ru": "МАМА", "ko": "엄마"},
+            "DAD": {"ru": "ПАПА", "ko": "아빠"},
+            "SON": {"ru": "СЫН", "ko": "아들"},
+            "DAUGHTER": {"ru": "ДОЧЬ", "ko": "딸"},
+            # Корейские слова
+            "코드": {"ru": "КОД", "en": "CODE"},
+            "게임": {"ru": "ИГРА", "en": "GAME"},
+            "뱀": {"ru": "ЗМЕЙКА", "en": "SNAKE"},
+            "사과": {"ru": "ЯБЛОКО", "en": "APPLE"},
+            "파이썬": {"ru": "ПИТОН", "en": "PYTHON"},
+            "프로그램": {"ru": "ПРОГРАММА", "en": "PROGRAM"},
+            "할머니": {"ru": "БАБУШКА", "en": "GRANDMA"},
+            "엄마": {"ru": "МАМА", "en": "MOM"},
+            "아빠": {"ru": "ПАПА", "en": "DAD"},
+            "아들": {"ru": "СЫН", "en": "SON"},
+            "딸": {"ru": "ДОЧЬ", "en": "DAUGHTER"}
+        }
+        
+        if word in word_dict and to_lang in word_dict[word]:
+            return word_dict[word][to_lang]
+        return word  # Если перевода нет, возвращаем исходное слово
+
+    def _get_random_letter(self, lang: Language, like: str = "", kind: str = "") -> str:
+        """Возвращает случайную букву из алфавита выбранного языка (kind - роль чамо для корейского)"""
+        if lang == Language.RUSSIAN:
+            return random.choice(self.RUSSIAN_ALPHABET)
+        elif lang == Language.ENGLISH:
+            return random.choice(self.ENGLISH_ALPHABET)
+        elif lang == Language.KOREAN:
+            # Для корейского берем чамо той же роли, что и правильное (начальная, гласная,
+            # конечная), чтобы правильное яблоко не выделялось
+            if not kind and hangul.is_vowel(like):
+                kind = hangul.VOWEL
+            elif not kind and hangul.is_consonant(like):
+                kind = hangul.INITIAL if like in hangul.INITIAL_INDEX else hangul.FINAL
+            return random.choice(self.KOREAN_LETTERS.get(kind, self.KOREAN_ALPHABET))
+        return "" # Дефолтное значение
+
+    def _split_word_letters(self, word: str, lang: Language) -> List[str]:
+        """Разбивает слово на буквы для сбора; корейские слоги разбираются на чамо"""
+        if lang == Language.KOREAN:
+            return hangul.decompose_word(word)
+        return list(word)
+
+    def _spawn_apples(self):
+        """Создает яблоки для режима сбора слов: одно правильное и несколько неправильных"""
+        game = self.game
+        if not self.current_word:
+            # Сначала пробуем большой словарь: слово подбирается под текущий уровень сложности
+            level = 1 + self.words_completed // WORDS_PER_LEVEL
+            picked = self.word_index.pick(game.interface_lang.value, game.game_lang.value, level)
+            # Иначе берем слово из словаря языка интерфейса (для отображения)
+            words = self.word_targets.get(game.interface_lang.value, [])
+            if picked:
+                self.current_word, self.current_word_game_lang = picked
+            elif words:
+                self.current_word = random.choice(words)
+                # Получаем перевод этого слова на язык игры (для сбора букв)
+                self.current_word_game_lang = self._get_word_translation(
+                    self.current_word, 
+                    game.interface_lang.value, 
+                    game.game_lang.value
+                )
+            if self.current_word:
+                self.current_word_letters = self._split_word_letters(self.current_word_game_lang, game.game_lang)
+                self.current_word_kinds = (hangul.decompose_word_kinds(self.current_word_game_lang)
+                                           if game.game_lang == Language.KOREAN else [])
+                self.collected_letters = []
+                self.word_assembler.reset()
+                self.word_started_at = time.monotonic()
+            else:
+                return  # Нет слов для сбора
+
+        # Проверяем по слову на языке игры (так как буквы собираем на языке игры)
+        if len(self.collected_letters) >= len(self.current_word_letters):
+            # Слово собрано, начинаем новое
+            game.score += 10
+            self.words_completed += 1
+            if game.effects:
+                game.effects.correct(game.snake.body[0])
+            seconds = time.monotonic() - self.word_started_at
+            if game.stats:
+                game.stats.record_word(game.player, game.game_lang.value, self.current_word_game_lang, seconds)
+            if game.telemetry:
+                game.telemetry.emit("word_completed", game_lang=game.game_lang.value,
+                                    word=self.current_word_game_lang, seconds=round(seconds, 2))
+            self.current_word = ""
+            self.current_word_game_lang = ""
+            self.current_word_letters = []
+            self.current_word_kinds = []
+            self.collected_letters = []
+            self._spawn_apples()
+            return
+
+        game.apple_pool.release(self.apples)
+        occupied_positions: Set[Tuple[int, int]] = set()  # Яблоки; клетки змейки отмечены на карте уровня
+
+        # 1. Создаем правильное яблоко (буква из слова на языке игры)
+        correct_letter = self.current_word_letters[len(self.collected_letters)]
+        correct_kind = self.current_word_kinds[len(self.collected_letters)] if self.current_word_kinds else ""
+        correct_pos = game._get_unique_position(occupied_positions)
+        if correct_pos is None:
+            game._end_game("board_full")  # Для яблока не осталось свободной клетки
+            return
+        self.apples.append(game.apple_pool.acquire(
+            WordApple, game.board_width, game.board_height, correct_letter, True, correct_pos))
+        occupied_positions.add(correct_pos)
+
+        # 2. Создаем неправильные яблоки (от 2 до 4), сколько поместится
+        num_wrong_apples = random.randint(2, 4)
+        for _ in range(num_wrong_apples):
+            wrong_letter = self._get_random_letter(game.game_lang, correct_letter, correct_kind)
+            # Убедимся, что неправильная буква не является текущей правильной
+            while wrong_letter == correct_letter:
+                wrong_letter = self._get_random_letter(game.game_lang, correct_letter, correct_kind)
+
+            wrong_pos = game._get_unique_position(occupied_positions)
+            if wrong_pos is None:
+                break
+            self.apples.append(game.apple_pool.acquire(
+                WordApple, game.board_width, game.board_height, wrong_letter, False, wrong_pos))
+            occupied_positions.add(wrong_pos)
+
+    def update(self):
+        # Проверяем столкновение с яблоками в режиме сбора слов
+        game = self.game
+        for apple in self.apples:
+            if game.snake.body[0] == apple.position:
+                if apple.is_correct:
+                    game.snake.grow()
+                    self.collected_letters.append(apple.letter)
+                    self.word_assembler.push(apple.letter)
+                    game.score += 1
+                    game._emit_apple_eaten(letter=apple.letter)
+                    # После сбора правильной буквы пересоздаем все яблоки (список меняется, поэтому сразу выходим)
+                    self._spawn_apples()
+                else:
+                    # Съели неправильное яблоко - конец игры
+                    if game.effects:
+                        game.effects.wrong(game.snake.body[0])
+                    game._end_game("wrong_answer")
+                break # Выходим после обработки первого столкновения
+
+    def draw(self, canvas):
+        # Все яблоки с буквами
+        for apple in self.apples:
+            apple.draw(canvas)
+
+    def draw_hud(self, canvas):
+        if not self.current_word:
+            return
+        texts = self.game.texts
+        # Целевое слово на языке интерфейса (сверху)
+        canvas.text(self._word_label.format(texts[T.WORD], self.current_word), 24, WHITE, topleft=(10, 50))
+
+        # Собранные буквы на языке игры (снизу); корейские чамо собираются в слоги
+        canvas.text(self._collected_label.format(texts[T.COLLECT_WORD], self.word_assembler.text), 24, WHITE,
+                    topleft=(10, 80))
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Интервальное повторение вопросов викторины (упрощенный алгоритм SM-2).
+
+Для каждого игрока и вопроса хранится состояние повторения: когда вопрос снова
+"созреет" и насколько он труден. Вопросы сессии лежат в куче, упорядоченной по
+(срок повторения, легкость), поэтому выбор следующего вопроса стоит O(log n)
+даже на больших банках вопросов. Вопрос с неверным ответом возвращается в ту же
+сессию через несколько других вопросов (своя небольшая куча по номеру вопроса).
+"""
+
+import heapq
+import random
+from typing import Dict, List, Optional, Tuple
+
+DAY = 24 * 60 * 60
+RETRY_DELAY = 10 * 60  # Через сколько секунд повторить вопрос после ошибки
+SESSION_RETRY_GAP = 3  # Через сколько других вопросов сессии снова задать вопрос с ошибкой
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+
+
+class ReviewState:
+    """Состояние повторения одного вопроса"""
+
+    __slots__ = ("ease", "interval", "reps", "lapses", "due")
+
+    def __init__(self, ease: float = DEFAULT_EASE, interval: float = 0.0, reps: int = 0,
+                 lapses: int = 0, due: float = 0.0):
+        self.ease = ease  # Чем меньше, тем труднее вопрос
+        self.interval = interval  # Текущий интервал в днях
+        self.reps = reps  # Правильных ответов подряд
+        self.lapses = lapses  # Сколько раз ответ был неправильным
+        self.due = due  # Когда вопрос снова нужно задать (время Unix); 0 - новый вопрос
+
+    def as_row(self) -> Tuple[float, float, int, int, float]:
+        return (self.ease, self.interval, self.reps, self.lapses, self.due)
+
+    def review(self, correct: bool, now: float):
+        """Обновляет состояние после ответа"""
+        if correct:
+            self.reps += 1
+            if self.reps == 1:
+                self.interval = 1.0
+            elif self.reps == 2:
+                self.interval = 6.0
+            else:
+                self.interval = round(self.interval * self.ease, 1)
+            self.ease = self.ease + 0.1
+            self.due = now + self.interval * DAY
+        else:
+            self.lapses += 1
+            self.reps = 0
+            self.interval = 0.0
+            self.ease = max(MIN_EASE, self.ease - 0.2)
+            self.due = now + RETRY_DELAY
+
+
+class QuizScheduler:
+    """Очередь вопросов одной сессии викторины в порядке приоритета повторения"""
+
+    def __init__(self, questions: List[Dict], reviews: Dict[str, ReviewState], now: float):
+        self.questions = questions
+        self.reviews = reviews  # Текст вопроса -> состояние (общее между сессиями)
+        # Сначала просроченные повторения, затем новые вопросы, затем остальные;
+        # при равном сроке - более трудные, остальное решает случай
+        self._heap: List[Tuple[float, float, float, int]] = []
+        # Вопросы с ошибкой в этой сессии: (с какого по счету вопроса задать снова, случай, индекс).
+        # Срок по времени не годится: новые вопросы помечены началом сессии и всегда шли бы раньше
+        self._retries: List[Tuple[int, float, int]] = []
+        self._asked = 0  # Сколько вопросов задано в сессии
+        self._indexes: Dict[str, int] = {}
+        for index, question in enumerate(questions):
+            self._indexes[question["question"]] = index
+            state = reviews.get(question["question"])
+            if state is None:
+                self._heap.append((now, DEFAULT_EASE, random.random(), index))
+            else:
+                self._heap.append((state.due, state.ease, random.random(), index))
+        heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._heap) + len(self._retries)
+
+    def next_question(self) -> Optional[Dict]:
+        """Достает вопрос с ошибкой, если подошла его очередь, иначе самый приоритетный
+        вопрос, еще не заданный в этой сессии"""
+        retries = self._retries
+        if retries and (retries[0][0] <= self._asked or not self._heap):
+            index = heapq.heappop(retries)[2]
+        elif self._heap:
+            index = heapq.heappop(self._heap)[3]
+        else:
+            return None
+        self._asked += 1
+        return self.questions[index]
+
+    def answer(self, question: Dict, correct: bool, now: float) -> ReviewState:
+        """Запоминает ответ и возвращает новое состояние вопроса для сохранения"""
+        state = self.reviews.get(question["question"])
+        if state is None:
+            state = ReviewState()
+            self.reviews[question["question"]] = state
+        state.review(correct, now)
+        if not correct:
+            index = self._indexes.get(question["question"])
+            if index is not None:
+                heapq.heappush(self._retries, (self._asked + SESSION_RETRY_GAP, random.random(), index))
+        return state
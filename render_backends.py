@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Бэкенды отрисовки для Clever Snake.
+
+software - классический путь: рисование на поверхности дисплея и display.flip()
+sdl2      - аппаратный рендерер SDL2 (pygame._sdl2.video): клетки и текст хранятся
+            в текстурах, масштабирование поля выполняет видеокарта
+
+Игра рисует только через холст (Canvas), поэтому оба бэкенда взаимозаменяемы.
+Бэкенд sdl2 работает и с программным драйвером рендерера, так что его можно
+проверять без окна (SDL_VIDEODRIVER=dummy).
+
+Для игры на разделенном экране у каждого бэкенда есть участок (viewport): игра
+рисует в свой закадровый экран (поверхность или текстуру-цель), а хозяин окна
+выводит его в свою часть окна. Кэши текста и клеток у участков общие с окном.
+"""
+
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import pygame
+
+from text_layout import LayoutCache, TextLayout
+
+Color = Tuple[int, int, int]
+FontGetter = Callable[[int], pygame.font.Font]
+
+TEXT_CACHE_LIMIT = 512  # Сколько отрисованных строк держим в кэше
+BORDER_COLOR = (0, 0, 0)
+
+
+class Canvas:
+    """Общий интерфейс рисования, которым пользуется игра"""
+
+    def __init__(self, font_getter: FontGetter, cell_size: int):
+        self.font_getter = font_getter
+        self.cell_size = cell_size
+        # (текст, шрифт, цвет) -> (изображение, прямоугольник); прямоугольник строки переиспользуется
+        self._text_cache: Dict[Tuple[str, pygame.font.Font, Color], Tuple[object, pygame.Rect]] = {}
+        self._cell_sprites: Dict[Color, object] = {}  # Спрайты клеток, отрисованные один раз
+        self._layouts = LayoutCache(font_getter)
+        self._cell_rect = pygame.Rect(0, 0, cell_size, cell_size)  # Один прямоугольник на все draw_cell
+
+    def share_caches(self, other: "Canvas"):
+        """Использует кэши отрисованного текста, клеток и раскладок другого холста"""
+        self._text_cache = other._text_cache
+        self._cell_sprites = other._cell_sprites
+        self._layouts = other._layouts
+
+    def get_size(self) -> Tuple[int, int]:
+        raise NotImplementedError
+
+    def fill(self, color: Color):
+        raise NotImplementedError
+
+    def draw_rect(self, rect: pygame.Rect, color: Color, width: int = 0):
+        raise NotImplementedError
+
+    def fill_alpha(self, rect: pygame.Rect, color: Color, alpha: int):
+        """Заливает прямоугольник полупрозрачным цветом"""
+        raise NotImplementedError
+
+    def cell_sprite(self, color: Color):
+        """Возвращает заранее отрисованную клетку сетки цветом color с черной рамкой"""
+        sprite = self._cell_sprites.get(color)
+        if sprite is None:
+            cell = pygame.Surface((self.cell_size, self.cell_size))
+            if pygame.display.get_surface() is not None:
+                cell = cell.convert()  # Формат дисплея - самый быстрый blit
+            cell.fill(color)
+            pygame.draw.rect(cell, BORDER_COLOR, cell.get_rect(), 1)
+            sprite = self._make_image(cell)
+            self._cell_sprites[color] = sprite
+        return sprite
+
+    def draw_cell(self, x: int, y: int, color: Color):
+        """Рисует клетку сетки (змейка, яблоко)"""
+        rect = self._cell_rect
+        rect.x = x * self.cell_size
+        rect.y = y * self.cell_size
+        self._blit_image(self.cell_sprite(color), rect)
+
+    def draw_cell_text(self, x: int, y: int, color: Color, text: str, size: int, text_color: Color):
+        """Рисует клетку с надписью по центру (яблоки с номером или буквой)"""
+        self.draw_cell(x, y, color)
+        cell = self._cell_rect
+        self.text_centered(text, size, text_color, cell.centerx, cell.centery)
+
+    def draw_cells(self, sequence: Sequence[Tuple[object, pygame.Rect]]):
+        """Рисует пачку клеток: последовательность пар (спрайт, прямоугольник)"""
+        for sprite, rect in sequence:
+            self._blit_image(sprite, rect)
+
+    def _make_image(self, surface: pygame.Surface):
+        """Превращает отрисованную поверхность в объект для вывода (поверхность или текстуру)"""
+        return surface
+
+    def _blit_image(self, image, rect: pygame.Rect):
+        """Выводит готовый объект (текст или спрайт) в прямоугольник rect"""
+        raise NotImplementedError
+
+    def _text_image(self, text: str, size: int, color: Color) -> Tuple[object, pygame.Rect]:
+        """Отрисованная строка и ее прямоугольник из кэша (текст, шрифт, цвет)"""
+        font = self.font_getter(size)
+        key = (text, font, color)
+        cached = self._text_cache.get(key)
+        if cached is None:
+            if len(self._text_cache) >= TEXT_CACHE_LIMIT:
+                self._text_cache.clear()
+            surface = font.render(text, True, color)
+            cached = (self._make_image(surface), surface.get_rect())
+            self._text_cache[key] = cached
+        return cached
+
+    def text(self, text: str, size: int, color: Color, center: Optional[Tuple[int, int]] = None,
+             topleft: Optional[Tuple[int, int]] = None) -> pygame.Rect:
+        """Выводит строку; возвращаемый прямоугольник действителен до следующего вывода той же строки"""
+        image, rect = self._text_image(text, size, color)
+        if center is not None:
+            rect.center = center
+        elif topleft is not None:
+            rect.topleft = topleft
+        else:
+            rect.topleft = (0, 0)
+        self._blit_image(image, rect)
+        return rect
+
+    def text_centered(self, text: str, size: int, color: Color, center_x: int, center_y: int):
+        """То же, что text(center=...), но без кортежа координат (для строк, выводимых каждый кадр)"""
+        image, rect = self._text_image(text, size, color)
+        rect.centerx = center_x
+        rect.centery = center_y
+        self._blit_image(image, rect)
+
+    def layout_text(self, text: str, size: int, max_width: int, max_lines: Optional[int] = None) -> TextLayout:
+        """Раскладывает текст по строкам в пределах max_width (результат кэшируется)"""
+        return self._layouts.layout(text, size, max_width, max_lines)
+
+    def draw_layout(self, layout: TextLayout, color: Color, center_x: int, top: int) -> int:
+        """Выводит разложенный текст строками по центру; возвращает нижнюю границу"""
+        line_height = layout.line_height
+        center_y = top + line_height // 2
+        for line in layout.lines:
+            self.text_centered(line, layout.size, color, center_x, center_y)
+            center_y += line_height
+        return top + layout.height
+
+
+class SurfaceCanvas(Canvas):
+    """Холст поверх обычной поверхности pygame"""
+
+    def __init__(self, surface: pygame.Surface, font_getter: FontGetter, cell_size: int):
+        super().__init__(font_getter, cell_size)
+        self.surface = surface
+        self._alpha_surfaces: Dict[Tuple[int, int], pygame.Surface] = {}
+
+    def get_size(self) -> Tuple[int, int]:
+        return self.surface.get_size()
+
+    def fill(self, color: Color):
+        self.surface.fill(color)
+
+    def draw_rect(self, rect: pygame.Rect, color: Color, width: int = 0):
+        pygame.draw.rect(self.surface, color, rect, width)
+
+    def fill_alpha(self, rect: pygame.Rect, color: Color, alpha: int):
+        overlay = self._alpha_surfaces.get(rect.size)
+        if overlay is None:
+            overlay = pygame.Surface(rect.size)
+            self._alpha_surfaces[rect.size] = overlay
+        overlay.set_alpha(alpha)
+        overlay.fill(color)
+        self.surface.blit(overlay, rect)
+
+    def draw_cells(self, sequence: Sequence[Tuple[object, pygame.Rect]]):
+        # Один вызов blits вместо отдельного blit на каждую клетку
+        self.surface.blits(sequence, False)
+
+    def _blit_image(self, image, rect: pygame.Rect):
+        self.surface.blit(image, rect)
+
+
+class SoftwareBackend:
+    """Программная отрисовка через поверхность дисплея"""
+
+    name = "software"
+
+    def __init__(self, size: Tuple[int, int], font_getter: FontGetter, cell_size: int):
+        self.font_getter = font_getter
+        self.cell_size = cell_size
+        self.screen = self._create_screen(size)
+        self.canvas = SurfaceCanvas(self.screen, font_getter, cell_size)
+        self.board_canvas: Optional[SurfaceCanvas] = None  # Поле рисуется в логическом размере
+        self._board_view: Optional[pygame.Surface] = None  # Кэш участка окна для масштабирования
+        self._board_offset = (0, 0)
+        self._board_scale = 1.0
+        self._shake = (0, 0)
+
+    def _create_screen(self, size: Tuple[int, int]) -> pygame.Surface:
+        """Поверхность, на которой рисуется кадр: у бэкенда - окно"""
+        return pygame.display.set_mode(size, pygame.RESIZABLE)
+
+    def set_size(self, size: Tuple[int, int]):
+        """Меняет размер окна"""
+        self.screen = self._create_screen(size)
+        self._on_resized()
+
+    def window_resized(self, size: Tuple[int, int]):
+        """Окно изменено пользователем - поверхность дисплея пересоздана"""
+        self.screen = pygame.display.get_surface()
+        self._on_resized()
+
+    def _on_resized(self):
+        self.canvas.surface = self.screen
+        self._update_board_viewport()
+
+    def set_board_size(self, size: Tuple[int, int]):
+        """Задает логический размер поля для новой игры"""
+        if self.board_canvas is None or self.board_canvas.get_size() != size:
+            surface = pygame.Surface(size).convert()
+            if self.board_canvas is None:
+                self.board_canvas = SurfaceCanvas(surface, self.font_getter, self.cell_size)
+                self.board_canvas.share_caches(self.canvas)
+            else:
+                self.board_canvas.surface = surface
+        self._update_board_viewport()
+
+    def _update_board_viewport(self):
+        """Вписывает поле в окно с сохранением пропорций и кэширует участок окна для вывода"""
+        if self.board_canvas is None:
+            return
+        board_w, board_h = self.board_canvas.get_size()
+        window_w, window_h = self.screen.get_size()
+        scale = min(window_w / board_w, window_h / board_h)
+        view_rect = pygame.Rect(0, 0, max(1, int(board_w * scale)), max(1, int(board_h * scale)))
+        view_rect.center = (window_w // 2, window_h // 2)
+        self._board_offset = view_rect.topleft
+        self._board_scale = scale
+        # При совпадении размеров поле просто копируется, иначе масштабируется прямо в участок окна
+        self._board_view = None if view_rect.size == (board_w, board_h) else self.screen.subsurface(view_rect)
+
+    def begin_board(self, shake: Tuple[int, int] = (0, 0)) -> Canvas:
+        """Начинает отрисовку поля и возвращает его холст; shake - сдвиг поля в его пикселях"""
+        self._shake = shake
+        return self.board_canvas
+
+    def end_board(self):
+        """Выводит логическое поле в окно"""
+        board = self.board_canvas.surface
+        dx, dy = self._shake
+        if self._board_view is None:
+            self.screen.blit(board, (self._board_offset[0] + dx, self._board_offset[1] + dy))
+        else:
+            pygame.transform.scale(board, self._board_view.get_size(), self._board_view)
+            if dx or dy:
+                # Сдвиг прямо в участке окна, без лишней копии поля
+                self._board_view.scroll(int(dx * self._board_scale), int(dy * self._board_scale))
+
+    def frame_surface(self) -> pygame.Surface:
+        """Готовый кадр (для записи)"""
+        return self.screen
+
+    def present(self):
+        pygame.display.flip()
+
+
+class SoftwareViewport(SoftwareBackend):
+    """Участок окна программного бэкенда: закадровый экран, который выводится в часть окна"""
+
+    def __init__(self, parent: SoftwareBackend, size: Tuple[int, int]):
+        self.parent = parent
+        self._dest: Optional[Tuple[pygame.Rect, pygame.Surface]] = None  # Кэш участка окна
+        super().__init__(size, parent.font_getter, parent.cell_size)
+        self.canvas.share_caches(parent.canvas)
+
+    def _create_screen(self, size: Tuple[int, int]) -> pygame.Surface:
+        """Закадровый экран; окно принадлежит хозяину"""
+        return pygame.Surface(size).convert()
+
+    def window_resized(self, size: Tuple[int, int]):
+        pass
+
+    def begin_view(self):
+        pass
+
+    def end_view(self):
+        pass
+
+    def draw_into(self, rect: pygame.Rect):
+        """Выводит готовый кадр в прямоугольник окна"""
+        if rect.size == self.screen.get_size():
+            self.parent.screen.blit(self.screen, rect)
+            return
+        if self._dest is None or self._dest[0] != rect or self._dest[1].get_parent() is not self.parent.screen:
+            self._dest = (pygame.Rect(rect), self.parent.screen.subsurface(rect))
+        pygame.transform.scale(self.screen, rect.size, self._dest[1])
+
+    def present(self):
+        pass
+
+
+class RendererCanvas(Canvas):
+    """Холст поверх аппаратного рендерера SDL2"""
+
+    def __init__(self, renderer, font_getter: FontGetter, cell_size: int):
+        super().__init__(font_getter, cell_size)
+        self.renderer = renderer
+
+    def get_size(self) -> Tuple[int, int]:
+        logical_size = self.renderer.logical_size
+        if logical_size[0] and logical_size[1]:
+            return logical_size
+        return self.renderer.get_viewport().size
+
+    def fill(self, color: Color):
+        self.renderer.draw_color = color + (255,)
+        self.renderer.clear()
+
+    def draw_rect(self, rect: pygame.Rect, color: Color, width: int = 0):
+        self.renderer.draw_color = color + (255,)
+        if width:
+            self.renderer.draw_rect(rect)
+        else:
+            self.renderer.fill_rect(rect)
+
+    def fill_alpha(self, rect: pygame.Rect, color: Color, alpha: int):
+        self.renderer.draw_blend_mode = pygame.BLENDMODE_BLEND
+        self.renderer.draw_color = color + (alpha,)
+        self.renderer.fill_rect(rect)
+        self.renderer.draw_blend_mode = pygame.BLENDMODE_NONE
+
+    def _make_image(self, surface: pygame.Surface):
+        from pygame._sdl2 import video
+        return video.Texture.from_surface(self.renderer, surface)
+
+    def _blit_image(self, image, rect: pygame.Rect):
+        image.draw(dstrect=rect)
+
+
+class SDL2Backend:
+    """Отрисовка через pygame._sdl2.video: Renderer и текстуры"""
+
+    name = "sdl2"
+
+    def __init__(self, size: Tuple[int, int], font_getter: FontGetter, cell_size: int,
+                 title: str = "Clever Snake", accelerated: bool = True):
+        self._open_window(size, title, accelerated)
+        self.canvas = RendererCanvas(self.renderer, font_getter, cell_size)
+        self.screen = None
+        self.board_size: Optional[Tuple[int, int]] = None
+
+    def _open_window(self, size: Tuple[int, int], title: str, accelerated: bool):
+        """Создает окно и рендерер"""
+        from pygame._sdl2 import video
+        self.window = video.Window(title, size=size, resizable=True)
+        try:
+            self.renderer = video.Renderer(self.window, accelerated=1 if accelerated else 0, vsync=False)
+        except Exception:
+            # Нет аппаратного рендерера (например, без видеокарты) - берем программный драйвер SDL
+            self.renderer = video.Renderer(self.window, accelerated=0)
+
+    def set_size(self, size: Tuple[int, int]):
+        """Меняет размер окна"""
+        self.window.size = size
+
+    def window_resized(self, size: Tuple[int, int]):
+        """Рендерер сам подстраивается под окно"""
+
+    def set_board_size(self, size: Tuple[int, int]):
+        """Задает логический размер поля для новой игры"""
+        self.board_size = size
+
+    def begin_board(self, shake: Tuple[int, int] = (0, 0)) -> Canvas:
+        # Масштабирование поля в окно с сохранением пропорций выполняет сам рендерер
+        self.renderer.logical_size = self.board_size
+        if shake != (0, 0):
+            # Область вывода задается в координатах поля
+            self.renderer.set_viewport(pygame.Rect(shake, self.board_size))
+        return self.canvas
+
+    def end_board(self):
+        self.renderer.set_viewport(None)
+        self.renderer.logical_size = (0, 0)
+
+    def frame_surface(self) -> pygame.Surface:
+        """Готовый кадр (для записи): читается из рендерера до present()"""
+        return self.renderer.to_surface()
+
+    def present(self):
+        self.renderer.present()
+
+
+class SDL2Viewport(SDL2Backend):
+    """Участок окна бэкенда sdl2: игра рисует в текстуру-цель, видеокарта выводит ее в часть окна"""
+
+    def __init__(self, parent: SDL2Backend, size: Tuple[int, int]):
+        self.parent = parent
+        self.target = None
+        super().__init__(size, parent.canvas.font_getter, parent.canvas.cell_size)
+        self.canvas.share_caches(parent.canvas)  # Текстуры общие: рендерер один
+
+    def _open_window(self, size: Tuple[int, int], title: str, accelerated: bool):
+        """Окно и рендерер - хозяина, своя только текстура-цель"""
+        self.window = self.parent.window
+        self.renderer = self.parent.renderer
+        self.set_size(size)
+
+    def set_size(self, size: Tuple[int, int]):
+        """Меняет размер закадрового экрана; окно принадлежит хозяину"""
+        from pygame._sdl2 import video
+        self.target = video.Texture(self.renderer, size, target=True)
+
+    def window_resized(self, size: Tuple[int, int]):
+        pass
+
+    def begin_view(self):
+        """Дальше игра рисует в свою текстуру (логический размер поля действует внутри нее)"""
+        self.renderer.target = self.target
+
+    def end_view(self):
+        self.renderer.target = None
+
+    def draw_into(self, rect: pygame.Rect):
+        self.target.draw(dstrect=rect)
+
+    def present(self):
+        pass
+
+
+BACKENDS = ("software", "sdl2")
+
+
+def create_backend(name: str, size: Tuple[int, int], font_getter: FontGetter, cell_size: int,
+                   title: str = "Clever Snake"):
+    """Создает бэкенд по имени; при ошибке возвращается программный бэкенд"""
+    if name == "sdl2":
+        try:
+            return SDL2Backend(size, font_getter, cell_size, title)
+        except Exception as e:
+            print(f"⚠ Рендерер SDL2 недоступен ({e}), используется программная отрисовка")
+    backend = SoftwareBackend(size, font_getter, cell_size)
+    pygame.display.set_caption(title)
+    return backend
+
+
+def create_viewport(parent, size: Tuple[int, int]):
+    """Участок окна бэкенда parent с закадровым экраном размера size"""
+    if isinstance(parent, SDL2Backend):
+        return SDL2Viewport(parent, size)
+    return SoftwareViewport(parent, size)
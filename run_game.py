@@ -29,17 +29,13 @@ def check_pygame():
         return False
 
 def check_korean_fonts():
-    """Проверяет доступность корейских шрифтов"""
+    """Проверяет доступность корейских шрифтов по индексу шрифтов"""
     try:
-        import pygame
-        pygame.font.init()
-        
-        # Проверяем системный шрифт
-        test_font = pygame.font.Font(None, 12)
-        test_surface = test_font.render("한글", True, (255, 255, 255))
-        
-        if test_surface.get_width() > 0:
-            print("✓ Корейские шрифты доступны")
+        from font_index import load_index, required_scripts
+
+        path = load_index().best_font(required_scripts("ru"))
+        if path:
+            print(f"✓ Корейские шрифты доступны: {os.path.basename(path)}")
             return True
         else:
             print("⚠ Корейские шрифты не найдены")
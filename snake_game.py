@@ -13,10 +13,32 @@ if sys.platform.startswith('win'):
     os.environ['PYTHONIOENCODING'] = 'utf-8'
 
 import pygame
-import random
 import json
+import time
+import getpass
 from enum import Enum
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, Tuple, Optional, Dict, Any, Collection
+
+from localization import BUILTIN_NAMES, Localization, T
+from content_loader import ContentLoader
+from content_server import PACK_TARGETS, Content, PackClient
+from render_backends import BACKENDS, Canvas, create_backend, create_viewport
+from stats_store import StatsStore
+from telemetry import FRAME_OUTLIER_MS, Telemetry
+from effects import Effects
+from heatmaps import HeatmapStore, HeatRecorder, open_store as open_heatmaps
+from text_layout import Label
+from capture import CAPTURE_FPS, FORMATS as CAPTURE_FORMATS, FrameCapture
+from controls import JOYSTICK_EVENTS, MAX_PLAYERS, Action, InputManager
+from split_screen import SplitScreen
+from levels import LevelMap, list_levels, load_level
+from font_index import FontIndex, load_index, required_scripts
+from tick_scheduler import DEFAULT_DIFFICULTY, DIFFICULTY_PROFILES, TickScheduler
+from timing_wheel import TimingWheel
+from modes import GameModePlugin, available_modes, load_mode
+from entities import (BLACK, BLUE, DARK_GREEN, GRAY, GREEN, GRID_SIZE, LIGHT_GRAY, ORANGE, PURPLE, RED,
+                      TURN_MAX_AGE, TURN_QUEUE_SIZE, WALL_COLOR, WHITE, YELLOW, Apple, ApplePool, Direction,
+                      Language, QuizApple, QuizQuestion, Snake, WordApple)
 
 # Инициализация Pygame
 pygame.init()
@@ -34,36 +56,13 @@ except:
 # Настройка pygame для поддержки Unicode
 pygame.font.init()
 
-def setup_korean_fonts():
-    """Настраивает корейские шрифты для всех платформ"""
+def setup_korean_fonts(index: Optional[FontIndex] = None) -> bool:
+    """Сообщает, есть ли в системе шрифт с корейскими символами (по индексу шрифтов)"""
     try:
-        # Пробуем разные способы проверки корейских шрифтов
-        test_fonts = []
-        
-        # Пробуем системный шрифт через SysFont
-        try:
-            test_fonts.append(pygame.font.SysFont(None, 12))
-        except:
-            pass
-        
-        # Пробуем системный шрифт через Font
-        try:
-            test_fonts.append(pygame.font.Font(None, 12))
-        except:
-            pass
-        
-        # Проверяем каждый доступный шрифт
-        korean_supported = False
-        for test_font in test_fonts:
-            try:
-                test_surface = test_font.render("한글", True, (255, 255, 255))
-                if test_surface.get_width() > 0:
-                    korean_supported = True
-                    break
-            except:
-                continue
-
-        if not korean_supported:
+        if index is None:
+            index = load_index(FONT_INDEX_PATH)
+        path = index.best_font(("hangul",))
+        if path is None:
             # Корейские символы не поддерживаются, выводим предупреждение
             print("⚠ Предупреждение: Корейские шрифты не найдены на системе.")
             print("Для корректного отображения корейских символов установите:")
@@ -71,105 +70,60 @@ def setup_korean_fonts():
             print("- macOS: Korean fonts через System Preferences")
             print("- Linux: sudo apt-get install fonts-nanum fonts-noto-cjk")
             return False
-        else:
-            print("✓ Корейские шрифты доступны")
+        print(f"✓ Корейские шрифты доступны: {os.path.basename(path)}")
         return True
     except Exception as e:
         print(f"⚠ Ошибка при настройке корейских шрифтов: {e}")
         print("Попробуйте установить корейские шрифты вручную")
         return False
 
-# Инициализация корейских шрифтов
-setup_korean_fonts()
-
-# Список корейских шрифтов для корректного отображения
-KOREAN_FONTS = [
-    # Windows шрифты
-    "Malgun Gothic",  # Windows 10/11
-    "맑은 고딕",  # Korean name
-    "Gulim",  # Windows Korean font
-    "굴림",  # Korean name
-    "Dotum",  # Windows Korean font
-    "돋움",  # Korean name
-    "Batang",  # Windows Korean font
-    "바탕",  # Korean name
-    "Arial Unicode MS",  # Cross-platform
-    # Linux шрифты
-    "Noto Sans CJK KR",  # Google Noto font (Linux)
-    "Nanum Gothic",  # Linux Korean font
-    "NanumBarunGothic",  # Linux Korean font
-    "Nanum Myeongjo",  # Linux Korean font
-    "DejaVu Sans",  # Linux fallback
-    "Liberation Sans",  # Linux fallback
-    # macOS шрифты
-    "AppleGothic",  # macOS
-    "Apple SD Gothic Neo",  # macOS
-    # Общие fallback
-    "Helvetica",  # Fallback
-    "Arial"  # Fallback
-]
+# Найденный шрифт: ("sysfont" | "font", имя или путь). None - поиск еще не завершен
+_korean_font_spec: Optional[Tuple[str, Optional[str]]] = None
+# Индекс шрифтов, когда он построен: по нему шрифт подбирается заново при смене языка интерфейса
+_font_index: Optional[FontIndex] = None
+# Кэш шрифтов по размеру для шрифта _font_cache_spec; очищается, когда выбран другой шрифт
+_font_cache: Dict[int, pygame.font.Font] = {}
+_font_cache_spec: Optional[Tuple[str, Optional[str]]] = None
+
+def discover_korean_font(index: Optional[FontIndex] = None, lang: str = "ru") -> Tuple[str, Optional[str]]:
+    """Выбирает шрифт с корейскими символами и письменностью языка интерфейса lang по индексу шрифтов"""
+    global _korean_font_spec, _font_index
+    try:
+        if index is None:
+            index = load_index(FONT_INDEX_PATH)
+        _font_index = index
+        path = index.best_font(required_scripts(lang))
+    except Exception as e:
+        print(f"⚠ Не удалось построить индекс шрифтов: {e}")
+        path = None
+    # Без подходящего шрифта - встроенный шрифт pygame (латиница и кириллица)
+    if _korean_font_spec != ("font", path):
+        _korean_font_spec = ("font", path)
+    return _korean_font_spec
 
 def get_korean_font(size):
     """Получает шрифт с поддержкой корейских символов"""
-    # Сначала пробуем использовать SysFont для лучшей поддержки системных шрифтов
-    for font_name in KOREAN_FONTS:
+    global _font_cache_spec
+    spec = _korean_font_spec
+    # Вызывается для каждой надписи в каждом кадре: ключ - само число, без кортежа
+    font = _font_cache.get(size)
+    if font is not None and _font_cache_spec is spec:
+        return font
+    if _font_cache_spec is not spec:
+        _font_cache.clear()
+        _font_cache_spec = spec
+
+    if spec is None:
+        # Поиск шрифта еще идет - временно используем встроенный шрифт pygame
+        font = pygame.font.Font(None, size)
+    else:
+        kind, name = spec
         try:
-            # Используем SysFont вместо Font для лучшей поддержки системных шрифтов
-            font = pygame.font.SysFont(font_name, size)
-            # Проверяем, поддерживает ли шрифт корейские символы
-            test_surface = font.render("한글", True, (255, 255, 255))
-            if test_surface.get_width() > 0:
-                return font
+            font = pygame.font.SysFont(name, size) if kind == "sysfont" else pygame.font.Font(name, size)
         except:
-            try:
-                # Пробуем также через Font
-                font = pygame.font.Font(font_name, size)
-                test_surface = font.render("한글", True, (255, 255, 255))
-                if test_surface.get_width() > 0:
-                    return font
-            except:
-                continue
-
-    # Пробуем найти корейские шрифты в списке доступных системных шрифтов
-    try:
-        available_fonts = pygame.font.get_fonts()
-        # Ищем шрифты, которые могут содержать корейские символы
-        korean_keywords = ['nanum', 'noto', 'malgun', 'gulim', 'dotum', 'batang', 'gothic', 'arial']
-        for font_name in available_fonts:
-            if any(keyword in font_name.lower() for keyword in korean_keywords):
-                try:
-                    font = pygame.font.SysFont(font_name, size)
-                    test_surface = font.render("한글", True, (255, 255, 255))
-                    if test_surface.get_width() > 0:
-                        return font
-                except:
-                    continue
-    except:
-        pass
-
-    # Пробуем системный шрифт через SysFont
-    try:
-        system_font = pygame.font.SysFont(None, size)
-        test_surface = system_font.render("한글", True, (255, 255, 255))
-        if test_surface.get_width() > 0:
-            return system_font
-    except:
-        pass
-
-    # Пробуем системный шрифт через Font
-    try:
-        system_font = pygame.font.Font(None, size)
-        test_surface = system_font.render("한글", True, (255, 255, 255))
-        if test_surface.get_width() > 0:
-            return system_font
-    except:
-        pass
-
-    # В крайнем случае используем системный шрифт без проверки
-    try:
-        return pygame.font.SysFont(None, size)
-    except:
-        return pygame.font.Font(None, size)
+            font = pygame.font.Font(None, size)
+    _font_cache[size] = font
+    return font
 
 # Константы
 RESOLUTIONS = {
@@ -181,661 +135,353 @@ RESOLUTIONS = {
 }
 
 DEFAULT_RESOLUTION = "1000x700"
+SPLIT_RESOLUTION = "800x600"  # Экран каждой игры на разделенном экране (вписывается в свою часть окна)
+
+# Пути к внешним данным
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+LANG_DIR = os.path.join(BASE_DIR, "lang")  # Дополнительные языки интерфейса и правки переводов
+LEVELS_DIR = os.path.join(BASE_DIR, "levels")  # Карты уровней со стенами
+DATA_DIR = os.path.join(os.path.expanduser("~"), ".clever_snake")  # Кэши и сохранения
+CACHE_DIR = os.path.join(DATA_DIR, "cache")
+STATS_PATH = os.path.join(DATA_DIR, "stats.sqlite3")
+FONT_INDEX_PATH = os.path.join(CACHE_DIR, "font_index.json")  # Покрытие письменностей установленными шрифтами
+BINDINGS_PATH = os.path.join(DATA_DIR, "bindings.json")  # Переопределенные привязки клавиш и кнопок
+
+def _default_player() -> str:
+    """Имя игрока для статистики: переменная CLEVER_SNAKE_PLAYER или имя пользователя ОС"""
+    try:
+        return os.environ.get("CLEVER_SNAKE_PLAYER") or getpass.getuser()
+    except Exception:
+        return "player"
+
 WINDOW_WIDTH, WINDOW_HEIGHT = RESOLUTIONS[DEFAULT_RESOLUTION]
-GRID_SIZE = 20
 GRID_WIDTH = WINDOW_WIDTH // GRID_SIZE
 GRID_HEIGHT = WINDOW_HEIGHT // GRID_SIZE
 
-# Цвета
-BLACK = (0, 0, 0)
-WHITE = (255, 255, 255)
-GREEN = (0, 255, 0)
-RED = (255, 0, 0)
-BLUE = (0, 0, 255)
-YELLOW = (255, 255, 0)
-PURPLE = (128, 0, 128)
-ORANGE = (255, 165, 0)
-GRAY = (50, 50, 50)
-LIGHT_GRAY = (200, 200, 200)
-DARK_GREEN = (0, 150, 0)
-
-class GameMode(Enum):
-    CLASSIC = 1
-    QUIZ = 2
-    WORD_COLLECTION = 3
-
-class Language(Enum):
-    RUSSIAN = "ru"
-    ENGLISH = "en"
-    KOREAN = "ko"
-
-class Direction(Enum):
-    UP = (0, -1)
-    DOWN = (0, 1)
-    LEFT = (-1, 0)
-    RIGHT = (1, 0)
-
-class Localization:
-    def __init__(self):
-        self.current_lang = Language.RUSSIAN
-        self.translations = self._load_translations()
-
-    def _load_translations(self) -> Dict[str, Dict[str, str]]:
-        """Загружает переводы из файла локализации"""
-        translations = {
-            "ru": {
-                "title": "Clever Snake",
-                "classic_mode": "Классическая змейка",
-                "quiz_mode": "Викторина",
-                "word_mode": "Змейка со словами",
-                "play": "Играть",
-                "settings": "Настройки",
-                "exit": "Выход",
-                "score": "Счет",
-                "pause": "Пауза",
-                "resume": "Продолжить",
-                "game_over": "Игра окончена",
-                "final_score": "Финальный счет",
-                "restart": "Перезапустить",
-                "back_to_menu": "В главное меню",
-                "language": "Язык",
-                "interface_lang": "Язык интерфейса",
-                "game_lang": "Язык игры",
-                "resolution": "Разрешение экрана",
-                "question": "Вопрос",
-                "answer": "Ответ",
-                "correct": "Правильно!",
-                "wrong": "Неправильно!",
-                "collect_word": "Соберите слово",
-                "word": "Слово",
-                "controls": "Управление",
-                "up": "Вверх - W",
-                "down": "Вниз - S",
-                "left": "Влево - A",
-                "right": "Вправо - D",
-                "pause_key": "Пауза - C",
-                "resume_key": "Продолжить - V",
-                "quit_key": "Выход - Q"
-            },
-            "en": {
-                "title": "Clever Snake",
-                "classic_mode": "Classic Snake",
-                "quiz_mode": "Quiz",
-                "word_mode": "Snake with Words",
-                "play": "Play",
-                "settings": "Settings",
-                "exit": "Exit",
-                "score": "Score",
-                "pause": "Pause",
-                "resume": "Resume",
-                "game_over": "Game Over",
-                "final_score": "Final Score",
-                "restart": "Restart",
-                "back_to_menu": "Back to Menu",
-                "language": "Language",
-                "interface_lang": "Interface Language",
-                "game_lang": "Game Language",
-                "resolution": "Screen Resolution",
-                "question": "Question",
-                "answer": "Answer",
-                "correct": "Correct!",
-                "wrong": "Wrong!",
-                "collect_word": "Collect the word",
-                "word": "Word",
-                "controls": "Controls",
-                "up": "Up - W",
-                "down": "Down - S",
-                "left": "Left - A",
-                "right": "Right - D",
-                "pause_key": "Pause - C",
-                "resume_key": "Resume - V",
-                "quit_key": "Quit - Q"
-            },
-            "ko": {
-                "title": "클리버 스네이크",
-                "classic_mode": "클래식 뱀",
-                "quiz_mode": "퀴즈",
-                "word_mode": "단어 뱀",
-                "play": "플레이",
-                "settings": "설정",
-                "exit": "종료",
-                "score": "점수",
-                "pause": "일시정지",
-                "resume": "계속",
-                "game_over": "게임 오버",
-                "final_score": "최종 점수",
-                "restart": "다시 시작",
-                "back_to_menu": "메뉴로 돌아가기",
-                "language": "언어",
-                "interface_lang": "인터페이스 언어",
-                "game_lang": "게임 언어",
-                "resolution": "화면 해상도",
-                "question": "문제",
-                "answer": "답",
-                "correct": "정답!",
-                "wrong": "오답!",
-                "collect_word": "단어를 모으세요",
-                "word": "단어",
-                "controls": "조작법",
-                "up": "위 - W",
-                "down": "아래 - S",
-                "left": "왼쪽 - A",
-                "right": "오른쪽 - D",
-                "pause_key": "일시정지 - C",
-                "resume_key": "계속 - V",
-                "quit_key": "종료 - Q"
-            }
-        }
-        return translations
-
-    def get_text(self, key: str) -> str:
-        """Получает переведенный текст"""
-        return self.translations.get(self.current_lang.value, {}).get(key, key)
-
-    def set_language(self, lang: Language):
-        """Устанавливает язык"""
-        self.current_lang = lang
-
-class Snake:
-    def __init__(self, x: int, y: int, grid_width: int, grid_height: int):
-        self.body = [(x, y)]
-        self.direction = Direction.RIGHT
-        self.grow_pending = False
-        self.grid_width = grid_width
-        self.grid_height = grid_height
-
-    def move(self):
-        """Двигает змейку"""
-        head_x, head_y = self.body[0]
-        dx, dy = self.direction.value
-        new_head = (head_x + dx, head_y + dy)
-
-        # Проверка выхода за границы (телепортация) — используем размеры текущего поля
-        new_head = (new_head[0] % self.grid_width, new_head[1] % self.grid_height)
-
-        self.body.insert(0, new_head)
-
-        if not self.grow_pending:
-            self.body.pop()
-        else:
-            self.grow_pending = False
-
-    def grow(self):
-        """Увеличивает змейку"""
-        self.grow_pending = True
-
-    def change_direction(self, new_direction: Direction):
-        """Изменяет направление змейки"""
-        # Предотвращает движение в противоположном направлении
-        if (self.direction == Direction.UP and new_direction == Direction.DOWN) or \
-           (self.direction == Direction.DOWN and new_direction == Direction.UP) or \
-           (self.direction == Direction.LEFT and new_direction == Direction.RIGHT) or \
-           (self.direction == Direction.RIGHT and new_direction == Direction.LEFT):
-            return
-        self.direction = new_direction
-
-    def check_collision(self) -> bool:
-        """Проверяет столкновение с собой"""
-        head = self.body[0]
-        return head in self.body[1:]
-
-    def draw(self, screen: pygame.Surface):
-        """Отрисовывает змейку"""
-        for i, (x, y) in enumerate(self.body):
-            color = DARK_GREEN if i == 0 else GREEN
-            rect = pygame.Rect(x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE)
-            pygame.draw.rect(screen, color, rect)
-            pygame.draw.rect(screen, BLACK, rect, 1)
-
-class Apple:
-    def __init__(self, grid_width: int, grid_height: int):
-        self.grid_width = grid_width
-        self.grid_height = grid_height
-        self.position = self.generate_position()
-        self.color = RED
-
-    def generate_position(self) -> Tuple[int, int]:
-        """Генерирует случайную позицию для яблока"""
-        return (random.randint(0, self.grid_width - 1), random.randint(0, self.grid_height - 1))
-
-    def respawn(self, snake_body: List[Tuple[int, int]]):
-        """Перемещает яблоко в новую позицию"""
-        while True:
-            self.position = self.generate_position()
-            if self.position not in snake_body:
-                break
-
-    def draw(self, screen: pygame.Surface):
-        """Отрисовывает яблоко"""
-        x, y = self.position
-        rect = pygame.Rect(x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE)
-        pygame.draw.rect(screen, self.color, rect)
-        pygame.draw.rect(screen, BLACK, rect, 1)
-
-class QuizApple(Apple):
-    def __init__(self, grid_width: int, grid_height: int, question: str, correct_answer: str, wrong_answers: List[str], answer_number: int):
-        super().__init__(grid_width, grid_height)
-        self.question = question
-        self.correct_answer = correct_answer
-        self.wrong_answers = wrong_answers
-        self.answer_number = answer_number  # Номер ответа (1, 2, 3, 4)
-        self.color = RED  # Все яблоки красные
-
-    def get_answers(self) -> List[str]:
-        """Возвращает перемешанные ответы"""
-        answers = [self.correct_answer] + self.wrong_answers
-        random.shuffle(answers)
-        return answers
-
-    def draw(self, screen: pygame.Surface):
-        """Отрисовывает яблоко с номером ответа"""
-        super().draw(screen)
-        font = get_korean_font(24)
-        text = font.render(str(self.answer_number), True, WHITE)
-        text_rect = text.get_rect(center=(self.position[0] * GRID_SIZE + GRID_SIZE // 2,
-                                        self.position[1] * GRID_SIZE + GRID_SIZE // 2))
-        screen.blit(text, text_rect)
-
-class WordApple(Apple):
-    def __init__(self, grid_width: int, grid_height: int, letter: str, is_correct: bool = False):
-        super().__init__(grid_width, grid_height)
-        self.letter = letter
-        self.is_correct = is_correct
-        self.color = RED  # Все яблоки одного цвета, чтобы не выдавать правильную букву
-
-    def draw(self, screen: pygame.Surface):
-        """Отрисовывает яблоко с буквой"""
-        super().draw(screen)
-        font = get_korean_font(24)
-        text = font.render(self.letter, True, WHITE)
-        text_rect = text.get_rect(center=(self.position[0] * GRID_SIZE + GRID_SIZE // 2,
-                                        self.position[1] * GRID_SIZE + GRID_SIZE // 2))
-        screen.blit(text, text_rect)
+def open_stats() -> Optional[StatsStore]:
+    """Открывает базу статистики; если она недоступна, игра работает без нее"""
+    stats = StatsStore(STATS_PATH)
+    try:
+        stats.start()
+    except Exception as e:
+        print(f"⚠ Статистика отключена: {e}")
+        return None
+    return stats
+
+class GameMode(str, Enum):
+    """Встроенные режимы; значение - имя модуля режима в пакете modes/ (там могут быть и другие)"""
+    CLASSIC = "classic"
+    QUIZ = "quiz"
+    WORD_COLLECTION = "word_collection"
+
+# Названия встроенных режимов в меню; остальные режимы показываются под своим title или именем модуля
+MODE_TITLES = {
+    GameMode.CLASSIC.value: T.CLASSIC_MODE,
+    GameMode.QUIZ.value: T.QUIZ_MODE,
+    GameMode.WORD_COLLECTION.value: T.WORD_MODE,
+}
+MENU_MODE_KEYS = (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, pygame.K_5,
+                  pygame.K_6, pygame.K_7, pygame.K_8, pygame.K_9)
+# Причины конца игры (Game._end_game) и экран, который после нее показывается
+END_REASONS = {
+    "collision": "game_over",       # Змейка врезалась в стену или в себя
+    "wrong_answer": "game_over",    # Съедено яблоко с неверным ответом или буквой
+    "board_full": "game_over",      # Для яблок не осталось свободных клеток
+    "quiz_completed": "quiz_completed",
+}
 
 class Game:
-    def __init__(self):
-        self.current_resolution = DEFAULT_RESOLUTION
+    def __init__(self, renderer: str = "software", telemetry: Optional[Telemetry] = None,
+                 lang_reload: bool = False, difficulty: str = DEFAULT_DIFFICULTY, level: str = "classic",
+                 input_rate: float = 0.0, capture: Optional[FrameCapture] = None, effects: bool = True,
+                 resolution: str = DEFAULT_RESOLUTION, backend=None, content: Optional[ContentLoader] = None,
+                 stats: Optional[StatsStore] = None, input_manager: Optional[InputManager] = None,
+                 player: Optional[str] = None, packs: Optional[PackClient] = None,
+                 heatmaps: Optional[HeatmapStore] = None):
+        self.current_resolution = resolution
         self.window_width, self.window_height = RESOLUTIONS[self.current_resolution]
         self.grid_width = self.window_width // GRID_SIZE
         self.grid_height = self.window_height // GRID_SIZE
-        self.screen = pygame.display.set_mode((self.window_width, self.window_height))
-        pygame.display.set_caption("Clever Snake")
-        self.clock = pygame.time.Clock()
-        self.localization = Localization()
-        self.interface_lang = Language.RUSSIAN
+        # Бэкенд отрисовки: программный (по умолчанию) или аппаратный SDL2;
+        # на разделенном экране - участок общего окна (render_backends.create_viewport)
+        self.backend = backend or create_backend(renderer, (self.window_width, self.window_height),
+                                                 get_korean_font, GRID_SIZE, "Clever Snake")
+        self.canvas = self.backend.canvas
+        # Игровое поле сессии: размер фиксируется при старте игры и не зависит от окна
+        self.board_width = self.grid_width
+        self.board_height = self.grid_height
+        # Карта уровня: classic - пустое поле, box - поле со стенами по краям, остальные - из папки levels/
+        self.level_names = ["classic", "box"] + list_levels(LEVELS_DIR)
+        self.level_name = level if level in self.level_names else "classic"
+        self.level: Optional[LevelMap] = None
+        self._wall_cells: List[Tuple[Any, pygame.Rect]] = []
+        self._wall_sprite = None
+        # Строки и прямоугольники, которые выводятся каждый кадр, создаются один раз
+        self._score_label = Label()
+        self._final_score_label = Label()
+        self._screen_rect = pygame.Rect(0, 0, self.window_width, self.window_height)
+        # Надписи меню и экранов конца игры с позициями: (текст, размер, цвет, центр).
+        # Собираются заново при смене размера окна, языка или списка режимов (None - собрать)
+        self._menu_items: Optional[List[Tuple[str, int, Tuple[int, int, int], Tuple[int, int]]]] = None
+        self._menu_pending: Optional[str] = None  # Режим в ожидании контента, с которым собрано меню
+        self._end_items: Optional[Dict[str, List[Tuple[str, int, Tuple[int, int, int], Tuple[int, int]]]]] = None
+        # Полоса загрузки в меню: прямоугольники и подпись меняются только с прогрессом
+        self._loading_rect = pygame.Rect(0, 0, 0, 12)
+        self._loading_fill = pygame.Rect(0, 0, 0, 0)
+        self._loading_center = (0, 0)
+        self._loading_progress = (-1, -1)
+        self._loading_text = ""
+        # Скорость змейки задается профилем сложности, отрисовка идет с постоянной частотой
+        self.difficulty = DIFFICULTY_PROFILES[difficulty]
+        self.scheduler = TickScheduler(self.difficulty.base_rate, poll_rate=input_rate)
+        # Отложенные события игры (подсказки, переезд яблок); идут только во время игры и не на паузе
+        self.timers = TimingWheel()
+        # Частицы, вспышки и тряска поля; считаются по времени кадра
+        self.effects = Effects(GRID_SIZE) if effects else None
+        self._last_board_frame = time.perf_counter()
+        self._last_step = self._last_board_frame
+        # Клавиатура и геймпады; опрашиваются циклом перед каждым тиком (и с частотой input_rate)
+        self.input = input_manager or InputManager(BINDINGS_PATH)
+        self.input_player: Optional[int] = None  # Чьи действия принимает игра (None - всех игроков)
+        # Строки интерфейса: texts[T.PLAY]; список заменяется при смене языка и перезагрузке переводов
+        self.localization = Localization(LANG_DIR, hot_reload=lang_reload)
+        self.texts = self.localization.texts
+        self.interface_lang = Language.RUSSIAN  # Язык контента для интерфейса (слова для отображения)
+        self.localization.add_listener(self._on_language_changed)
         self.game_lang = Language.RUSSIAN
         self.running = True
         self.current_screen = "menu"
-        self.game_mode = None
+        # Режимы - модули пакета modes/; модуль импортируется при первом выборе режима
+        self.mode_names = available_modes()[:len(MENU_MODE_KEYS)]
+        self.modes: Dict[str, GameModePlugin] = {}  # Загруженные режимы этой игры
+        self.mode: Optional[GameModePlugin] = None  # Текущий режим
+        self.game_mode: Optional[str] = None  # Имя текущего режима
+        self.pending_mode: Optional[str] = None  # Выбран, но его контент еще загружается
+        self._pending_content: List[Tuple[GameModePlugin, str]] = []  # Еще не переданные режимам результаты
         self.snake = None
-        self.apple = None
         self.score = 0
         self.paused = False
-        self.quiz_questions = self._load_quiz_questions()
-        self.word_targets = self._load_word_targets()
-        self.current_word = ""  # Слово на языке интерфейса (для отображения)
-        self.current_word_game_lang = ""  # Слово на языке игры (для сбора букв)
-        self.collected_letters = []
-        self.quiz_question = None
-        self.quiz_answers = []
-        self.quiz_correct_answer = ""
-        self.quiz_correct_number = 0  # Номер правильного ответа
-        self.quiz_apples = []  # Список яблок с номерами ответов
-        self.word_apples: List[WordApple] = [] # Список яблок для режима сбора слов
-        self.quiz_result = None
-        self.quiz_result_timer = 0
-        self.used_questions = []  # Список использованных вопросов
-        self.quiz_completed = False  # Флаг завершения викторины
+        # Шрифты загружаются в фоне, меню появляется сразу; контент режима - в фоне при его выборе.
+        # Несколько игр в одном окне делят загрузчик: шрифты и контент режимов грузятся один раз
+        self._owns_content = content is None
+        self.content = content or ContentLoader()
+        self.content.submit_once("fonts", self._load_fonts)
+        # Пакеты вопросов и слов с пульта учителя; подменяют контент режима между раундами
+        self.packs = packs
+        self._applied_packs: Dict[str, Content] = {}  # Режим -> контент пакетов, уже переданный режиму
+        # Тепловые карты необязательны (нужен NumPy); раунд пишет клетки головы в буфер своей записи
+        self.heatmaps = heatmaps
+        self.heat: Optional[HeatRecorder] = None
+        self._last_eat_tick = 0  # Тик колеса таймеров, когда съедено прошлое яблоко
+        # Статистика пишется в фоне пачками; если база недоступна, игра работает без нее
+        self.player = player or _default_player()
+        self._owns_stats = stats is None
+        self.stats: Optional[StatsStore] = stats or open_stats()
+        # Телеметрия необязательна: при None события не формируются вовсе
+        self.telemetry = telemetry
+        # Запись кадров тоже необязательна; кадры кодирует фоновый поток
+        self.capture = capture
+        self.game_started_at = 0.0
+        self.leaderboard_mode: str = GameMode.CLASSIC.value
+        self.leaderboard_rows: List[Tuple[str, int, str, float]] = []
+        self.words_completed = 0
+        self.apple_pool = ApplePool()  # Яблоки режимов переиспользуются между раскладами
 
     def change_resolution(self, resolution: str):
         """Изменяет разрешение экрана"""
         if resolution in RESOLUTIONS:
             self.current_resolution = resolution
-            self.window_width, self.window_height = RESOLUTIONS[resolution]
-            self.grid_width = self.window_width // GRID_SIZE
-            self.grid_height = self.window_height // GRID_SIZE
-            self.screen = pygame.display.set_mode((self.window_width, self.window_height))
+            self.backend.set_size(RESOLUTIONS[resolution])
+            self._on_window_resized(*RESOLUTIONS[resolution])
             return True
         return False
 
-    def _load_quiz_questions(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Загружает вопросы для викторины"""
-        return {
-            "ru": [
-                # Вопросы о Южной Корее
-                {"question": "Как называется главный флаг Южной Кореи?", "correct": "Тхэгыкки", "wrong": ["Восходящее Солнце", "Четыре Дракона", "Звезда и Полумесяц"]},
-                {"question": "Какой цветок является национальным символом Кореи?", "correct": "Мугунхва (Гибискус)", "wrong": ["Сакура (Вишня)", "Лотос", "Роза"]},
-                {"question": "Какое животное считается священным в корейских мифах?", "correct": "Дракон/Тигр", "wrong": ["Единорог", "Змея", "Феникс"]},
-                {"question": "Как называется традиционная корейская одежда?", "correct": "Ханбок", "wrong": ["Кимоно", "Кипао", "Сари"]},
-                {"question": "Какой большой азиатский праздник отмечается осенью в честь сбора урожая?", "correct": "Чхусок", "wrong": ["Соллаль", "Дивали", "Тет"]},
-                {"question": "Как называется традиционное корейское боевое искусство?", "correct": "Тхэквондо", "wrong": ["Каратэ", "Кунг-фу", "Айкидо"]},
-                {"question": "Как называется корейский алфавит?", "correct": "Хангыль", "wrong": ["Кандзи", "Кириллица", "Иероглифы"]},
-                {"question": "Какое самое известное острое блюдо из ферментированной капусты?", "correct": "Кимчи", "wrong": ["Рамен", "Суши", "Пульгоги"]},
-                {"question": "Как называется популярное корейское блюдо из риса, мяса, овощей и острого соуса?", "correct": "Бибимбап", "wrong": ["Кимбап", "Чапчхэ", "Ттокпокки"]},
-                {"question": "Как называют корейские сериалы?", "correct": "Дорамы", "wrong": ["Аниме", "Теленовеллы", "Ситкомы"]},
-
-                # Вопросы об Англии
-                {"question": "Как называется знаменитый дворец в Лондоне, где живет король?", "correct": "Букингемский дворец", "wrong": ["Версаль", "Тауэр", "Виндзорский замок"]},
-                {"question": "Как называется самая известная достопримечательность Лондона — большая башня с часами?", "correct": "Биг-Бен (Башня Елизаветы)", "wrong": ["Эмпайр-стейт-билдинг", "Вестминстер", "Пизанская башня"]},
-                {"question": "Какое животное является национальным символом Англии?", "correct": "Лев", "wrong": ["Орел", "Бык", "Барсук"]},
-                {"question": "Как называется красный автобус с двумя этажами, который можно увидеть в Лондоне?", "correct": "Даблдекер", "wrong": ["Трамвай", "Метро", "Минивэн"]},
-                {"question": "Какое самое известное блюдо из жареной рыбы и картошки?", "correct": "Фиш энд чипс", "wrong": ["Пицца", "Гамбургер", "Плов"]},
-                {"question": "Как называется традиционный английский напиток, который англичане пьют с молоком?", "correct": "Чай", "wrong": ["Кофе", "Сок", "Лимонад"]},
-                {"question": "Как называется древнее сооружение из камней, расположенное на равнине?", "correct": "Стоунхендж", "wrong": ["Пирамиды", "Колизей", "Мачу-Пикчу"]},
-                {"question": "Какой сказочный король собрал вокруг себя рыцарей Круглого стола?", "correct": "Король Артур", "wrong": ["Король Ричард", "Король Лир", "Король Генрих"]},
-                {"question": "Какой вид спорта очень популярен в Англии?", "correct": "Футбол", "wrong": ["Баскетбол", "Бейсбол", "Крикет"]},
-                {"question": "Какую фразу говорят, чтобы пожелать кому-то удачи перед представлением?", "correct": "Break a leg!", "wrong": ["Good luck!", "Nice to meet you!", "See you later!"]},
-
-                # Вопросы о России
-                {"question": "Какое животное является одним из самых известных национальных символов России?", "correct": "Медведь", "wrong": ["Волк", "Лиса", "Олень"]},
-                {"question": "Какой самый большой город и столица России?", "correct": "Москва", "wrong": ["Санкт-Петербург", "Киев", "Казань"]},
-                {"question": "Как называется самая длинная река в Европе, которая протекает через Россию?", "correct": "Волга", "wrong": ["Дон", "Нева", "Обь"]},
-                {"question": "Как называется всемирно известный архитектурный комплекс в Москве, окруженный стенами?", "correct": "Кремль", "wrong": ["Эрмитаж", "Зимний Дворец", "Большой театр"]},
-                {"question": "Как называются расписные деревянные куклы, вложенные одна в другую?", "correct": "Матрешка", "wrong": ["Неваляшка", "Буратино", "Дымковская игрушка"]},
-                {"question": "Какой вид транспорта на тройке лошадей был популярен для зимних путешествий?", "correct": "Тройка (Санки)", "wrong": ["Карета", "Плот", "Дирижабль"]},
-                {"question": "Как называется традиционный русский суп из капусты и мяса?", "correct": "Щи", "wrong": ["Борщ", "Рассольник", "Уха"]},
-                {"question": "Как называются тонкие, круглые лепешки, которые часто едят со сметаной, вареньем или икрой?", "correct": "Блины", "wrong": ["Оладьи", "Пышки", "Лаваш"]},
-                {"question": "Как называется холодный летний суп, который готовят на квасе?", "correct": "Окрошка", "wrong": ["Гаспачо", "Свекольник", "Холодник"]},
-                {"question": "Какой сказочный персонаж умеет летать в ступе и живет в избушке на курьих ножках?", "correct": "Баба-Яга", "wrong": ["Кощей Бессмертный", "Змей Горыныч", "Леший"]},
-                {"question": "Как зовут девушку, которая помогает Деду Морозу и всегда одета в голубое или белое?", "correct": "Снегурочка", "wrong": ["Аленушка", "Василиса", "Снежная Королева"]},
-                {"question": "Какой музыкальный инструмент, похожий на треугольник, является символом русской народной музыки?", "correct": "Балалайка", "wrong": ["Гусли", "Гармонь", "Домра"]}
-            ],
-            "en": [
-                # South Korea Questions
-                {"question": "What is the name of South Korea's main flag?", "correct": "Taegukgi", "wrong": ["Rising Sun", "Four Dragons", "Star and Crescent"]},
-                {"question": "What flower is the national symbol of Korea?", "correct": "Mugunghwa (Rose of Sharon)", "wrong": ["Cherry Blossom (Sakura)", "Lotus", "Rose"]},
-                {"question": "Which animal is considered sacred or symbolic in Korean myths?", "correct": "Dragon/Tiger", "wrong": ["Unicorn", "Snake", "Phoenix"]},
-                {"question": "What is the name of the traditional Korean clothing with bright colors and full skirts?", "correct": "Hanbok", "wrong": ["Kimono", "Qipao", "Sari"]},
-                {"question": "What major Asian holiday is celebrated in the autumn to give thanks for the harvest?", "correct": "Chuseok", "wrong": ["Seollal", "Diwali", "Tet"]},
-                {"question": "What is the name of the traditional Korean martial art that involves a lot of kicking?", "correct": "Taekwondo", "wrong": ["Karate", "Kung Fu", "Aikido"]},
-                {"question": "What is the Korean alphabet called that looks like circles, squares, and sticks?", "correct": "Hangeul", "wrong": ["Kanji", "Cyrillic", "Hieroglyphs"]},
-                {"question": "What is the most famous spicy dish made of fermented cabbage, eaten with almost every meal?", "correct": "Kimchi", "wrong": ["Ramen", "Sushi", "Bulgogi"]},
-                {"question": "What is the popular Korean dish of rice, meat, vegetables, and spicy sauce served in a bowl?", "correct": "Bibimbap", "wrong": ["Gimbap", "Japchae", "Tteokbokki"]},
-                {"question": "What are Korean TV series called?", "correct": "Dramas", "wrong": ["Anime", "Telenovelas", "Sitcoms"]},
-
-                # England Questions
-                {"question": "What is the name of the famous palace in London where the King lives?", "correct": "Buckingham Palace", "wrong": ["Versailles", "The Tower", "Windsor Castle"]},
-                {"question": "What is the most famous landmark in London — the large clock tower?", "correct": "Big Ben (Elizabeth Tower)", "wrong": ["Empire State Building", "Westminster", "Leaning Tower of Pisa"]},
-                {"question": "Which animal is the national symbol of England, often shown on coats of arms?", "correct": "Lion", "wrong": ["Eagle", "Bull", "Badger"]},
-                {"question": "What is the name of the red, two-story bus seen in London?", "correct": "Double-decker", "wrong": ["Tram", "Subway", "Minivan"]},
-                {"question": "What is the most famous dish of deep-fried fish and potatoes, traditionally wrapped in newspaper?", "correct": "Fish and Chips", "wrong": ["Pizza", "Hamburger", "Pilaf"]},
-                {"question": "What is the traditional English drink that people often drink with milk?", "correct": "Tea", "wrong": ["Coffee", "Juice", "Lemonade"]},
-                {"question": "What is the name of the ancient stone structure located on a plain with many legends about it?", "correct": "Stonehenge", "wrong": ["The Pyramids", "The Colosseum", "Machu Picchu"]},
-                {"question": "What legendary king, according to legends, gathered knights of the Round Table around him?", "correct": "King Arthur", "wrong": ["King Richard", "King Lear", "King Henry"]},
-                {"question": "What sport, played with feet and a ball, is very popular in England?", "correct": "Football", "wrong": ["Basketball", "Baseball", "Cricket"]},
-                {"question": "What phrase is said to wish someone good luck before a performance?", "correct": "Break a leg!", "wrong": ["Good luck!", "Nice to meet you!", "See you later!"]},
-
-                # Russia Questions
-                {"question": "Which animal is one of the most famous national symbols of Russia?", "correct": "Bear", "wrong": ["Wolf", "Fox", "Deer"]},
-                {"question": "What is the largest city and capital of Russia?", "correct": "Moscow", "wrong": ["St. Petersburg", "Kyiv", "Kazan"]},
-                {"question": "What is the longest river in Europe that flows through Russia?", "correct": "Volga", "wrong": ["Don", "Neva", "Ob"]},
-                {"question": "What is the world-famous architectural complex in Moscow, surrounded by walls?", "correct": "The Kremlin", "wrong": ["The Hermitage", "The Winter Palace", "The Bolshoi Theatre"]},
-                {"question": "What are the painted wooden dolls, nested one inside the other, called?", "correct": "Matryoshka", "wrong": ["Tumbler doll", "Pinocchio", "Dymkovo toy"]},
-                {"question": "What is the three-horse sled that was popular for winter travel called?", "correct": "Troika (Sled)", "wrong": ["Carriage", "Raft", "Airship"]},
-                {"question": "What is the traditional Russian soup made of cabbage and meat?", "correct": "Shchi", "wrong": ["Borsch", "Rassolnik", "Ukha"]},
-                {"question": "What are the thin, round pancakes often eaten with sour cream, jam, or caviar called?", "correct": "Blini", "wrong": ["Oladyi", "Pyshki", "Lavash"]},
-                {"question": "What is the cold summer soup made with kvass called?", "correct": "Okroshka", "wrong": ["Gazpacho", "Svekólnik", "Kholodnik"]},
-                {"question": "What fairy tale character can fly in a mortar and lives in a hut on chicken legs?", "correct": "Baba Yaga", "wrong": ["Koschei the Deathless", "Zmey Gorynych", "Leshy"]},
-                {"question": "What is the name of the girl who helps Ded Moroz and is always dressed in blue or white?", "correct": "Snegurochka", "wrong": ["Alyonushka", "Vasilisa", "The Snow Queen"]},
-                {"question": "What musical instrument, shaped like a triangle, is a symbol of Russian folk music?", "correct": "Balalaika", "wrong": ["Gusli", "Garmon", "Domra"]}
-            ],
-            "ko": [
-                # 한국 문화 질문
-                {"question": "대한민국의 국기 이름은 무엇인가요?", "correct": "태극기", "wrong": ["떠오르는 태양", "네 마리의 용", "별과 초승달"]},
-                {"question": "한국의 나라를 상징하는 꽃은 무엇인가요?", "correct": "무궁화", "wrong": ["벚꽃", "연꽃", "장미"]},
-                {"question": "한국 신화에서 신성하거나 상징적인 동물은 무엇인가요?", "correct": "용/호랑이", "wrong": ["유니콘", "뱀", "불사조"]},
-                {"question": "화려한 색상과 풍성한 치마가 있는 전통 한국 옷은 무엇이라고 부르나요?", "correct": "한복", "wrong": ["기모노", "치파오", "사리"]},
-                {"question": "가을에 수확에 감사하며 기념하는 큰 명절은 무엇인가요?", "correct": "추석", "wrong": ["설날", "디왈리", "뗏"]},
-                {"question": "발차기 동작이 많은 전통 한국 무술은 무엇인가요?", "correct": "태권도", "wrong": ["가라데", "쿵푸", "아이키도"]},
-                {"question": "동그라미, 네모, 선 모양으로 이루어진 한국의 글자는 무엇인가요?", "correct": "한글", "wrong": ["한자", "키릴 문자", "상형 문자"]},
-                {"question": "거의 모든 식사에 곁들여 먹는 발효된 양배추로 만든 가장 유명하고 매운 음식은 무엇인가요?", "correct": "김치", "wrong": ["라면", "초밥", "불고기"]},
-                {"question": "밥, 고기, 채소, 매운 소스를 그릇에 담아 비벼 먹는 인기 있는 한국 음식은 무엇인가요?", "correct": "비빔밥", "wrong": ["김밥", "잡채", "떡볶이"]},
-                {"question": "한국 TV 드라마 시리즈는 무엇이라고 부르나요?", "correct": "드라마", "wrong": ["애니메이션", "텔레노벨라", "시트콤"]},
-
-                # 영국 문화 질문
-                {"question": "런던에 있는 왕이 사는 유명한 궁궐의 이름은 무엇인가요?", "correct": "버킹엄 궁전", "wrong": ["베르사유", "타워", "윈저 성"]},
-                {"question": "런던에서 가장 유명한 랜드마크인 큰 시계탑은 무엇이라고 부르나요?", "correct": "빅 벤", "wrong": ["엠파이어 스테이트 빌딩", "웨스트민스터", "피사의 사탑"]},
-                {"question": "문장에 자주 등장하는, 영국을 상징하는 동물은 무엇인가요?", "correct": "사자", "wrong": ["독수리", "황소", "오소리"]},
-                {"question": "런던에서 볼 수 있는 두 층짜리 빨간 버스는 무엇이라고 부르나요?", "correct": "이층 버스/더블데커", "wrong": ["전차", "지하철", "미니밴"]},
-                {"question": "튀긴 생선과 감자로 만든, 전통적으로 신문에 싸서 먹던 가장 유명한 음식은 무엇인가요?", "correct": "피시 앤 칩스", "wrong": ["피자", "햄버거", "필라프"]},
-                {"question": "영국 사람들이 우유와 함께 마시는 전통 음료는 무엇인가요?", "correct": "차", "wrong": ["커피", "주스", "레모네이드"]},
-                {"question": "평원에 위치하며 많은 전설이 전해지는, 돌로 만들어진 고대 구조물은 무엇인가요?", "correct": "스톤헨지", "wrong": ["피라미드", "콜로세움", "마추픽추"]},
-                {"question": "전설에 따르면 원탁의 기사들을 모았다고 하는 전설적인 왕은 누구인가요?", "correct": "아더 왕", "wrong": ["리처드 왕", "리어 왕", "헨리 왕"]},
-                {"question": "발을 사용하여 공을 차는 스포츠로, 영국에서 매우 인기 있는 종목은 무엇인가요?", "correct": "축구", "wrong": ["농구", "야구", "크리켓"]},
-                {"question": "공연 전에 누군가에게 행운을 빌어줄 때 하는 말은 무엇인가요?", "correct": "Break a leg!", "wrong": ["Good luck!", "Nice to meet you!", "See you later!"]},
-
-                # 러시아 문화 질문
-                {"question": "러시아의 가장 유명한 국가 상징 중 하나이며 동화에 자주 등장하는 동물은 무엇인가요?", "correct": "곰", "wrong": ["늑대", "여우", "사슴"]},
-                {"question": "러시아의 가장 큰 도시이자 수도는 어디인가요?", "correct": "모스크바", "wrong": ["상트페테르부르크", "키이우", "카잔"]},
-                {"question": "유럽을 가로질러 흐르는 가장 긴 강은 무엇인가요?", "correct": "볼가 강", "wrong": ["돈 강", "네바 강", "오브 강"]},
-                {"question": "벽으로 둘러싸여 있으며 궁전과 성당이 있는 모스크바의 세계적으로 유명한 건축 단지는 무엇인가요?", "correct": "크렘린", "wrong": ["에르미타주", "겨울 궁전", "볼쇼이 극장"]},
-                {"question": "가장 큰 것부터 가장 작은 것까지, 하나 안에 다른 인형들이 들어 있는 칠해진 나무 인형은 무엇이라고 부르나요?", "correct": "마트료시카", "wrong": ["오뚝이 인형", "피노키오", "딤코보 장난감"]},
-                {"question": "세 마리 말이 끄는 썰매는 겨울철 여행에 인기 있는 운송 수단이었습니다. 이것을 무엇이라고 부르나요?", "correct": "트로이카/썰매", "wrong": ["마차", "뗏목", "비행선"]},
-                {"question": "양배추와 고기로 만든 전통 러시아 수프는 무엇인가요?", "correct": "시", "wrong": ["보르시", "라솔니크", "우하"]},
-                {"question": "사워 크림, 잼 또는 캐비어와 함께 자주 먹는 얇고 둥근 팬케이크는 무엇이라고 부르나요?", "correct": "블리니", "wrong": ["올라디", "푸시키", "라바시"]},
-                {"question": "크바스(발효 음료)로 만드는 차가운 여름 수프는 무엇인가요?", "correct": "오크로시카", "wrong": ["가스파초", "스베콜니크", "홀로드니크"]},
-                {"question": "절구통을 타고 날아다니고 닭다리 위에 지어진 오두막에 사는 동화 속 캐릭터는 누구인가요?", "correct": "바바 야가", "wrong": ["코셰이", "즈메이 고리니치", "레시"]},
-                {"question": "데드 모로즈(Ded Moroz, 러시아판 산타클로스)를 돕고 항상 파란색이나 흰색 옷을 입는 소녀의 이름은 무엇인가요?", "correct": "스네구로치카", "wrong": ["알료누시카", "바실리사", "눈의 여왕"]},
-                {"question": "삼각형처럼 생겼으며 러시아 민속 음악의 상징인 악기는 무엇인가요?", "correct": "발랄라이카", "wrong": ["구슬리", "가르몬", "돔라"]}
-            ]
-        }
-
-    RUSSIAN_ALPHABET = "АБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ"
-    ENGLISH_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-    KOREAN_ALPHABET = "ㄱㄴㄷㄹㅁㅂㅅㅇㅈㅊㅋㅌㅍㅎㅏㅑㅓㅕㅗㅛㅜㅠㅡㅣ" # Только основные согласные и гласные
-
-    def _load_word_targets(self) -> Dict[str, List[str]]:
-        """Загружает слова для режима сбора слов"""
-        return {
-            "ru": ["КОД", "ИГРА", "ЗМЕЙКА", "ЯБЛОКО", "ПИТОН", "ПРОГРАММА", "БАБУШКА", "МАМА", "ПАПА", "СЫН", "ДОЧЬ"],
-            "en": ["CODE", "GAME", "SNAKE", "APPLE", "PYTHON", "PROGRAM", "GRANDMA", "MOM", "DAD", "SON", "DAUGHTER"],
-            "ko": ["코드", "게임", "뱀", "사과", "파이썬", "프로그램", "할머니", "엄마", "아빠", "아들", "딸"]
-        }
-
-    def _get_word_translation(self, word: str, from_lang: str, to_lang: str) -> str:
-        """Получает перевод слова из одного языка в другой"""
-        word_dict = {
-            "КОД": {"en": "CODE", "ko": "코드"},
-            "ИГРА": {"en": "GAME", "ko": "게임"},
-            "ЗМЕЙКА": {"en": "SNAKE", "ko": "뱀"},
-            "ЯБЛОКО": {"en": "APPLE", "ko": "사과"},
-            "ПИТОН": {"en": "PYTHON", "ko": "파이썬"},
-            "ПРОГРАММА": {"en": "PROGRAM", "ko": "프로그램"},
-            "БАБУШКА": {"en": "GRANDMA", "ko": "할머니"},
-            "МАМА": {"en": "MOM", "ko": "엄마"},
-            "ПАПА": {"en": "DAD", "ko": "아빠"},
-            "СЫН": {"en": "SON", "ko": "아들"},
-            "ДОЧЬ": {"en": "DAUGHTER", "ko": "딸"},
-            # Обратные переводы
-            "CODE": {"ru": "КОД", "ko": "코드"},
-            "GAME": {"ru": "ИГРА", "ko": "게임"},
-            "SNAKE": {"ru": "ЗМЕЙКА", "ko": "뱀"},
-            "APPLE": {"ru": "ЯБЛОКО", "ko": "사과"},
-            "PYTHON": {"ru": "ПИТОН", "ko": "파이썬"},
-            "PROGRAM": {"ru": "ПРОГРАММА", "ko": "프로그램"},
-            "GRANDMA": {"ru": "БАБУШКА", "ko": "할머니"},
-            "MOM": {"ru": "МАМА", "ko": "엄마"},
-            "DAD": {"ru": "ПАПА", "ko": "아빠"},
-            "SON": {"ru": "СЫН", "ko": "아들"},
-            "DAUGHTER": {"ru": "ДОЧЬ", "ko": "딸"},
-            # Корейские слова
-            "코드": {"ru": "КОД", "en": "CODE"},
-            "게임": {"ru": "ИГРА", "en": "GAME"},
-            "뱀": {"ru": "ЗМЕЙКА", "en": "SNAKE"},
-            "사과": {"ru": "ЯБЛОКО", "en": "APPLE"},
-            "파이썬": {"ru": "ПИТОН", "en": "PYTHON"},
-            "프로그램": {"ru": "ПРОГРАММА", "en": "PROGRAM"},
-            "할머니": {"ru": "БАБУШКА", "en": "GRANDMA"},
-            "엄마": {"ru": "МАМА", "en": "MOM"},
-            "아빠": {"ru": "ПАПА", "en": "DAD"},
-            "아들": {"ru": "СЫН", "en": "SON"},
-            "딸": {"ru": "ДОЧЬ", "en": "DAUGHTER"}
-        }
-        
-        if word in word_dict and to_lang in word_dict[word]:
-            return word_dict[word][to_lang]
-        return word  # Если перевода нет, возвращаем исходное слово
-
-    def _get_random_letter(self, lang: Language) -> str:
-        """Возвращает случайную букву из алфавита выбранного языка"""
-        if lang == Language.RUSSIAN:
-            return random.choice(self.RUSSIAN_ALPHABET)
-        elif lang == Language.ENGLISH:
-            return random.choice(self.ENGLISH_ALPHABET)
-        elif lang == Language.KOREAN:
-            # Для корейского нужны только одиночные символы из алфавита
-            return random.choice(self.KOREAN_ALPHABET)
-        return "" # Дефолтное значение
-
-    def start_game(self, mode: GameMode):
-        """Начинает игру в выбранном режиме"""
-        self.game_mode = mode
-        self.snake = Snake(self.grid_width // 2, self.grid_height // 2, self.grid_width, self.grid_height)
+    def _on_window_resized(self, width: int, height: int):
+        """Обновляет размеры окна; текущая игра продолжается на том же поле"""
+        self.window_width, self.window_height = width, height
+        self._screen_rect.size = (width, height)
+        self._invalidate_screens()
+        # Новый размер сетки применяется со следующей игры
+        self.grid_width = self.window_width // GRID_SIZE
+        self.grid_height = self.window_height // GRID_SIZE
+        if self.telemetry:
+            self.telemetry.emit("resolution_change", width=width, height=height, screen=self.current_screen)
+
+    def _load_fonts(self):
+        """Проверяет и подбирает корейский шрифт (выполняется в фоне)"""
+        index = load_index(FONT_INDEX_PATH)
+        setup_korean_fonts(index)
+        discover_korean_font(index, self.interface_lang.value)
+
+    def _poll_content(self):
+        """Передает режимам результаты фоновой загрузки, как только они готовы"""
+        if not self._pending_content:
+            return
+        waiting = []
+        for mode, name in self._pending_content:
+            key = f"{mode.name}.{name}"
+            if self.content.is_ready(key):
+                mode.on_content(name, self.content.result(key))
+            else:
+                waiting.append((mode, name))
+        self._pending_content = waiting
+        if self.pending_mode and self.is_mode_ready(self.pending_mode):
+            self.start_game(self.pending_mode)
+
+    def _get_mode(self, name: str) -> GameModePlugin:
+        """Режим игры; при первом обращении модуль импортируется, а его контент грузится в фоне"""
+        mode = self.modes.get(name)
+        if mode is None:
+            mode = load_mode(name)(self)
+            for content_name, loader in mode.loaders().items():
+                self.content.submit_once(f"{name}.{content_name}", loader)
+                self._pending_content.append((mode, content_name))
+            self.modes[name] = mode
+            self._invalidate_screens()  # Название стороннего режима известно только после загрузки
+        return mode
+
+    def is_mode_ready(self, name: str) -> bool:
+        """Загружен ли режим и обязательный для него контент"""
+        mode = self.modes.get(name)
+        return mode is not None and all(self.content.is_ready(f"{name}.{content_name}")
+                                        for content_name in mode.required)
+
+    def _mode_title(self, name: str) -> str:
+        """Название режима для меню и таблицы рекордов"""
+        if name in MODE_TITLES:
+            return self.texts[MODE_TITLES[name]]
+        mode = self.modes.get(name)
+        return (mode and mode.title) or name
+
+    def start_game(self, mode: str):
+        """Начинает игру в выбранном режиме (или после загрузки его контента)"""
+        name = GameMode(mode).value if isinstance(mode, GameMode) else mode
+        self.mode = self._get_mode(name)
+        self._poll_content()
+        if not self.is_mode_ready(name):
+            # Игра начнется из _poll_content, когда контент режима загрузится
+            self.pending_mode = name
+            return
+        self.pending_mode = None
+        self._apply_packs(name)
+        self.game_mode = name
+        self.game_started_at = time.monotonic()
+        self._setup_board()
+        start_x, start_y = self.level.start
+        self.snake = Snake(start_x, start_y, self.board_width, self.board_height, self.level)
         self.score = 0
         self.paused = False
         self.current_screen = "game"
-        self.used_questions = []  # Сбрасываем использованные вопросы
-        self.quiz_completed = False  # Сбрасываем флаг завершения
-
-        if mode == GameMode.CLASSIC:
-            self.apple = Apple(self.grid_width, self.grid_height)
-        elif mode == GameMode.QUIZ:
-            self._spawn_quiz_apple()
-        elif mode == GameMode.WORD_COLLECTION:
-            self.current_word = ""
-            self.current_word_game_lang = ""
-            self.collected_letters = []
-            self._spawn_word_apple()
-
-    def _spawn_quiz_apple(self):
-        """Создает яблоки с номерами ответов для викторины"""
-        questions = self.quiz_questions.get(self.game_lang.value, [])
-        available_questions = [q for q in questions if q not in self.used_questions]
-
-        if not available_questions:
-            # Все вопросы использованы - игра завершена
-            self.quiz_completed = True
-            self.current_screen = "quiz_completed"
+        self._update_tick_rate()
+        self.scheduler.reset()
+        self.timers.clear()
+        if self.effects:
+            self.effects.clear()
+        if self.heatmaps:
+            if self.heat:
+                self.heat.flush()  # Прошлый раунд брошен из меню
+            self.heat = self.heatmaps.recorder(name, self.level_name, self.board_width, self.board_height)
+            self._last_eat_tick = self.timers.now
+        if self.telemetry:
+            self.telemetry.emit("game_start", mode=name, game_lang=self.game_lang.value,
+                                interface_lang=self.interface_lang.value, level=self.level_name,
+                                board=[self.board_width, self.board_height], renderer=self.backend.name)
+
+        self.mode.start()
+
+    def _apply_packs(self, name: str):
+        """Передает режиму контент из пакетов учителя; вызывается только при старте игры"""
+        if not self.packs:
             return
-
-        if available_questions:
-            q = random.choice(available_questions)
-            self.used_questions.append(q)  # Добавляем вопрос в использованные
-            self.quiz_question = q["question"]
-            self.quiz_answers = [q["correct"]] + q["wrong"]
-            random.shuffle(self.quiz_answers)
-            self.quiz_correct_answer = q["correct"]
-            self.quiz_correct_number = self.quiz_answers.index(q["correct"]) + 1
-
-            # Создаем яблоки с номерами ответов
-            self.quiz_apples = []
-            for i in range(len(self.quiz_answers)):
-                apple = QuizApple(self.grid_width, self.grid_height, q["question"], q["correct"], q["wrong"], i + 1)
-                # Размещаем яблоки в случайных позициях, избегая змейки
-                apple.position = self._get_random_quiz_apple_position()
-                self.quiz_apples.append(apple)
-
-            # Устанавливаем первое яблоко как текущее для отображения
-            self.apple = self.quiz_apples[0]
-
-    def _get_random_quiz_apple_position(self) -> Tuple[int, int]:
-        """Получает случайную позицию для яблока викторины, избегая змейки"""
-        while True:
-            x = random.randint(2, self.grid_width - 3)
-            y = random.randint(2, self.grid_height - 3)
-            position = (x, y)
-
-            # Проверяем, что позиция не занята змейкой
-            if position not in self.snake.body:
-                return position
-
-    def _spawn_word_apple(self):
-        """Создает яблоки для режима сбора слов: одно правильное и несколько неправильных"""
-        if not self.current_word:
-            # Берем слово из словаря языка интерфейса (для отображения)
-            words = self.word_targets.get(self.interface_lang.value, [])
-            if words:
-                self.current_word = random.choice(words)
-                # Получаем перевод этого слова на язык игры (для сбора букв)
-                self.current_word_game_lang = self._get_word_translation(
-                    self.current_word, 
-                    self.interface_lang.value, 
-                    self.game_lang.value
-                )
-                self.collected_letters = []
-            else:
-                return  # Нет слов для сбора
-
-        # Проверяем по слову на языке игры (так как буквы собираем на языке игры)
-        if len(self.collected_letters) >= len(self.current_word_game_lang):
-            # Слово собрано, начинаем новое
-            self.score += 10
-            self.current_word = ""
-            self.current_word_game_lang = ""
-            self.collected_letters = []
-            self._spawn_word_apple()
+        packs = self.packs.content
+        previous = self._applied_packs.get(name)
+        if packs is previous:
             return
-
-        self.word_apples = []
-        occupied_positions = list(self.snake.body)
-
-        # 1. Создаем правильное яблоко (буква из слова на языке игры)
-        correct_letter = self.current_word_game_lang[len(self.collected_letters)]
-        correct_pos = self._get_unique_position(occupied_positions)
-        correct_apple = WordApple(self.grid_width, self.grid_height, correct_letter, is_correct=True)
-        correct_apple.position = correct_pos
-        self.word_apples.append(correct_apple)
-        occupied_positions.append(correct_pos)
-
-        # 2. Создаем неправильные яблоки (от 2 до 4)
-        num_wrong_apples = random.randint(2, 4)
-        for _ in range(num_wrong_apples):
-            wrong_letter = self._get_random_letter(self.game_lang)
-            # Убедимся, что неправильная буква не является текущей правильной
-            while wrong_letter == correct_letter:
-                wrong_letter = self._get_random_letter(self.game_lang)
-
-            wrong_pos = self._get_unique_position(occupied_positions)
-            wrong_apple = WordApple(self.grid_width, self.grid_height, wrong_letter, is_correct=False)
-            wrong_apple.position = wrong_pos
-            self.word_apples.append(wrong_apple)
-            occupied_positions.append(wrong_pos)
-
-    def _get_unique_position(self, occupied_positions: List[Tuple[int, int]]) -> Tuple[int, int]:
-        """Генерирует уникальную позицию, не занятую другими объектами"""
-        while True:
-            x = random.randint(0, self.grid_width - 1)
-            y = random.randint(0, self.grid_height - 1)
-            new_position = (x, y)
-            if new_position not in occupied_positions:
-                return new_position
+        self._applied_packs[name] = packs
+        for content_name in self.mode.loaders():
+            key = f"{name}.{content_name}"
+            if key not in PACK_TARGETS:
+                continue  # Этот контент пакетами не заменяется (например, индекс слов)
+            if key not in packs and (previous is None or key not in previous):
+                continue
+            # Пакеты заменяют встроенный контент своих языков; удаленный пакет возвращает встроенный
+            content = dict(self.content.result(key) or {})
+            content.update(packs.get(key, {}))
+            self.mode.on_content(content_name, content)
+
+    def _setup_board(self):
+        """Фиксирует размер поля для новой игры по текущему разрешению или по карте уровня"""
+        self.board_width = self.grid_width
+        self.board_height = self.grid_height
+        board_size = (self.window_width, self.window_height)
+        self.level = LevelMap.open(self.board_width, self.board_height)
+        if self.level_name == "box":
+            self.level = LevelMap.box(self.board_width, self.board_height)
+        elif self.level_name != "classic":
+            try:
+                self.level = load_level(self.level_name, LEVELS_DIR, os.path.join(CACHE_DIR, "levels"))
+                # Поле карты имеет свой размер и масштабируется в окно
+                self.board_width, self.board_height = self.level.width, self.level.height
+                board_size = (self.level.width * GRID_SIZE, self.level.height * GRID_SIZE)
+            except Exception as e:
+                print(f"⚠ Не удалось загрузить карту '{self.level_name}': {e}")
+        self._wall_sprite = None
+        self.backend.set_board_size(board_size)
+
+    def _level_title(self, name: str) -> str:
+        """Название карты для экрана настроек"""
+        if name == "classic":
+            return self.texts[T.LEVEL_CLASSIC]
+        if name == "box":
+            return self.texts[T.LEVEL_BOX]
+        return name
+
+    def _get_unique_position(self, occupied_positions: Collection[Tuple[int, int]],
+                             margin: int = 0) -> Optional[Tuple[int, int]]:
+        """Свободная клетка карты вне змейки и occupied_positions (яблок); None, если поле заполнено"""
+        return self.level.random_free_cell(occupied_positions, margin)
 
     def handle_events(self):
         """Обрабатывает события"""
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-
-            elif event.type == pygame.KEYDOWN:
-                # Универсальная обработка клавиш R, M, Q, ESC
-                if event.key == pygame.K_r:
-                    self._handle_restart_key()
-                elif event.key == pygame.K_m:
-                    self._handle_menu_key()
-                elif event.key == pygame.K_q:
-                    self._handle_quit_key()
-                elif event.key == pygame.K_ESCAPE:
-                    self._handle_escape_key()
-                else:
-                    # Специфичная обработка для каждого экрана
-                    if self.current_screen == "menu":
-                        self._handle_menu_events(event)
-                    elif self.current_screen == "settings":
-                        self._handle_settings_events(event)
-                    elif self.current_screen == "game":
-                        self._handle_game_events(event)
-                    elif self.current_screen == "quiz_completed":
-                        self._handle_quiz_completed_events(event)
+            self.handle_event(event)
+
+    def handle_event(self, event: pygame.event.Event):
+        """Обрабатывает одно событие (на разделенном экране события раздает хозяин окна)"""
+        if event.type == pygame.QUIT:
+            self.running = False
+
+        elif event.type == pygame.VIDEORESIZE:
+            # Окно изменено пользователем
+            self.backend.window_resized((event.w, event.h))
+            self._on_window_resized(event.w, event.h)
+
+        elif event.type in JOYSTICK_EVENTS:
+            for player, action, timestamp in self.input.process_event(event):
+                self._handle_action(player, action, timestamp)
+
+        elif event.type == pygame.KEYDOWN:
+            # Универсальная обработка клавиш R, M, Q, ESC
+            if event.key == pygame.K_r:
+                self._handle_restart_key()
+            elif event.key == pygame.K_m:
+                self._handle_menu_key()
+            elif event.key == pygame.K_q:
+                self._handle_quit_key()
+            elif event.key == pygame.K_ESCAPE:
+                self._handle_escape_key()
+            else:
+                # Специфичная обработка для каждого экрана
+                if self.current_screen == "menu":
+                    self._handle_menu_events(event)
+                elif self.current_screen == "settings":
+                    self._handle_settings_events(event)
+                elif self.current_screen == "game":
+                    self._handle_game_events(event)
+                elif self.current_screen == "quiz_completed":
+                    self._handle_quiz_completed_events(event)
+                elif self.current_screen == "leaderboard":
+                    self._handle_leaderboard_events(event)
 
     def _handle_restart_key(self):
         """Универсальная обработка клавиши R (перезапуск)"""
@@ -845,7 +491,7 @@ class Game:
                 self.start_game(self.game_mode)
         elif self.current_screen == "quiz_completed":
             # Перезапуск викторины
-            self.start_game(GameMode.QUIZ)
+            self.start_game(self.game_mode)
         elif self.current_screen == "game":
             # Перезапуск текущей игры
             if self.game_mode:
@@ -862,7 +508,7 @@ class Game:
             self.current_screen = "menu"
         elif self.current_screen == "menu":
             self.running = False
-        elif self.current_screen == "settings":
+        elif self.current_screen in ("settings", "leaderboard"):
             self.current_screen = "menu"
 
     def _handle_escape_key(self):
@@ -873,64 +519,113 @@ class Game:
             self.current_screen = "menu"
         elif self.current_screen == "quiz_completed":
             self.current_screen = "menu"
+        elif self.current_screen == "leaderboard":
+            self.current_screen = "menu"
 
     def _handle_menu_events(self, event):
         """Обрабатывает события главного меню"""
-        if event.key == pygame.K_1:
-            self.start_game(GameMode.CLASSIC)
-        elif event.key == pygame.K_2:
-            self.start_game(GameMode.QUIZ)
-        elif event.key == pygame.K_3:
-            self.start_game(GameMode.WORD_COLLECTION)
+        if event.key in MENU_MODE_KEYS[:len(self.mode_names)]:
+            # Режим запускается сразу или, если его контент еще загружается, по готовности
+            self.start_game(self.mode_names[MENU_MODE_KEYS.index(event.key)])
         elif event.key == pygame.K_s:
             self.current_screen = "settings"
+        elif event.key == pygame.K_l:
+            self._open_leaderboard(self.leaderboard_mode)
         # Клавиша Q теперь обрабатывается универсально
 
+    def _on_language_changed(self):
+        """Обновляет строки интерфейса и язык контента после смены языка"""
+        self.texts = self.localization.texts
+        self.interface_lang = Language(self.localization.content_language())
+        self._invalidate_screens()
+        if _font_index is not None:
+            # Строки нового языка должны быть в шрифте (кириллица для русского); индекс уже построен
+            discover_korean_font(_font_index, self.interface_lang.value)
+
+    def _open_leaderboard(self, mode: str):
+        """Открывает таблицу рекордов; запрос к базе выполняется один раз при открытии"""
+        self.leaderboard_mode = GameMode(mode).value if isinstance(mode, GameMode) else mode
+        self.leaderboard_rows = self.stats.leaderboard(self.leaderboard_mode) if self.stats else []
+        self.current_screen = "leaderboard"
+
+    def _handle_leaderboard_events(self, event):
+        """Обрабатывает события таблицы рекордов: 1, 2, 3... - выбор режима"""
+        if event.key in MENU_MODE_KEYS[:len(self.mode_names)]:
+            self._open_leaderboard(self.mode_names[MENU_MODE_KEYS.index(event.key)])
+
     def _handle_settings_events(self, event):
         """Обрабатывает события настроек"""
         # Клавиша ESC теперь обрабатывается универсально
         if event.key == pygame.K_1:
-            self.interface_lang = Language.RUSSIAN
-            self.localization.set_language(Language.RUSSIAN)
+            self.localization.set_language(Language.RUSSIAN.value)
         elif event.key == pygame.K_2:
-            self.interface_lang = Language.ENGLISH
-            self.localization.set_language(Language.ENGLISH)
+            self.localization.set_language(Language.ENGLISH.value)
         elif event.key == pygame.K_3:
-            self.interface_lang = Language.KOREAN
-            self.localization.set_language(Language.KOREAN)
+            self.localization.set_language(Language.KOREAN.value)
+        elif event.key == pygame.K_l:
+            # Перебор всех языков интерфейса, включая дополнительные из lang/
+            languages = self.localization.languages
+            current = languages.index(self.localization.current_lang)
+            self.localization.set_language(languages[(current + 1) % len(languages)])
         elif event.key == pygame.K_4:
             self.game_lang = Language.RUSSIAN
         elif event.key == pygame.K_5:
             self.game_lang = Language.ENGLISH
         elif event.key == pygame.K_6:
             self.game_lang = Language.KOREAN
-        elif event.key == pygame.K_7:
-            self.change_resolution("800x600")
-        elif event.key == pygame.K_8:
-            self.change_resolution("1000x700")
-        elif event.key == pygame.K_9:
-            self.change_resolution("1200x800")
-        elif event.key == pygame.K_0:
-            self.change_resolution("1366x768")
-        elif event.key == pygame.K_MINUS:
-            self.change_resolution("1920x1080")
+        elif event.key in self.RESOLUTION_KEYS:
+            self.change_resolution(self.RESOLUTION_KEYS[event.key])
+        elif event.key == pygame.K_k:
+            # Перебор карт уровней; карта загружается при старте игры
+            current = self.level_names.index(self.level_name)
+            self.level_name = self.level_names[(current + 1) % len(self.level_names)]
+
+    ACTION_DIRECTIONS = {
+        Action.UP: Direction.UP,
+        Action.DOWN: Direction.DOWN,
+        Action.LEFT: Direction.LEFT,
+        Action.RIGHT: Direction.RIGHT,
+    }
+
+    RESOLUTION_KEYS = {
+        pygame.K_7: "800x600",
+        pygame.K_8: "1000x700",
+        pygame.K_9: "1200x800",
+        pygame.K_0: "1366x768",
+        pygame.K_MINUS: "1920x1080",
+    }
 
     def _handle_game_events(self, event):
         """Обрабатывает события игры"""
-        if event.key == pygame.K_w:
-            self.snake.change_direction(Direction.UP)
-        elif event.key == pygame.K_s:
-            self.snake.change_direction(Direction.DOWN)
-        elif event.key == pygame.K_a:
-            self.snake.change_direction(Direction.LEFT)
-        elif event.key == pygame.K_d:
-            self.snake.change_direction(Direction.RIGHT)
-        elif event.key == pygame.K_c:
-            self.paused = not self.paused
-        elif event.key == pygame.K_v and self.paused:
-            self.paused = False
+        if self.input.handles(event):
+            for player, action, timestamp in self.input.process_event(event):
+                self._handle_action(player, action, timestamp)
+        elif event.key in self.RESOLUTION_KEYS:
+            # Разрешение можно менять прямо во время игры - поле просто масштабируется
+            self.change_resolution(self.RESOLUTION_KEYS[event.key])
         # Клавиша Q теперь обрабатывается универсально
 
+    def _handle_action(self, player: int, action: Action, timestamp: float):
+        """Выполняет действие игрока (клавиатура или геймпад)"""
+        if self.input_player is not None and player != self.input_player:
+            return
+        if self.current_screen == "game":
+            # Пока змейка одна, ею управляют все игроки
+            if action in self.ACTION_DIRECTIONS:
+                # Повороты копятся в очереди и применяются по одному на шаг, ни одно нажатие не теряется
+                self.snake.queue_turn(self.ACTION_DIRECTIONS[action], timestamp)
+            elif action == Action.PAUSE:
+                self.paused = not self.paused
+                self.snake.clear_turns()
+            elif action == Action.RESUME and self.paused:
+                self.paused = False
+            elif action == Action.BACK:
+                self._handle_escape_key()
+        elif action == Action.BACK:
+            self._handle_escape_key()
+        elif action == Action.RESUME and self.current_screen in ("game_over", "quiz_completed"):
+            self._handle_restart_key()
+
     def _handle_quiz_events(self, event):
         """Обрабатывает события викторины"""
         # Викторина теперь работает через поедание яблок, события не нужны
@@ -941,67 +636,76 @@ class Game:
         # Клавиши R и M теперь обрабатываются универсально
         pass
 
-    def _check_quiz_answer(self, apple_number: int):
-        """Проверяет ответ на вопрос викторины по номеру съеденного яблока"""
-        if apple_number == self.quiz_correct_number:
-            self.quiz_result = True
-            self.score += 10
-            self.quiz_result_timer = 30  # Показываем результат 0.5 секунды
-            # Создаем новый вопрос
-            self._spawn_quiz_apple()
-        else:
-            # Неправильный ответ - игра заканчивается
-            self.current_screen = "game_over"
+    def _end_game(self, reason: str):
+        """Завершает игру, сохраняет результат и показывает итоговый экран.
+
+        reason - причина из END_REASONS: столкновение, неверный ответ, нет места на поле
+        или пройдены все вопросы викторины"""
+        screen = END_REASONS[reason]
+        self.current_screen = screen
+        duration = time.monotonic() - self.game_started_at
+        if self.effects and screen == "game_over":
+            self.effects.game_over(self.snake.body[0])
+        if self.heat:
+            # Слой гибелей - только столкновения со стеной или собой, а не неверные ответы и полное поле
+            if reason == "collision":
+                self.heat.death(*self.snake.body[0])
+            self.heat.flush()
+        if self.stats:
+            self.stats.record_game(self.player, self.game_mode, self.game_lang.value,
+                                   self.score, duration)
+        if self.telemetry:
+            self.telemetry.emit("game_over", mode=self.game_mode, reason=reason,
+                                score=self.score, duration=round(duration, 2), length=len(self.snake.body))
+            self.telemetry.flush()  # Конец игры: пачка уходит потоку записи, файл не отстает
+
+    def _emit_apple_eaten(self, **fields):
+        if self.effects:
+            self.effects.apple_eaten(self.snake.body[0])
+        if self.heat:
+            # Время игры без пауз: колесо таймеров идет только во время игры
+            timers = self.timers
+            self.heat.eat(*self.snake.body[0], (timers.now - self._last_eat_tick) * timers.resolution)
+            self._last_eat_tick = timers.now
+        if self.telemetry:
+            self.telemetry.emit("apple_eaten", mode=self.game_mode, score=self.score,
+                                length=len(self.snake.body), **fields)
+
+    def _update_tick_rate(self):
+        """Подстраивает скорость змейки под счет и длину по профилю сложности"""
+        if self.current_screen == "game":
+            self.scheduler.set_rate(self.difficulty.rate(self.game_mode, self.score,
+                                                         len(self.snake.body)))
 
     def update(self):
         """Обновляет состояние игры"""
+        self._poll_content()
+        self.localization.reload_if_changed()
+
         if self.current_screen == "game" and not self.paused:
             self.snake.move()
 
             # Проверка столкновения с собой
             if self.snake.check_collision():
-                self.current_screen = "game_over"
+                self._end_game("collision")
                 return
+            if self.heat:
+                self.heat.tick(*self.snake.body[0])
 
-            # Проверка поедания яблока
-            if self.game_mode == GameMode.QUIZ:
-                # Проверяем столкновение с любым из яблок викторины
-                for apple in self.quiz_apples:
-                    if self.snake.body[0] == apple.position:
-                        self.snake.grow()
-                        self._check_quiz_answer(apple.answer_number)
-                        break
-            elif self.game_mode == GameMode.WORD_COLLECTION:
-                # Проверяем столкновение с яблоками в режиме сбора слов
-                for apple in list(self.word_apples): # Используем list(), чтобы избежать изменения списка во время итерации
-                    if self.snake.body[0] == apple.position:
-                        if apple.is_correct:
-                            self.snake.grow()
-                            self.collected_letters.append(apple.letter)
-                            self.score += 1
-                            # После сбора правильной буквы, пересоздаем все яблоки
-                            self._spawn_word_apple()
-                        else:
-                            # Съели неправильное яблоко - конец игры
-                            self.current_screen = "game_over"
-                        break # Выходим после обработки первого столкновения
-            else:
-                # Обычная логика для других режимов (CLASSIC)
-                if self.snake.body[0] == self.apple.position:
-                    self.snake.grow()
-                    self.score += 1
-                    self.apple.respawn(self.snake.body)
-
-        # Обновление таймера результата викторины
-        if self.quiz_result_timer > 0:
-            self.quiz_result_timer -= 1
-            if self.quiz_result_timer == 0:
-                self.quiz_result = None
+            # Поедание яблок и остальные правила - у режима
+            self.mode.update()
 
 
     def draw(self):
-        """Отрисовывает игру"""
-        self.screen.fill(GRAY)
+        """Отрисовывает и выводит кадр"""
+        self.render()
+        if self.capture:
+            self.capture.offer(self.backend)
+        self.backend.present()
+
+    def render(self):
+        """Отрисовывает текущий экран на холсте (без вывода на экран)"""
+        self.canvas.fill(GRAY)
 
         if self.current_screen == "menu":
             self._draw_menu()
@@ -1013,84 +717,100 @@ class Game:
             self._draw_game_over()
         elif self.current_screen == "quiz_completed":
             self._draw_quiz_completed()
+        elif self.current_screen == "leaderboard":
+            self._draw_leaderboard()
 
-        pygame.display.flip()
+    def _invalidate_screens(self):
+        """Надписи меню и экранов конца игры собираются заново при следующей отрисовке"""
+        self._menu_items = None
+        self._end_items = None
+        self._loading_progress = (-1, -1)
 
-    def _draw_menu(self):
-        """Отрисовывает главное меню"""
-        font_large = get_korean_font(48)
-        font_medium = get_korean_font(32)
-        font_small = get_korean_font(24)
-
-        # Заголовок
-        title = font_large.render(self.localization.get_text("title"), True, WHITE)
-        title_rect = title.get_rect(center=(self.window_width // 2, 100))
-        self.screen.blit(title, title_rect)
+    def _layout_menu(self):
+        """Собирает надписи главного меню и размещает полосу загрузки"""
+        texts = self.texts
+        center_x = self.window_width // 2
+        items = [(texts[T.TITLE], 48, WHITE, (center_x, 100))]
 
         # Режимы игры
         y_offset = 200
-        modes = [
-            (1, self.localization.get_text("classic_mode")),
-            (2, self.localization.get_text("quiz_mode")),
-            (3, self.localization.get_text("word_mode"))
-        ]
-
-        for key, mode_name in modes:
-            text = font_medium.render(f"{key}. {mode_name}", True, WHITE)
-            text_rect = text.get_rect(center=(self.window_width // 2, y_offset))
-            self.screen.blit(text, text_rect)
+        for key, name in enumerate(self.mode_names, start=1):
+            # Выбранный режим, контент которого еще загружается, показывается серым
+            color = LIGHT_GRAY if name == self.pending_mode else WHITE
+            items.append((f"{key}. {self._mode_title(name)}", 32, color, (center_x, y_offset)))
             y_offset += 50
 
         # Кнопки
-        play_text = font_medium.render(self.localization.get_text("play"), True, GREEN)
-        play_rect = play_text.get_rect(center=(self.window_width // 2, y_offset + 50))
-        self.screen.blit(play_text, play_rect)
-
-        settings_text = font_medium.render(f"S. {self.localization.get_text('settings')}", True, YELLOW)
-        settings_rect = settings_text.get_rect(center=(self.window_width // 2, y_offset + 100))
-        self.screen.blit(settings_text, settings_rect)
-
-        exit_text = font_medium.render(f"Q. {self.localization.get_text('exit')}", True, RED)
-        exit_rect = exit_text.get_rect(center=(self.window_width // 2, y_offset + 150))
-        self.screen.blit(exit_text, exit_rect)
+        items.append((texts[T.PLAY], 32, GREEN, (center_x, y_offset + 50)))
+        items.append((f"S. {texts[T.SETTINGS]}", 32, YELLOW, (center_x, y_offset + 100)))
+        items.append((f"L. {texts[T.LEADERBOARD]}", 32, YELLOW, (center_x, y_offset + 150)))
+        items.append((f"Q. {texts[T.EXIT]}", 32, RED, (center_x, y_offset + 200)))
+
+        # Индикатор фоновой загрузки
+        self._loading_rect.width = self.window_width // 3
+        self._loading_rect.center = (center_x, y_offset + 250)
+        self._loading_fill.update(self._loading_rect.inflate(-4, -4))
+        self._loading_center = (center_x, y_offset + 270)
+        self._loading_progress = (-1, -1)
 
         # Управление
         controls_y = self.window_height - 150
-        controls_text = font_small.render(self.localization.get_text("controls"), True, GRAY)
-        controls_rect = controls_text.get_rect(center=(self.window_width // 2, controls_y))
-        self.screen.blit(controls_text, controls_rect)
-
+        items.append((texts[T.CONTROLS], 24, GRAY, (center_x, controls_y)))
         control_items = [
-            self.localization.get_text("up"),
-            self.localization.get_text("down"),
-            self.localization.get_text("left"),
-            self.localization.get_text("right"),
-            self.localization.get_text("pause_key"),
-            self.localization.get_text("resume_key"),
-            self.localization.get_text("quit_key")
+            texts[T.UP],
+            texts[T.DOWN],
+            texts[T.LEFT],
+            texts[T.RIGHT],
+            texts[T.PAUSE_KEY],
+            texts[T.RESUME_KEY],
+            texts[T.QUIT_KEY]
         ]
-
         for i, item in enumerate(control_items):
-            text = font_small.render(item, True, GRAY)
-            text_rect = text.get_rect(center=(self.window_width // 2, controls_y + 20 + i * 15))
-            self.screen.blit(text, text_rect)
+            items.append((item, 24, GRAY, (center_x, controls_y + 20 + i * 15)))
+
+        self._menu_items = items
+        self._menu_pending = self.pending_mode
+
+    def _draw_items(self, items):
+        canvas = self.canvas
+        for text, size, color, center in items:
+            canvas.text(text, size, color, center=center)
+
+    def _draw_menu(self):
+        """Отрисовывает главное меню"""
+        if self._menu_items is None or self._menu_pending != self.pending_mode:
+            self._layout_menu()
+        self._draw_items(self._menu_items)
+
+        done, total = self.content.progress()
+        if done < total:
+            self._draw_loading_bar(done, total)
+
+    def _draw_loading_bar(self, done: int, total: int):
+        """Отрисовывает полосу прогресса загрузки контента"""
+        if self._loading_progress != (done, total):
+            self._loading_progress = (done, total)
+            self._loading_fill.width = (self._loading_rect.width - 4) * done // total
+            self._loading_text = f"{self.texts[T.LOADING]} {done}/{total}"
+        self.canvas.draw_rect(self._loading_rect, LIGHT_GRAY, 1)
+        self.canvas.draw_rect(self._loading_fill, GREEN)
+        self.canvas.text(self._loading_text, 24, LIGHT_GRAY, center=self._loading_center)
 
     def _draw_settings(self):
         """Отрисовывает настройки"""
-        font_large = get_korean_font(48)
-        font_medium = get_korean_font(32)
-        font_small = get_korean_font(24)
+        texts = self.texts
+        canvas = self.canvas
+        center_x = self.window_width // 2
 
         # Заголовок
-        title = font_large.render(self.localization.get_text("settings"), True, WHITE)
-        title_rect = title.get_rect(center=(self.window_width // 2, 100))
-        self.screen.blit(title, title_rect)
+        canvas.text(texts[T.SETTINGS], 48, WHITE, center=(center_x, 100))
+
+        # Карта уровня (клавиша K)
+        canvas.text(f"K. {texts[T.LEVEL]}: {self._level_title(self.level_name)}", 24, YELLOW, center=(center_x, 150))
 
         # Язык интерфейса
         y_offset = 200
-        interface_text = font_medium.render(self.localization.get_text("interface_lang"), True, WHITE)
-        interface_rect = interface_text.get_rect(center=(self.window_width // 2, y_offset))
-        self.screen.blit(interface_text, interface_rect)
+        canvas.text(texts[T.INTERFACE_LANG], 32, WHITE, center=(center_x, y_offset))
 
         languages = [
             (1, "Русский", Language.RUSSIAN),
@@ -1099,28 +819,27 @@ class Game:
         ]
 
         for key, name, lang in languages:
-            color = GREEN if lang == self.interface_lang else WHITE
-            text = font_small.render(f"{key}. {name}", True, color)
-            text_rect = text.get_rect(center=(self.window_width // 2, y_offset + 30 + key * 25))
-            self.screen.blit(text, text_rect)
+            color = GREEN if lang.value == self.localization.current_lang else WHITE
+            canvas.text(f"{key}. {name}", 24, color, center=(center_x, y_offset + 30 + key * 25))
+
+        # Дополнительные языки из папки lang/ перебираются клавишей L
+        extra = [lang for lang in self.localization.languages if lang not in BUILTIN_NAMES]
+        if extra:
+            names = ", ".join(self.localization.names[lang] for lang in extra)
+            color = GREEN if self.localization.current_lang in extra else WHITE
+            canvas.text(f"L. {texts[T.MORE_LANGUAGES]}: {names}", 24, color, center=(center_x, y_offset + 130))
 
         # Язык игры
         y_offset += 150
-        game_text = font_medium.render(self.localization.get_text("game_lang"), True, WHITE)
-        game_rect = game_text.get_rect(center=(self.window_width // 2, y_offset))
-        self.screen.blit(game_text, game_rect)
+        canvas.text(texts[T.GAME_LANG], 32, WHITE, center=(center_x, y_offset))
 
         for key, name, lang in languages:
             color = GREEN if lang == self.game_lang else WHITE
-            text = font_small.render(f"{key + 3}. {name}", True, color)
-            text_rect = text.get_rect(center=(self.window_width // 2, y_offset + 30 + key * 25))
-            self.screen.blit(text, text_rect)
+            canvas.text(f"{key + 3}. {name}", 24, color, center=(center_x, y_offset + 30 + key * 25))
 
         # Разрешение экрана
         y_offset += 150
-        resolution_text = font_medium.render(self.localization.get_text("resolution"), True, WHITE)
-        resolution_rect = resolution_text.get_rect(center=(self.window_width // 2, y_offset))
-        self.screen.blit(resolution_text, resolution_rect)
+        canvas.text(texts[T.RESOLUTION], 32, WHITE, center=(center_x, y_offset))
 
         resolution_options = [
             (7, "800x600"),
@@ -1130,167 +849,259 @@ class Game:
             ("-", "1920x1080")
         ]
 
-        for key, res in resolution_options:
+        for i, (key, res) in enumerate(resolution_options):
             color = GREEN if res == self.current_resolution else WHITE
-            text = font_small.render(f"{key}. {res}", True, color)
-            text_rect = text.get_rect(center=(self.window_width // 2, y_offset + 30 + resolution_options.index((key, res)) * 25))
-            self.screen.blit(text, text_rect)
+            canvas.text(f"{key}. {res}", 24, color, center=(center_x, y_offset + 30 + i * 25))
 
         # Инструкции
-        esc_text = font_small.render("ESC - Назад в меню", True, GRAY)
-        esc_rect = esc_text.get_rect(center=(self.window_width // 2, self.window_height - 50))
-        self.screen.blit(esc_text, esc_rect)
+        canvas.text(texts[T.BACK_HINT], 24, GRAY, center=(center_x, self.window_height - 50))
 
     def _draw_game(self):
         """Отрисовывает игровое поле"""
+        now = time.perf_counter()
+        shake = (0, 0)
+        if self.effects:
+            # На паузе эффекты замирают вместе с игрой
+            self.effects.update(0.0 if self.paused else now - self._last_board_frame)
+            shake = self.effects.offset
+        self._last_board_frame = now
+        canvas = self.backend.begin_board(shake)
+        canvas.fill(GRAY)
+        self._draw_board(canvas)
+        self.backend.end_board()
+
+    def _draw_walls(self, canvas: Canvas):
+        sprite = canvas.cell_sprite(WALL_COLOR)
+        if sprite is not self._wall_sprite:
+            self._wall_sprite = sprite
+            self._wall_cells = [(sprite, pygame.Rect(x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE))
+                                for x, y in self.level.walls()]
+        canvas.draw_cells(self._wall_cells)
+
+    def _draw_board(self, canvas: Canvas):
+        """Отрисовывает игру на холсте поля в логическом размере"""
+        texts = self.texts
+        board_width, board_height = canvas.get_size()
+
+        # Стены карты - одной пачкой заранее отрисованных клеток
+        if self.level is not None:
+            self._draw_walls(canvas)
+
         # Отрисовка змейки
-        self.snake.draw(self.screen)
-
-        # Отрисовка яблок
-        if self.game_mode == GameMode.QUIZ:
-            # Для викторины отображаем все яблоки с номерами
-            for apple in self.quiz_apples:
-                apple.draw(self.screen)
-        elif self.game_mode == GameMode.WORD_COLLECTION:
-            # Для режима сбора слов отображаем все яблоки с буквами
-            for apple in self.word_apples:
-                apple.draw(self.screen)
-        else:
-            # Для других режимов отображаем обычное яблоко
-            self.apple.draw(self.screen)
+        self.snake.draw(canvas)
+
+        # Яблоки и другие объекты режима
+        self.mode.draw(canvas)
+
+        # Частицы и вспышки
+        if self.effects:
+            self.effects.draw(canvas)
 
         # Счет
-        font = get_korean_font(36)
-        score_text = font.render(f"{self.localization.get_text('score')}: {self.score}", True, WHITE)
-        self.screen.blit(score_text, (10, 10))
+        canvas.text(self._score_label.format(texts[T.SCORE], self.score), 36, WHITE, topleft=(10, 10))
 
         # Пауза
         if self.paused:
-            font_large = get_korean_font(72)
-            pause_text = font_large.render(self.localization.get_text("pause"), True, YELLOW)
-            pause_rect = pause_text.get_rect(center=(self.window_width // 2, self.window_height // 2))
-            self.screen.blit(pause_text, pause_rect)
-
-        # Результат викторины
-        if self.quiz_result is not None:
-            font_large = get_korean_font(48)
-            if self.quiz_result:
-                result_text = font_large.render(self.localization.get_text("correct"), True, GREEN)
-            else:
-                result_text = font_large.render(self.localization.get_text("wrong"), True, RED)
-            result_rect = result_text.get_rect(center=(self.window_width // 2, self.window_height // 2))
-            self.screen.blit(result_text, result_rect)
-
-        # Вопрос викторины (отображается поверх игрового поля)
-        if self.game_mode == GameMode.QUIZ and self.quiz_question:
-            self._draw_quiz_overlay()
-
-        # Цель для режима сбора слов
-        if self.game_mode == GameMode.WORD_COLLECTION and self.current_word:
-            font = get_korean_font(24)
-            # Целевое слово на языке интерфейса (сверху)
-            word_text = font.render(f"{self.localization.get_text('word')}: {self.current_word}", True, WHITE)
-            self.screen.blit(word_text, (10, 50))
-
-            # Собранные буквы на языке игры (снизу)
-            collected_text = font.render(f"{self.localization.get_text('collect_word')}: {''.join(self.collected_letters)}", True, WHITE)
-            self.screen.blit(collected_text, (10, 80))
-
-    def _draw_quiz_overlay(self):
-        """Отрисовывает вопрос викторины поверх игрового поля"""
-        font_large = get_korean_font(36)
-        font_medium = get_korean_font(28)
-        font_small = get_korean_font(24)
-
-        # Прозрачный фон для вопроса (такой же как игровое поле)
-        overlay = pygame.Surface((self.window_width, 200))
-        overlay.set_alpha(150)  # Прозрачность для видимости змейки
-        overlay.fill(GRAY)  # Тот же цвет, что и игровое поле
-        self.screen.blit(overlay, (0, 0))
-
-        # Вопрос
-        question_text = font_large.render(self.localization.get_text("question"), True, WHITE)
-        question_rect = question_text.get_rect(center=(self.window_width // 2, 30))
-        self.screen.blit(question_text, question_rect)
-
-        # Текст вопроса
-        question_content = font_medium.render(self.quiz_question, True, WHITE)
-        question_content_rect = question_content.get_rect(center=(self.window_width // 2, 70))
-        self.screen.blit(question_content, question_content_rect)
-
-        # Ответы с номерами
-        y_offset = 120
-        for i, answer in enumerate(self.quiz_answers):
-            text = font_small.render(f"{i + 1}. {answer}", True, WHITE)
-            text_rect = text.get_rect(center=(self.window_width // 2, y_offset + i * 25))
-            self.screen.blit(text, text_rect)
+            canvas.text(texts[T.PAUSE], 72, YELLOW, center=(board_width // 2, board_height // 2))
+
+        # Подсказки режима (вопрос викторины, собираемое слово)
+        self.mode.draw_hud(canvas)
+
+    def _layout_end_screens(self):
+        """Собирает надписи экранов конца игры (кроме счета, он меняется от игры к игре)"""
+        texts = self.texts
+        center_x = self.window_width // 2
+        self._end_items = {
+            "game_over": [
+                (texts[T.GAME_OVER], 72, RED, (center_x, 200)),
+                (f"R. {texts[T.RESTART]}", 36, GREEN, (center_x, 400)),
+                (f"M. {texts[T.BACK_TO_MENU]}", 36, YELLOW, (center_x, 450)),
+            ],
+            "quiz_completed": [
+                (texts[T.WELL_DONE], 72, GREEN, (center_x, 200)),
+                (texts[T.QUIZ_ALL_ANSWERED], 36, WHITE, (center_x, 300)),
+                (f"R. {texts[T.RESTART]}", 36, GREEN, (center_x, 450)),
+                (f"M. {texts[T.BACK_TO_MENU]}", 36, YELLOW, (center_x, 500)),
+            ],
+        }
+
+    def _draw_end_screen(self, screen: str, score_y: int):
+        """Надписи экрана конца игры и финальный счет"""
+        if self._end_items is None:
+            self._layout_end_screens()
+        self._draw_items(self._end_items[screen])
+        self.canvas.text_centered(self._final_score_label.format(self.texts[T.FINAL_SCORE], self.score), 36, WHITE,
+                                  self.window_width // 2, score_y)
 
     def _draw_quiz_completed(self):
         """Отрисовывает экран завершения викторины"""
-        font_large = get_korean_font(72)
-        font_medium = get_korean_font(36)
-        font_small = get_korean_font(24)
+        self._draw_end_screen("quiz_completed", 350)
 
-        # Поздравление
-        congrats_text = font_large.render("Молодец!", True, GREEN)
-        congrats_rect = congrats_text.get_rect(center=(self.window_width // 2, 200))
-        self.screen.blit(congrats_text, congrats_rect)
+    def _draw_leaderboard(self):
+        """Отрисовывает таблицу рекордов выбранного режима"""
+        texts = self.texts
+        canvas = self.canvas
+        center_x = self.window_width // 2
 
-        # Сообщение о завершении
-        message_text = font_medium.render("Ты ответил на все вопросы и прошел игру!", True, WHITE)
-        message_rect = message_text.get_rect(center=(self.window_width // 2, 300))
-        self.screen.blit(message_text, message_rect)
+        canvas.text(texts[T.LEADERBOARD], 48, WHITE, center=(center_x, 100))
 
-        # Финальный счет
-        score_text = font_medium.render(f"{self.localization.get_text('final_score')}: {self.score}", True, WHITE)
-        score_rect = score_text.get_rect(center=(self.window_width // 2, 350))
-        self.screen.blit(score_text, score_rect)
+        count = len(self.mode_names)
+        for i, name in enumerate(self.mode_names):
+            color = GREEN if name == self.leaderboard_mode else WHITE
+            x = center_x + (2 * i - count + 1) * self.window_width // (2 * count + 2)
+            canvas.text(f"{i + 1}. {self._mode_title(name)}", 24, color, center=(x, 160))
 
-        # Кнопки
-        restart_text = font_medium.render(f"R. {self.localization.get_text('restart')}", True, GREEN)
-        restart_rect = restart_text.get_rect(center=(self.window_width // 2, 450))
-        self.screen.blit(restart_text, restart_rect)
+        if not self.leaderboard_rows:
+            canvas.text(texts[T.NO_RECORDS], 32, LIGHT_GRAY, center=(center_x, 260))
+        for place, (player, score, game_lang, ended_at) in enumerate(self.leaderboard_rows, start=1):
+            date = time.strftime("%d.%m.%Y", time.localtime(ended_at))
+            canvas.text(f"{place}. {player} - {score} ({game_lang}, {date})", 28, WHITE,
+                        center=(center_x, 220 + place * 35))
 
-        menu_text = font_medium.render(f"M. {self.localization.get_text('back_to_menu')}", True, YELLOW)
-        menu_rect = menu_text.get_rect(center=(self.window_width // 2, 500))
-        self.screen.blit(menu_text, menu_rect)
+        canvas.text(texts[T.BACK_HINT], 24, GRAY, center=(center_x, self.window_height - 50))
 
     def _draw_game_over(self):
         """Отрисовывает экран окончания игры"""
-        font_large = get_korean_font(72)
-        font_medium = get_korean_font(36)
-        font_small = get_korean_font(24)
-
-        # Game Over
-        game_over_text = font_large.render(self.localization.get_text("game_over"), True, RED)
-        game_over_rect = game_over_text.get_rect(center=(self.window_width // 2, 200))
-        self.screen.blit(game_over_text, game_over_rect)
-
-        # Финальный счет
-        score_text = font_medium.render(f"{self.localization.get_text('final_score')}: {self.score}", True, WHITE)
-        score_rect = score_text.get_rect(center=(self.window_width // 2, 300))
-        self.screen.blit(score_text, score_rect)
-
-        # Кнопки
-        restart_text = font_medium.render(f"R. {self.localization.get_text('restart')}", True, GREEN)
-        restart_rect = restart_text.get_rect(center=(self.window_width // 2, 400))
-        self.screen.blit(restart_text, restart_rect)
-
-        menu_text = font_medium.render(f"M. {self.localization.get_text('back_to_menu')}", True, YELLOW)
-        menu_rect = menu_text.get_rect(center=(self.window_width // 2, 450))
-        self.screen.blit(menu_text, menu_rect)
+        # Пока идут эффекты конца игры, под надписями видно поле
+        if self.effects and self.effects.active:
+            self._draw_game()
+            self.canvas.fill_alpha(self._screen_rect, GRAY, 200)
+        self._draw_end_screen("game_over", 300)
 
     def run(self):
         """Запускает главный игровой цикл"""
+        scheduler = self.scheduler
         while self.running:
+            scheduler.wait()
+            now = time.perf_counter()
+            if self.telemetry:
+                frame_started = now
             self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(10)  # 10 FPS для змейки
-
+            if self.step(now):
+                self.draw()
+            if self.telemetry:
+                frame_ms = (time.perf_counter() - frame_started) * 1000
+                if frame_ms > FRAME_OUTLIER_MS:
+                    self.telemetry.emit("frame_outlier", ms=round(frame_ms, 1), screen=self.current_screen,
+                                        renderer=self.backend.name)
+
+        self.close()
+        if self.packs:
+            self.packs.close()
+        if self.heatmaps:
+            self.heatmaps.save()
         pygame.quit()
         sys.exit()
 
+    def step(self, now: float) -> bool:
+        """Таймеры и тики симуляции после ожидания; возвращает, пора ли рисовать кадр"""
+        if self.current_screen == "game" and not self.paused:
+            self.timers.advance(now - self._last_step)
+        self._last_step = now
+        # Тиков за итерацию может быть несколько (высокая скорость) или ни одного
+        while self.running and self.scheduler.tick_due():
+            self.update()
+            self._update_tick_rate()
+        return self.scheduler.frame_due()
+
+    def close(self):
+        """Останавливает фоновые службы игры (общие службы закрывает их владелец)"""
+        if self._owns_content:
+            self.content.shutdown()
+        if self.stats and self._owns_stats:
+            self.stats.close()
+        if self.telemetry:
+            self.telemetry.close()
+        if self.capture:
+            self.capture.close()
+        if self.heat:
+            self.heat.flush()
+
+def run_split_screen(count: int, renderer: str = "software", players: Optional[List[str]] = None,
+                     capture: Optional[FrameCapture] = None, **options):
+    """Запускает count игр в одном окне; шрифты, контент, статистика и ввод у них общие"""
+    backend = create_backend(renderer, RESOLUTIONS[DEFAULT_RESOLUTION], get_korean_font, GRID_SIZE, "Clever Snake")
+    content = ContentLoader()
+    stats = open_stats()
+    input_manager = InputManager(BINDINGS_PATH)
+    default_player = _default_player()
+    sessions = []
+    for index in range(count):
+        player = players[index] if players and index < len(players) else f"{default_player} {index + 1}"
+        game = Game(renderer=renderer, resolution=SPLIT_RESOLUTION, capture=None,
+                    backend=create_viewport(backend, RESOLUTIONS[SPLIT_RESOLUTION]),
+                    content=content, stats=stats, input_manager=input_manager, player=player, **options)
+        game.input_player = index
+        sessions.append(game)
+    SplitScreen(backend, sessions, input_manager, capture).run()
+    content.shutdown()
+    if options.get("packs"):
+        options["packs"].close()
+    if options.get("heatmaps"):
+        options["heatmaps"].save()
+    if stats:
+        stats.close()
+    if capture:
+        capture.close()
+    pygame.quit()
+    sys.exit()
+
 if __name__ == "__main__":
-    game = Game()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Clever Snake")
+    parser.add_argument("--renderer", choices=BACKENDS,
+                        default=os.environ.get("CLEVER_SNAKE_RENDERER", "software"),
+                        help="бэкенд отрисовки (по умолчанию software)")
+    parser.add_argument("--telemetry", action="store_true",
+                        help="собирать события игры в кольцевой буфер")
+    parser.add_argument("--telemetry-file", metavar="PATH",
+                        default=os.environ.get("CLEVER_SNAKE_TELEMETRY_FILE"),
+                        help="дописывать события в файл JSON Lines (включает телеметрию)")
+    parser.add_argument("--lang-reload", action="store_true",
+                        help="перечитывать переводы из папки lang/ при их изменении")
+    parser.add_argument("--difficulty", choices=sorted(DIFFICULTY_PROFILES),
+                        default=os.environ.get("CLEVER_SNAKE_DIFFICULTY", DEFAULT_DIFFICULTY),
+                        help="профиль сложности: как быстро растет скорость змейки (по умолчанию classic)")
+    parser.add_argument("--level", default=os.environ.get("CLEVER_SNAKE_LEVEL", "classic"),
+                        help="карта уровня: classic, box или имя файла из папки levels/ (без .txt)")
+    parser.add_argument("--input-rate", type=float, metavar="HZ", default=0.0,
+                        help="частота опроса клавиатуры (например 250) для более точных отметок времени нажатий")
+    parser.add_argument("--capture", metavar="DIR", default=os.environ.get("CLEVER_SNAKE_CAPTURE_DIR"),
+                        help="записывать игру в папку DIR (кадры PNG или GIF)")
+    parser.add_argument("--capture-format", choices=CAPTURE_FORMATS, default="png",
+                        help="формат записи: последовательность png или gif (нужен Pillow)")
+    parser.add_argument("--capture-fps", type=float, default=CAPTURE_FPS,
+                        help=f"кадров записи в секунду (по умолчанию {CAPTURE_FPS})")
+    parser.add_argument("--no-effects", action="store_true",
+                        default=os.environ.get("CLEVER_SNAKE_EFFECTS") == "0",
+                        help="без частиц, вспышек и тряски поля (для самых слабых компьютеров)")
+    parser.add_argument("--split", type=int, choices=range(2, MAX_PLAYERS + 1), metavar="N",
+                        help=f"N игр (2-{MAX_PLAYERS}) в одном окне: каждому игроку своя змейка, режим и язык")
+    parser.add_argument("--players", metavar="NAMES",
+                        help="имена игроков через запятую для статистики на разделенном экране")
+    parser.add_argument("--content-server", metavar="ADDRESS",
+                        default=os.environ.get("CLEVER_SNAKE_CONTENT_SERVER"),
+                        help="пульт учителя (host:port или unix:/путь), откуда брать пакеты вопросов и слов")
+    parser.add_argument("--content-token", metavar="TOKEN", default=os.environ.get("CLEVER_SNAKE_PACK_TOKEN"),
+                        help="токен пульта учителя, если он раздает пакеты по сети класса")
+    parser.add_argument("--heatmaps", action="store_true",
+                        default=os.environ.get("CLEVER_SNAKE_HEATMAPS") == "1",
+                        help="копить тепловые карты и аналитику игр в ~/.clever_snake/heatmaps (нужен NumPy)")
+    args = parser.parse_args()
+
+    packs = PackClient(args.content_server, token=args.content_token) if args.content_server else None
+    capture = FrameCapture(args.capture, args.capture_format, args.capture_fps) if args.capture else None
+    heatmaps = open_heatmaps() if args.heatmaps else None
+    if args.split:
+        players = [name.strip() for name in args.players.split(",")] if args.players else None
+        run_split_screen(args.split, renderer=args.renderer, players=players, capture=capture,
+                         difficulty=args.difficulty, level=args.level, input_rate=args.input_rate,
+                         lang_reload=args.lang_reload, effects=not args.no_effects, packs=packs,
+                         heatmaps=heatmaps)
+    telemetry = Telemetry(args.telemetry_file) if args.telemetry or args.telemetry_file else None
+    game = Game(renderer=args.renderer, telemetry=telemetry, lang_reload=args.lang_reload,
+                difficulty=args.difficulty, level=args.level,
+                input_rate=args.input_rate, capture=capture, effects=not args.no_effects, packs=packs,
+                heatmaps=heatmaps)
     game.run()
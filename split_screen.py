@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Несколько игр в одном окне (разделенный экран): 2-4 ученика за одним компьютером.
+
+Каждая игра - обычный Game со своим режимом, языком, счетом и скоростью, но рисует
+в свой закадровый экран (render_backends.create_viewport). Шрифты, кэши
+отрисованного текста и клеток, загрузчик контента, статистика и ввод у игр общие,
+поэтому вторая игра почти ничего не добавляет к памяти и времени загрузки.
+
+Хозяин окна один раз ждет ближайший срок среди всех игр, раздает события и
+выводит кадры всех игр одним present(). Действия игрока N (его клавиши или
+геймпад) идут в игру N; остальные клавиши (меню, настройки, R, M, Q) - в
+выбранную игру. Tab выбирает следующую игру, она обведена рамкой.
+"""
+
+import time
+from typing import Dict, List, Optional
+
+import pygame
+
+from capture import FrameCapture
+from controls import InputManager
+from tick_scheduler import sleep_until
+
+BACKGROUND_COLOR = (0, 0, 0)
+FOCUS_COLOR = (255, 255, 0)
+FOCUS_BORDER = 3  # Толщина рамки выбранной игры
+
+
+class SplitScreen:
+    """Хозяин окна: общий цикл, раздача событий и раскладка игр по участкам"""
+
+    def __init__(self, backend, sessions: List, input_manager: InputManager,
+                 capture: Optional[FrameCapture] = None):
+        self.backend = backend
+        self.sessions = list(sessions)
+        self.input = input_manager
+        self.capture = capture
+        self.focus = 0  # Игра, которой достаются клавиши меню
+        self.rects: List[pygame.Rect] = []
+        self.running = True
+        # Игрок -> его игра (номера игроков не сдвигаются, когда кто-то выходит)
+        self._by_player: Dict[int, object] = {game.input_player: game for game in self.sessions}
+
+    def _layout(self, size):
+        """Две игры - в две колонки, три-четыре - сеткой 2x2; кадр игры вписывается с сохранением пропорций"""
+        width, height = size
+        count = len(self.sessions)
+        cols = 1 if count == 1 else 2
+        rows = (count + cols - 1) // cols
+        cell_w, cell_h = width // cols, height // rows
+        self.rects = []
+        for i, game in enumerate(self.sessions):
+            cell = pygame.Rect((i % cols) * cell_w, (i // cols) * cell_h, cell_w, cell_h)
+            scale = min((cell_w - 2 * FOCUS_BORDER) / game.window_width,
+                        (cell_h - 2 * FOCUS_BORDER) / game.window_height)
+            rect = pygame.Rect(0, 0, max(1, int(game.window_width * scale)), max(1, int(game.window_height * scale)))
+            rect.center = cell.center
+            self.rects.append(rect)
+
+    def handle_event(self, event: pygame.event.Event):
+        if event.type == pygame.QUIT:
+            self.running = False
+        elif event.type == pygame.VIDEORESIZE:
+            self.backend.window_resized((event.w, event.h))
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_TAB:
+            self.focus = (self.focus + 1) % len(self.sessions)
+        elif self.input.handles(event):
+            handled = False
+            for player, action, timestamp in self.input.process_event(event):
+                game = self._by_player.get(player)
+                # Клавиши игрока управляют его змейкой; в меню это обычные клавиши выбранной игры
+                if game is not None and (event.type != pygame.KEYDOWN or game.current_screen == "game"):
+                    game._handle_action(player, action, timestamp)
+                    handled = True
+            if event.type == pygame.KEYDOWN and not handled:
+                self.sessions[self.focus].handle_event(event)
+        elif event.type == pygame.KEYDOWN:
+            self.sessions[self.focus].handle_event(event)
+
+    def _remove_finished(self):
+        """Игра, из которой вышли (Q в меню), закрывается; остальные занимают окно"""
+        finished = [game for game in self.sessions if not game.running]
+        if not finished:
+            return
+        focused = self.sessions[self.focus]
+        for game in finished:
+            game.close()
+            self.sessions.remove(game)
+            self._by_player.pop(game.input_player, None)
+        if not self.sessions:
+            self.running = False
+            return
+        self.focus = self.sessions.index(focused) if focused in self.sessions else 0
+
+    def draw(self):
+        # Сначала все игры рисуют в свои экраны, затем экраны выводятся в окно
+        for game in self.sessions:
+            game.backend.begin_view()
+            game.render()
+            game.backend.end_view()
+        canvas = self.backend.canvas
+        canvas.fill(BACKGROUND_COLOR)
+        self._layout(canvas.get_size())
+        for game, rect in zip(self.sessions, self.rects):
+            game.backend.draw_into(rect)
+        if len(self.sessions) > 1:
+            border = FOCUS_BORDER
+            canvas.draw_rect(self.rects[self.focus].inflate(2 * border, 2 * border), FOCUS_COLOR, border)
+        if self.capture:
+            self.capture.offer(self.backend)
+        self.backend.present()
+
+    def run(self):
+        """Общий цикл всех игр; возвращается, когда окно закрыто или из всех игр вышли"""
+        while self.running and self.sessions:
+            sleep_until(min(game.scheduler.deadline() for game in self.sessions))
+            now = time.perf_counter()
+            for event in pygame.event.get():
+                self.handle_event(event)
+            frame_due = False
+            for game in self.sessions:
+                game.scheduler.sync(now)
+                if game.step(now):
+                    frame_due = True
+            self._remove_finished()
+            if frame_due and self.sessions:
+                self.draw()
+        for game in self.sessions:
+            game.close()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Хранилище рекордов и статистики игр (SQLite).
+
+Игровой цикл только кладет записи в очередь; отдельный поток забирает их
+пачками и записывает одной транзакцией, поэтому запись на диск не вызывает
+подтормаживаний во время игры.
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import List, Optional, Tuple
+
+BATCH_SIZE = 64  # Максимум записей в одной транзакции
+FLUSH_INTERVAL = 2.0  # Через сколько секунд после первой записи сбрасывать накопленные
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    game_lang TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    ended_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_mode_score ON games (mode, score DESC);
+
+CREATE TABLE IF NOT EXISTS quiz_answers (
+    player TEXT NOT NULL,
+    game_lang TEXT NOT NULL,
+    question TEXT NOT NULL,
+    correct INTEGER NOT NULL,
+    answered_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS quiz_answers_question ON quiz_answers (game_lang, question);
+
+CREATE TABLE IF NOT EXISTS words (
+    player TEXT NOT NULL,
+    game_lang TEXT NOT NULL,
+    word TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    completed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS words_word ON words (game_lang, word);
+
+CREATE TABLE IF NOT EXISTS quiz_reviews (
+    player TEXT NOT NULL,
+    game_lang TEXT NOT NULL,
+    question TEXT NOT NULL,
+    ease REAL NOT NULL,
+    interval REAL NOT NULL,
+    reps INTEGER NOT NULL,
+    lapses INTEGER NOT NULL,
+    due REAL NOT NULL,
+    PRIMARY KEY (player, game_lang, question)
+);
+"""
+
+INSERTS = {
+    "games": "INSERT INTO games (player, mode, game_lang, score, duration, ended_at) VALUES (?, ?, ?, ?, ?, ?)",
+    "quiz_answers": "INSERT INTO quiz_answers (player, game_lang, question, correct, answered_at) VALUES (?, ?, ?, ?, ?)",
+    "words": "INSERT INTO words (player, game_lang, word, seconds, completed_at) VALUES (?, ?, ?, ?, ?)",
+    "quiz_reviews": "INSERT OR REPLACE INTO quiz_reviews (player, game_lang, question, ease, interval, reps, lapses, due) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+}
+
+
+class StatsStore:
+    """Буферизованная запись статистики в SQLite из фонового потока"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._read_connection: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path)
+        connection.execute("PRAGMA journal_mode=WAL")  # Чтение не блокирует запись
+        return connection
+
+    def start(self):
+        """Создает базу (если нужно) и запускает поток записи"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        connection = self._connect()
+        connection.executescript(SCHEMA)
+        connection.close()
+        self._thread = threading.Thread(target=self._writer, name="stats-writer", daemon=True)
+        self._thread.start()
+
+    # --- Запись (вызывается из игрового цикла, не блокирует) ---
+
+    def record_game(self, player: str, mode: str, game_lang: str, score: int, duration: float):
+        self._queue.put(("games", (player, mode, game_lang, score, duration, time.time())))
+
+    def record_quiz_answer(self, player: str, game_lang: str, question: str, correct: bool):
+        self._queue.put(("quiz_answers", (player, game_lang, question, int(correct), time.time())))
+
+    def record_word(self, player: str, game_lang: str, word: str, seconds: float):
+        self._queue.put(("words", (player, game_lang, word, seconds, time.time())))
+
+    def record_review(self, player: str, game_lang: str, question: str, state: tuple):
+        """Сохраняет состояние интервального повторения: (легкость, интервал, повторы, ошибки, срок)"""
+        self._queue.put(("quiz_reviews", (player, game_lang, question) + tuple(state)))
+
+    def _writer(self):
+        connection = self._connect()
+        pending: List[Tuple[str, tuple]] = []
+        deadline = 0.0
+        running = True
+        while running:
+            # Пока записей нет, поток спит до первой из них и не просыпается по таймеру
+            timeout = max(0.0, deadline - time.monotonic()) if pending else None
+            try:
+                item = self._queue.get(timeout=timeout)
+                if item is None:
+                    running = False
+                else:
+                    if not pending:
+                        deadline = time.monotonic() + FLUSH_INTERVAL
+                    pending.append(item)
+            except queue.Empty:
+                pass
+            if pending and (not running or len(pending) >= BATCH_SIZE or time.monotonic() >= deadline):
+                self._flush(connection, pending)
+                pending = []
+        connection.close()
+
+    @staticmethod
+    def _flush(connection: sqlite3.Connection, pending: List[Tuple[str, tuple]]):
+        try:
+            with connection:
+                for table, sql in INSERTS.items():
+                    rows = [row for name, row in pending if name == table]
+                    if rows:
+                        connection.executemany(sql, rows)
+        except sqlite3.Error as e:
+            print(f"⚠ Не удалось сохранить статистику: {e}")
+
+    def close(self):
+        """Сбрасывает оставшиеся записи и останавливает поток"""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+            self._thread = None
+        if self._read_connection is not None:
+            self._read_connection.close()
+            self._read_connection = None
+
+    # --- Запросы (только для экранов вне игры) ---
+
+    def _query(self, sql: str, params: tuple) -> list:
+        if self._read_connection is None:
+            self._read_connection = self._connect()
+        return self._read_connection.execute(sql, params).fetchall()
+
+    def load_reviews(self, player: str, game_lang: str) -> List[Tuple[str, float, float, int, int, float]]:
+        """Состояния повторения игрока: (вопрос, легкость, интервал, повторы, ошибки, срок)"""
+        try:
+            return self._query("SELECT question, ease, interval, reps, lapses, due FROM quiz_reviews "
+                               "WHERE player = ? AND game_lang = ?", (player, game_lang))
+        except sqlite3.Error as e:
+            print(f"⚠ Не удалось прочитать прогресс викторины: {e}")
+            return []
+
+    def leaderboard(self, mode: str, limit: int = 10) -> List[Tuple[str, int, str, float]]:
+        """Лучшие результаты режима: (игрок, счет, язык игры, время окончания)"""
+        try:
+            return self._query("SELECT player, score, game_lang, ended_at FROM games WHERE mode = ? "
+                               "ORDER BY score DESC, ended_at ASC LIMIT ?", (mode, limit))
+        except sqlite3.Error as e:
+            print(f"⚠ Не удалось прочитать рекорды: {e}")
+            return []
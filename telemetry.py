@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Поток событий игрового цикла (телеметрия).
+
+События складываются в кольцевой буфер фиксированного размера; если задан файл,
+они дописываются в него в формате JSON Lines пачками, а не по одному. Пачки
+сериализует и пишет отдельный поток (как в stats_store), игровой цикл только
+добавляет событие в буфер и передает готовую пачку в очередь. Когда
+телеметрия выключена, игра хранит None вместо объекта и ничего не вызывает.
+
+Формат строки файла:
+    {"t": 1700000000.123, "event": "apple_eaten", "mode": "classic", "score": 3}
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+RING_SIZE = 4096  # Сколько последних событий держим в памяти
+FLUSH_EVERY = 256  # Сколько событий накапливать перед записью в файл
+FRAME_OUTLIER_MS = 33.0  # Итерация цикла дольше двух кадров (при 60 FPS) попадает в телеметрию
+
+Event = Tuple[float, str, Dict[str, Any]]
+
+
+class Telemetry:
+    """Кольцевой буфер событий с необязательной записью в файл"""
+
+    def __init__(self, sink_path: Optional[str] = None, capacity: int = RING_SIZE):
+        self.events: Deque[Event] = deque(maxlen=capacity)
+        self.sink_path = sink_path
+        self._pending: List[Event] = []
+        self._queue: "queue.Queue[Optional[List[Event]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        if sink_path:
+            self._thread = threading.Thread(target=self._writer, name="telemetry-writer", daemon=True)
+            self._thread.start()
+
+    def emit(self, event: str, **fields: Any):
+        """Записывает событие; сериализация и запись в файл - в потоке записи"""
+        record = (time.time(), event, fields)
+        self.events.append(record)
+        if self.sink_path:
+            self._pending.append(record)
+            if len(self._pending) >= FLUSH_EVERY:
+                self.flush()
+
+    def recent(self, event: Optional[str] = None) -> List[Event]:
+        """Последние события из буфера (все или только указанного типа)"""
+        if event is None:
+            return list(self.events)
+        return [record for record in self.events if record[1] == event]
+
+    def flush(self):
+        """Передает накопленные события потоку записи (не ждет записи)"""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        if self._thread is not None:
+            self._queue.put(pending)
+        else:
+            self._write(pending)  # Поток уже остановлен (close) - дописываем сразу
+
+    def _writer(self):
+        while True:
+            pending = self._queue.get()
+            if pending is None:
+                return
+            self._write(pending)
+
+    def _write(self, pending: List[Event]):
+        try:
+            directory = os.path.dirname(self.sink_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.sink_path, "a", encoding="utf-8") as f:
+                for t, event, fields in pending:
+                    f.write(json.dumps(dict(t=round(t, 3), event=event, **fields), ensure_ascii=False))
+                    f.write("\n")
+        except (OSError, TypeError, ValueError) as e:
+            print(f"⚠ Не удалось записать телеметрию: {e}")
+
+    def close(self):
+        """Дописывает оставшиеся события и останавливает поток записи"""
+        self.flush()
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+            self._thread = None
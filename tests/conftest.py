@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+"""Общие настройки тестов: модули игры лежат в корне репозитория, окно не открывается"""
+
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
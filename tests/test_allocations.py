@@ -0,0 +1,15 @@
+# -*- coding: utf-8 -*-
+"""Бюджет выделения памяти за кадр (check_allocations.py) во всех режимах, меню и конце игры"""
+
+import os
+import subprocess
+import sys
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "check_allocations.py")
+
+
+def test_frame_allocation_budget():
+    # Отдельный процесс: tracemalloc и настройки записи статистики не должны затронуть другие тесты
+    result = subprocess.run([sys.executable, SCRIPT, "--frames", "120"], capture_output=True,
+                            text=True, timeout=600)
+    assert result.returncode == 0, result.stdout + result.stderr
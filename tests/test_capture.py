@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""Сборка GIF из записанных кадров"""
+
+import gc
+import os
+import weakref
+
+import pytest
+
+import capture
+from capture import FrameCapture
+
+Image = pytest.importorskip("PIL.Image")
+
+SIZE = (16, 12)
+
+
+def _record(out_dir: str, count: int) -> FrameCapture:
+    recorder = FrameCapture(out_dir, "gif", fps=10)
+    for i in range(count):
+        # Кадры различаются, иначе Pillow склеит одинаковые
+        pixels = bytes((i * 7 % 256, i // 256 * 40, 90)) * (SIZE[0] * SIZE[1])
+        recorder._queue.put((pixels, SIZE, i * 0.1))
+    return recorder
+
+
+def test_long_recording_is_thinned_and_read_one_frame_at_a_time(tmp_path, monkeypatch):
+    monkeypatch.setattr(capture, "GIF_MAX_FRAMES", 100)
+    recorder = _record(str(tmp_path), 450)
+    alive = []
+    most_alive = 0
+    read_frames = recorder._gif_frames
+
+    def tracked(indices):
+        nonlocal most_alive
+        for frame in read_frames(indices):
+            gc.collect()
+            most_alive = max(most_alive, sum(ref() is not None for ref in alive))
+            alive.append(weakref.ref(frame))
+            yield frame
+
+    recorder._gif_frames = tracked
+    recorder.close()
+
+    assert recorder.frames == 450
+    assert most_alive <= 2  # Первый кадр и предыдущий, но не вся запись
+    assert sorted(os.listdir(tmp_path)) == ["capture.gif"]
+    with Image.open(tmp_path / "capture.gif") as gif:
+        assert gif.n_frames == 90  # Каждый пятый кадр
+        durations = []
+        for i in range(gif.n_frames):
+            gif.seek(i)
+            durations.append(gif.info["duration"])
+    assert sum(durations) == pytest.approx(45000, abs=100)  # Длительность записи сохраняется
+
+
+def test_short_recording_keeps_every_frame(tmp_path):
+    recorder = _record(str(tmp_path), 20)
+    recorder.close()
+    with Image.open(tmp_path / "capture.gif") as gif:
+        assert gif.n_frames == 20
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""Проверка пакетов и доступ игр к пульту учителя"""
+
+import json
+import socket
+import time
+
+import pytest
+
+from content_server import PackClient, PackServer, validate_pack
+
+QUESTIONS = {"target": "quiz.questions",
+             "data": {"ru": [{"question": "2+2?", "correct": "4", "wrong": ["3", "5"]}]}}
+
+
+def test_only_whitelisted_targets_are_accepted():
+    assert validate_pack(QUESTIONS) is QUESTIONS
+    assert validate_pack({"target": "word_collection.words", "data": {"ko": ["사과"]}})
+    for target in ("word_collection.index", "quiz.other", "classic", None):
+        with pytest.raises(ValueError):
+            validate_pack({"target": target, "data": {"ru": []}})
+    with pytest.raises(ValueError, match=r"ru\[0\]"):
+        validate_pack({"target": "quiz.questions", "data": {"ru": [{"question": "?"}]}})
+
+
+def test_network_address_requires_token(tmp_path):
+    with pytest.raises(ValueError):
+        PackServer(str(tmp_path), "0.0.0.0:0").start()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait(condition, seconds: float = 5.0) -> bool:
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_client_needs_matching_token(tmp_path):
+    (tmp_path / "math.json").write_text(json.dumps(QUESTIONS), encoding="utf-8")
+    address = f"127.0.0.1:{_free_port()}"
+    server = PackServer(str(tmp_path), address, token="secret")
+    server.start()
+    good = PackClient(address, cache_path=None, token="secret")
+    bad = PackClient(address, cache_path=None, token="wrong")
+    try:
+        assert _wait(lambda: "quiz.questions" in good.content)
+        time.sleep(0.2)
+        assert bad.content == {}
+    finally:
+        good.close()
+        bad.close()
+        server.close()
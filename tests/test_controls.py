@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""Слой ввода на синтетических событиях pygame (без клавиатуры и геймпадов)"""
+
+import json
+
+import pygame
+import pytest
+
+import controls
+from controls import Action, InputManager
+
+
+@pytest.fixture(autouse=True)
+def event_queue():
+    # Очередь событий SDL работает только с инициализированным дисплеем (драйвер dummy)
+    pygame.display.init()
+    pygame.event.clear()
+    yield
+    pygame.display.quit()
+
+
+class FakeJoystick:
+    """Геймпад без оборудования: только то, что InputManager спрашивает при подключении"""
+
+    def __init__(self, device_index):
+        self.instance_id = 100 + device_index
+
+    def init(self):
+        pass
+
+    def get_instance_id(self):
+        return self.instance_id
+
+    def get_name(self):
+        return f"Test pad {self.instance_id}"
+
+
+def post_and_process(manager, *events):
+    """Кладет события в очередь pygame и разбирает их так же, как игровой цикл"""
+    for event_type, attributes in events:
+        pygame.event.post(pygame.event.Event(event_type, attributes))
+    actions = []
+    for event in pygame.event.get():
+        if manager.handles(event):
+            actions.extend((player, action) for player, action, _ in manager.process_event(event, 0.0))
+    return actions
+
+
+def test_keyboard_players():
+    manager = InputManager()
+    actions = post_and_process(
+        manager,
+        (pygame.KEYDOWN, {"key": pygame.K_w, "mod": 0}),
+        (pygame.KEYDOWN, {"key": pygame.K_LEFT, "mod": 0}),
+        (pygame.KEYDOWN, {"key": pygame.K_c, "mod": 0}),
+        (pygame.KEYDOWN, {"key": pygame.K_F12, "mod": 0}),  # Не привязана
+    )
+    assert actions == [(0, Action.UP), (1, Action.LEFT), (0, Action.PAUSE)]
+
+
+def test_hat_and_buttons():
+    manager = InputManager()
+    actions = post_and_process(
+        manager,
+        (pygame.JOYHATMOTION, {"instance_id": -1, "hat": 0, "value": (0, 1)}),
+        (pygame.JOYHATMOTION, {"instance_id": -1, "hat": 0, "value": (1, 0)}),
+        (pygame.JOYHATMOTION, {"instance_id": -1, "hat": 0, "value": (0, 0)}),  # Отпустили
+        (pygame.JOYBUTTONDOWN, {"instance_id": -1, "button": 7}),
+        (pygame.JOYBUTTONDOWN, {"instance_id": -1, "button": 1}),
+        (pygame.JOYBUTTONDOWN, {"instance_id": -1, "button": 5}),  # Не привязана
+    )
+    assert actions == [(0, Action.UP), (0, Action.RIGHT), (0, Action.PAUSE), (0, Action.BACK)]
+
+
+def test_axis_deadzone():
+    manager = InputManager()
+    inside = controls.AXIS_DEADZONE / 2
+    outside = (controls.AXIS_DEADZONE + 1) / 2
+
+    def axis(number, value):
+        return pygame.JOYAXISMOTION, {"instance_id": -1, "axis": number, "value": value}
+
+    actions = post_and_process(
+        manager,
+        axis(0, inside),  # Внутри мертвой зоны - ничего
+        axis(0, -inside),
+        axis(0, outside),  # Вышли вправо - одно действие
+        axis(0, outside + 0.1),  # Стик еще отклонен - не повторяется
+        axis(0, inside),  # Вернулся в зону
+        axis(0, -outside),
+        axis(1, -outside),
+        axis(1, outside),  # Сразу в другую сторону - новое действие
+        axis(2, outside),  # Правый стик не используется
+    )
+    assert actions == [(0, Action.RIGHT), (0, Action.LEFT), (0, Action.UP), (0, Action.DOWN)]
+
+
+def test_rebinding_from_file(tmp_path):
+    path = tmp_path / "bindings.json"
+    path.write_text(json.dumps({"players": [
+        {"keys": {"i": "up", "p": "pause"}, "buttons": {"2": "pause"}},
+        {},
+        {"keys": {"k": "down"}},
+    ]}), encoding="utf-8")
+    manager = InputManager(str(path))
+    actions = post_and_process(
+        manager,
+        (pygame.KEYDOWN, {"key": pygame.K_i, "mod": 0}),
+        (pygame.KEYDOWN, {"key": pygame.K_w, "mod": 0}),  # Раскладка игрока 1 заменена целиком
+        (pygame.KEYDOWN, {"key": pygame.K_UP, "mod": 0}),  # Игрок 2 остался со стрелками
+        (pygame.KEYDOWN, {"key": pygame.K_k, "mod": 0}),
+        (pygame.JOYBUTTONDOWN, {"instance_id": -1, "button": 2}),
+        (pygame.JOYBUTTONDOWN, {"instance_id": -1, "button": 7}),  # Кнопки игрока 1 тоже заменены
+    )
+    assert actions == [(0, Action.UP), (1, Action.UP), (2, Action.DOWN), (0, Action.PAUSE)]
+    assert manager.player_count == 3
+
+
+def test_bad_bindings_keep_defaults(tmp_path):
+    path = tmp_path / "bindings.json"
+    path.write_text(json.dumps({"players": [{"keys": {"w": "fly"}}]}), encoding="utf-8")
+    manager = InputManager(str(path))
+    assert post_and_process(manager, (pygame.KEYDOWN, {"key": pygame.K_w, "mod": 0})) == [(0, Action.UP)]
+
+
+def test_joysticks_assigned_to_players(monkeypatch):
+    monkeypatch.setattr(pygame.joystick, "Joystick", FakeJoystick)
+    manager = InputManager()
+    post_and_process(manager,
+                     (pygame.JOYDEVICEADDED, {"device_index": 0}),
+                     (pygame.JOYDEVICEADDED, {"device_index": 1}))
+    assert manager.joystick_players == {100: 0, 101: 1}
+
+    actions = post_and_process(
+        manager,
+        (pygame.JOYHATMOTION, {"instance_id": 101, "hat": 0, "value": (-1, 0)}),
+        (pygame.JOYBUTTONDOWN, {"instance_id": 100, "button": 0}),
+        (pygame.JOYAXISMOTION, {"instance_id": 101, "axis": 1, "value": 1.0}),
+    )
+    assert actions == [(1, Action.LEFT), (0, Action.RESUME), (1, Action.DOWN)]
+
+    # Отключенный геймпад освобождает место игрока, следующий занимает его
+    post_and_process(manager,
+                     (pygame.JOYDEVICEREMOVED, {"instance_id": 100}),
+                     (pygame.JOYDEVICEADDED, {"device_index": 2}))
+    assert manager.joystick_players == {101: 1, 102: 0}
+    actions = post_and_process(manager, (pygame.JOYHATMOTION, {"instance_id": 102, "hat": 0, "value": (0, -1)}))
+    assert actions == [(0, Action.DOWN)]
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""Слой гибелей тепловой карты получает только столкновения, а не неверные ответы"""
+
+import time
+
+import pytest
+
+import snake_game
+from heatmaps import HeatmapStore
+
+
+@pytest.fixture
+def game(tmp_path):
+    game = snake_game.Game(heatmaps=HeatmapStore(str(tmp_path)))
+    yield game
+    game.close()
+
+
+def start(game, mode: str):
+    game.start_game(mode)
+    deadline = time.monotonic() + 30.0
+    while game.current_screen != "game" and time.monotonic() < deadline:
+        game._poll_content()
+        time.sleep(0.05)
+    assert game.current_screen == "game"
+
+
+def deaths(game) -> int:
+    return int(game.heat.grid.death.sum())
+
+
+def test_wrong_answer_is_not_a_death(game):
+    start(game, "quiz")
+    wrong = next(apple for apple in game.mode.apples if apple.answer_number != game.mode.correct_number)
+    game.level.release(*game.snake.body[0])
+    game.snake.body[0] = wrong.position
+    game.level.occupy(*wrong.position)
+    game.mode.update()
+    assert game.current_screen == "game_over"
+    assert deaths(game) == 0
+
+
+def test_collision_is_a_death(game):
+    start(game, "classic")
+    game.snake.crashed = True
+    game.update()
+    assert game.current_screen == "game_over"
+    assert deaths(game) == 1
+
+
+def test_full_board_and_completed_quiz_are_not_deaths(game):
+    start(game, "classic")
+    game._end_game("board_full")
+    assert (game.current_screen, deaths(game)) == ("game_over", 0)
+    start(game, "quiz")
+    game._end_game("quiz_completed")
+    assert (game.current_screen, deaths(game)) == ("quiz_completed", 0)
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""Проверка шрифтов в отдельном процессе и выбор шрифта под язык интерфейса"""
+
+import os
+
+import pygame
+
+import font_index
+from font_index import FontIndex, measure_font, required_scripts
+
+BUILTIN_FONT = os.path.join(os.path.dirname(pygame.__file__), "freesansbold.ttf")
+
+
+def test_parallel_probe_matches_sequential():
+    paths = [BUILTIN_FONT] * font_index.PARALLEL_THRESHOLD + [__file__]  # Последний - не шрифт
+    results = FontIndex._measure(paths, max_workers=2)
+    assert results == [measure_font(BUILTIN_FONT)] * font_index.PARALLEL_THRESHOLD + [None]
+
+
+def index_with(**coverages) -> FontIndex:
+    index = FontIndex(path="")
+    index.fonts = {name: {"names": [name], "coverage": coverage} for name, coverage in coverages.items()}
+    return index
+
+
+def test_russian_interface_needs_cyrillic():
+    index = index_with(korean_only={"hangul": 1.0, "cyrillic": 0.0, "latin": 1.0},
+                       korean_cyrillic={"hangul": 1.0, "cyrillic": 1.0, "latin": 0.5})
+    assert required_scripts("ru") == ("hangul", "cyrillic")
+    assert index.best_font(required_scripts("ru")) == "korean_cyrillic"
+    assert index.best_font(required_scripts("en")) == "korean_only"
+    assert index_with(korean_only={"hangul": 1.0, "latin": 1.0}).best_font(required_scripts("ru")) is None
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""Сборка и разбор слогов хангыля, сборка слов по одному чамо"""
+
+import hangul
+from hangul import HangulAssembler
+
+
+def assemble(jamo) -> HangulAssembler:
+    assembler = HangulAssembler()
+    for item in jamo:
+        assembler.push(item)
+    return assembler
+
+
+def test_compose_decompose_round_trip():
+    for code in range(hangul.SYLLABLE_BASE, hangul.SYLLABLE_BASE + hangul.SYLLABLE_COUNT):
+        syllable = chr(code)
+        assert hangul.compose(*hangul.decompose(syllable)) == syllable
+    assert hangul.decompose("a") == ("a",)
+
+
+def test_assembler_rebuilds_words():
+    for word in ("할머니", "닭이", "없어요", "사과", "아빠", "게임"):
+        assert assemble(hangul.decompose_word(word)).text == word
+
+
+def test_double_final_splits_before_vowel():
+    assert assemble(["ㄷ", "ㅏ", "ㄺ"]).text == "닭"
+    assert assemble(["ㄷ", "ㅏ", "ㄺ", "ㅏ"]).text == "달가"
+    assert assemble(["ㄱ", "ㅏ", "ㅄ", "ㅣ"]).text == "갑시"
+    assert assemble(["ㄱ", "ㅏ", "ㄴ", "ㅏ"]).text == "가나"
+
+
+def test_backspace():
+    assembler = assemble(hangul.decompose_word("닭이"))
+    texts = []
+    while assembler.text:
+        assembler.backspace()
+        texts.append(assembler.text)
+    assert texts == ["닭ㅇ", "닭", "다", "ㄷ", ""]
+    assembler.backspace()  # Пустой текст стирать нечего
+    assert assembler.text == ""
+    assembler = assemble(["ㄷ", "ㅏ", "ㄺ", "ㅏ"])
+    assembler.backspace()
+    assert assembler.text == "닭"
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""Выбор свободной клетки и кэш карт уровней"""
+
+import levels
+from entities import Snake
+from levels import LevelMap, load_level
+
+
+def test_random_free_cell_skips_walls_and_occupied():
+    level = LevelMap.parse("tiny", "#####\n#S..#\n#####")
+    cells = {level.random_free_cell([(1, 1)]) for _ in range(200)}
+    assert cells == {(2, 1), (3, 1)}
+    assert level.random_free_cell([(1, 1), (2, 1), (3, 1)]) is None
+
+
+def test_random_free_cell_on_full_and_open_maps():
+    assert LevelMap.box(2, 2).random_free_cell() is None  # Одни стены
+    field = LevelMap.open(6, 5)
+    assert {field.random_free_cell(margin=2) for _ in range(100)} == {(2, 2), (3, 2)}
+    assert field.random_free_cell(margin=3) is None
+    occupied = [(x, y) for x in range(6) for y in range(5) if (x, y) != (4, 3)]
+    assert field.random_free_cell(occupied) == (4, 3)
+
+
+def test_oversized_map_skips_cache(tmp_path):
+    width = 70000  # Больше, чем помещается в заголовок кэша
+    (tmp_path / "wide.txt").write_text("S" + "." * (width - 1), encoding="utf-8")
+    level = load_level("wide", str(tmp_path), str(tmp_path / "cache"))
+    assert level.width == width
+    assert not (tmp_path / "cache" / "wide.bin").exists()
+    assert not list((tmp_path / "cache").glob("*.tmp"))
+
+
+def test_corrupt_cache_is_rebuilt(tmp_path):
+    (tmp_path / "room.txt").write_text("####\n#S.#\n####", encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    (cache_dir / "room.bin").write_bytes(levels.CACHE_MAGIC + b"\x01")
+    level = load_level("room", str(tmp_path), str(cache_dir))
+    assert (level.width, level.height, level.start) == (4, 3, (1, 1))
+
+
+def test_snake_cells_are_tracked_on_the_map():
+    field = LevelMap.open(4, 1)
+    snake = Snake(0, 0, 4, 1, field)
+    snake.grow()
+    snake.move()  # (1, 0) (0, 0)
+    assert {field.random_free_cell() for _ in range(100)} == {(2, 0), (3, 0)}
+    snake.move()  # Хвост освобождает (0, 0)
+    assert field.is_taken(2, 0) and not field.is_taken(0, 0)
+    assert {field.random_free_cell() for _ in range(100)} == {(0, 0), (3, 0)}
+    assert field.random_free_cell({(0, 0), (3, 0)}) is None
+
+
+def test_wall_cells_never_become_free():
+    level = LevelMap.parse("hall", "#####\n#S..#\n#####")
+    snake = Snake(1, 1, 5, 3, level)
+    for _ in range(2):
+        snake.move()
+    snake.move()  # Врезается в стену
+    assert snake.crashed
+    assert {level.random_free_cell() for _ in range(100)} == {(1, 1), (2, 1)}
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""Очередь вопросов викторины: вопрос с ошибкой возвращается в ту же сессию"""
+
+from quiz_scheduler import SESSION_RETRY_GAP, QuizScheduler
+
+NOW = 1_000_000.0
+
+
+def make_scheduler(count: int) -> QuizScheduler:
+    questions = [{"question": f"q{i}", "correct": "a", "wrong": ["b"]} for i in range(count)]
+    return QuizScheduler(questions, {}, NOW)
+
+
+def test_failed_question_comes_back_after_gap():
+    scheduler = make_scheduler(50)
+    failed = scheduler.next_question()
+    scheduler.answer(failed, False, NOW + 5)
+    asked = [scheduler.next_question() for _ in range(SESSION_RETRY_GAP + 1)]
+    assert failed not in asked[:SESSION_RETRY_GAP]
+    assert asked[SESSION_RETRY_GAP] is failed
+    assert scheduler.reviews[failed["question"]].lapses == 1
+
+
+def test_correct_answer_is_not_repeated():
+    scheduler = make_scheduler(5)
+    first = scheduler.next_question()
+    scheduler.answer(first, True, NOW + 5)
+    rest = [scheduler.next_question() for _ in range(len(scheduler))]
+    assert first not in rest
+    assert scheduler.next_question() is None
+
+
+def test_failed_question_reappears_when_bank_runs_out():
+    scheduler = make_scheduler(2)
+    scheduler.next_question()
+    last = scheduler.next_question()
+    scheduler.answer(last, False, NOW + 5)
+    assert len(scheduler) == 1
+    assert scheduler.next_question() is last
+    assert scheduler.next_question() is None
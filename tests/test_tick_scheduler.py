@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Шаг игрового цикла: сроки тиков и кадров, догонялка и ожидание срока"""
+
+import tick_scheduler
+from tick_scheduler import MAX_CATCH_UP_TICKS, SPIN_MARGIN, TickScheduler, sleep_until
+
+
+class FakeClock:
+    """Часы, которые идут только по sleep() и на каждом чтении в активном ожидании"""
+
+    def __init__(self, spin_step: float = 0.0001):
+        self.now = 100.0
+        self.spin_step = spin_step
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        self.now += self.spin_step
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_sleep_until_spins_last_margin():
+    clock = FakeClock()
+    deadline = clock.now + 0.010
+    sleep_until(deadline, clock, clock.sleep)
+    assert len(clock.sleeps) == 1
+    assert abs(clock.sleeps[0] - (0.010 - SPIN_MARGIN)) < 0.001
+    assert deadline <= clock.now < deadline + 0.001
+
+
+def test_sleep_until_near_deadline_only_spins():
+    clock = FakeClock()
+    sleep_until(clock.now + SPIN_MARGIN / 2, clock, clock.sleep)
+    sleep_until(clock.now - 1.0, clock, clock.sleep)
+    assert clock.sleeps == []
+
+
+def test_ticks_follow_deadlines_without_drift():
+    clock = FakeClock()
+    scheduler = TickScheduler(10, render_fps=60, clock=clock, sleep=clock.sleep)
+    start = clock.now
+    ticks = frames = 0
+    while frames < 600:
+        scheduler.wait()
+        while scheduler.tick_due():
+            ticks += 1
+        frames += scheduler.frame_due()
+    # 600 кадров - почти 10 секунд, тики идут с 0 до 9,9 секунды. Опоздание пробуждения
+    # (шаги активного ожидания) не копится: сроки считаются от прошлого срока
+    assert ticks == 100
+    assert abs(clock.now - (start + 599 / 60)) < 0.001
+
+
+def test_catch_up_is_clamped():
+    clock = FakeClock(spin_step=0.0)
+    scheduler = TickScheduler(100, clock=clock, sleep=clock.sleep)
+    clock.now += 1.0  # Цикл простоял секунду (например, перетаскивали окно)
+    scheduler.sync()
+    ticks = 0
+    while scheduler.tick_due():
+        ticks += 1
+    assert ticks == MAX_CATCH_UP_TICKS
+    # Пропущенные тики не догоняются: следующий - через шаг
+    assert abs(scheduler.next_tick - (clock.now + scheduler.step)) < 1e-9
+    scheduler.sync()
+    assert not scheduler.tick_due()
+
+
+def test_rate_is_bounded():
+    scheduler = TickScheduler(10_000)
+    assert scheduler.rate == tick_scheduler.MAX_TICK_RATE
+    scheduler.set_rate(0)
+    assert scheduler.rate == tick_scheduler.MIN_TICK_RATE
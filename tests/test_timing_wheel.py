@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""Колесо таймеров: раскладка с верхних уровней, отмена, очистка и сроки за горизонтом"""
+
+import pytest
+
+from timing_wheel import TimingWheel
+
+# Маленькое колесо: 4 ячейки на 4 уровнях, горизонт 4**4 = 256 тиков
+SLOTS = 4
+LEVELS = 4
+HORIZON = SLOTS ** LEVELS
+
+
+def run(wheel: TimingWheel, delays, offset: int = 0):
+    """Ставит таймеры после offset тиков и возвращает {задержка: тик срабатывания}"""
+    wheel.schedule_ticks(offset + 1, lambda: None)  # Чтобы колесо шло по тикам, а не перепрыгивало
+    wheel.advance_ticks(offset)
+    start = wheel.now
+    fired = {}
+    for delay in delays:
+        wheel.schedule_ticks(delay, lambda d: fired.setdefault(d, wheel.now - start), delay)
+    wheel.advance_ticks(max(delays) + 1)
+    return fired
+
+
+@pytest.mark.parametrize("offset", [0, 1, 3, 5, 17, 63, 200])
+def test_cascade_from_every_level(offset):
+    # 1..3 - нижнее колесо, 4..15 - уровень 1, 16..63 - уровень 2, 64..255 - уровень 3
+    delays = [1, 3, 4, 5, 15, 16, 17, 63, 64, 65, 200, 255]
+    fired = run(TimingWheel(slots=SLOTS, levels=LEVELS), delays, offset)
+    assert fired == {delay: delay for delay in delays}
+
+
+def test_cascade_default_wheel():
+    delays = [1, 63, 64, 65, 64 ** 2 - 1, 64 ** 2, 64 ** 2 + 7, 64 ** 3 + 5]
+    assert run(TimingWheel(), delays, 100) == {delay: delay for delay in delays}
+
+
+def test_beyond_horizon():
+    delays = [HORIZON - 1, HORIZON, HORIZON + 1, 3 * HORIZON + 7, 20 * HORIZON]
+    wheel = TimingWheel(slots=SLOTS, levels=LEVELS)
+    assert run(wheel, delays, 9) == {delay: delay for delay in delays}
+    assert len(wheel) == 0
+
+
+def test_cancel():
+    wheel = TimingWheel(slots=SLOTS, levels=LEVELS)
+    fired = []
+    timers = []
+    # Обработчики отменяют таймер из той же ячейки (он поставлен позже) и таймер уровня 2
+    wheel.schedule_ticks(2, lambda: wheel.cancel(timers[0]))
+    wheel.schedule_ticks(1, lambda: wheel.cancel(timers[2]))
+    timers.extend(wheel.schedule_ticks(delay, fired.append, delay) for delay in (2, 10, 40, 1000))
+    wheel.cancel(timers[3])
+    wheel.cancel(timers[3])  # Повторная отмена безопасна
+    assert len(wheel) == 5
+    wheel.advance_ticks(2000)
+    assert len(wheel) == 0
+    assert fired == [10]
+    wheel.cancel(timers[1])  # Отмена сработавшего тоже
+    assert len(wheel) == 0
+
+
+def test_cancel_periodic():
+    wheel = TimingWheel(slots=SLOTS, levels=LEVELS)
+    fired = []
+    timer = wheel.schedule_ticks(5, lambda: fired.append(wheel.now), period=7)
+    wheel.advance_ticks(20)
+    assert fired == [5, 12, 19]
+    wheel.cancel(timer)
+    wheel.advance_ticks(100)
+    assert fired == [5, 12, 19]
+    assert len(wheel) == 0
+
+
+def test_clear():
+    wheel = TimingWheel(slots=SLOTS, levels=LEVELS)
+    fired = []
+    for delay in (1, 5, 50, 150, 5000):
+        wheel.schedule_ticks(delay, fired.append, delay)
+    wheel.schedule_ticks(3, fired.append, "periodic", period=3)
+    wheel.advance(0.005)  # Полтика остается в остатке
+    wheel.clear()
+    assert len(wheel) == 0
+    assert wheel.advance_ticks(10000) == 0
+    assert fired == []
+    # После очистки колесо работает как новое, и остаток времени тоже сброшен
+    wheel.schedule_ticks(2, fired.append, "after")
+    wheel.advance(0.015)  # Без сброса остатка это были бы два тика
+    assert fired == []
+    wheel.advance(0.01)
+    assert fired == ["after"]
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""Неправильные буквы в режиме сбора слов не должны выдавать правильную"""
+
+import hangul
+from entities import Language
+from modes.word_collection import Mode
+
+DRAWS = 2000
+
+
+def distractors(word: str, index: int) -> set:
+    """Все неправильные чамо, которые выпадают для index-го чамо слова"""
+    mode = Mode(None)
+    letters = hangul.decompose_word(word)
+    kinds = hangul.decompose_word_kinds(word)
+    return {mode._get_random_letter(Language.KOREAN, letters[index], kinds[index]) for _ in range(DRAWS)}
+
+
+def test_word_kinds():
+    assert hangul.decompose_word("뱀") == ["ㅂ", "ㅐ", "ㅁ"]
+    assert hangul.decompose_word_kinds("뱀") == [hangul.INITIAL, hangul.VOWEL, hangul.FINAL]
+    assert hangul.decompose_word_kinds("사과") == [hangul.INITIAL, hangul.VOWEL] * 2
+    assert hangul.decompose_word_kinds("ㅋ") == [""]
+
+
+def test_distractors_include_compound_jamo():
+    # ㅐ (뱀), ㄸ (딸), ㅘ (사과), ㅃ (아빠), ㅔ (게임) - не только основные чамо
+    assert {"ㅐ", "ㅔ", "ㅘ"} <= distractors("뱀", 1)
+    assert {"ㄸ", "ㅃ", "ㄲ"} <= distractors("딸", 0)
+    assert "ㅘ" in distractors("사과", 3)
+
+
+def test_distractors_keep_jamo_role():
+    assert distractors("뱀", 0) <= set(hangul.INITIALS)
+    assert distractors("뱀", 1) == set(hangul.VOWELS)
+    assert distractors("뱀", 2) <= set(hangul.FINALS[1:])
+    # Составные конечные есть только в роли конечной согласной
+    assert "ㄳ" in distractors("딸", 2)
+    assert "ㄳ" not in distractors("딸", 0)
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""Выбор слов по частоте и кэш индекса словарей"""
+
+import random
+from collections import Counter
+
+from word_index import WordIndex
+
+DRAWS = 4000
+
+
+def build(tmp_path, words: str) -> WordIndex:
+    words_dir = tmp_path / "words"
+    words_dir.mkdir(exist_ok=True)
+    (words_dir / "en.txt").write_text(words, encoding="utf-8")
+    index = WordIndex()
+    assert index.load(str(words_dir), str(tmp_path / "cache" / "word_index.pickle"))
+    return index
+
+
+def test_frequent_words_are_picked_more_often(tmp_path):
+    # Слова одной длины и из одних букв - один уровень сложности
+    index = build(tmp_path, "CAT\t1000000\nACT\t1\nTAC\n")
+    random.seed(3)
+    picks = Counter(index.pick("en", "en", 1)[1] for _ in range(DRAWS))
+    assert set(picks) == {"CAT", "ACT", "TAC"}  # Редкие слова не пропадают
+    assert picks["CAT"] > 2 * picks["ACT"]
+    assert abs(picks["ACT"] - picks["TAC"]) < DRAWS // 10
+
+
+def test_weights_survive_the_cache(tmp_path, monkeypatch):
+    built = build(tmp_path, "CAT\t1000000\nACT\t1\n")
+
+    def rebuild(self, sources):
+        raise AssertionError("индекс должен загрузиться из кэша")
+
+    monkeypatch.setattr(WordIndex, "_build", rebuild)
+    cached = WordIndex()
+    assert cached.load(str(tmp_path / "words"), str(tmp_path / "cache" / "word_index.pickle"))
+    assert cached.level_weights == built.level_weights
+    assert cached.level_weights["en"][1][-1] > 2 * len(cached.levels["en"][1])
+    assert [path.name for path in (tmp_path / "cache").iterdir()] == ["word_index.pickle"]
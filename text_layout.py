@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Раскладка текста по строкам с переносом по ширине.
+
+Текст переносится по пробелам; слово, которое не помещается целиком, режется
+по символам (так корректно переносятся и кириллица с латиницей, и слоги хангыля).
+Если строк получается больше допустимого, шрифт уменьшается. Готовые раскладки
+кэшируются по (текст, ширина, размер шрифта), поэтому для вопроса викторины
+переносы считаются один раз, а не в каждом кадре.
+
+Строки интерфейса вида "Счет: 12", которые выводятся каждый кадр, собираются
+через Label - заново только когда меняется значение или язык.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional, Tuple
+
+import pygame
+
+LAYOUT_CACHE_LIMIT = 256  # Сколько раскладок держим в кэше
+MIN_FONT_SIZE = 14  # Меньше этого размера шрифт при подгонке не уменьшается
+FONT_STEP = 2
+
+
+class TextLayout:
+    """Результат раскладки: строки и их размеры"""
+
+    __slots__ = ("lines", "size", "line_height", "width", "height")
+
+    def __init__(self, lines: List[str], size: int, line_height: int, width: int):
+        self.lines = lines
+        self.size = size  # Итоговый размер шрифта (может быть меньше запрошенного)
+        self.line_height = line_height
+        self.width = width  # Ширина самой длинной строки
+        self.height = line_height * len(lines)
+
+
+class Label:
+    """Строка "подпись: значение" для вывода в каждом кадре; пересобирается только при изменениях"""
+
+    __slots__ = ("caption", "value", "text")
+
+    def __init__(self):
+        self.caption: Optional[str] = None
+        self.value: Any = None
+        self.text = ""
+
+    def format(self, caption: str, value: Any) -> str:
+        if caption != self.caption or value != self.value:
+            self.caption = caption
+            self.value = value
+            self.text = f"{caption}: {value}"
+        return self.text
+
+
+def _split_long_word(word: str, font: pygame.font.Font, max_width: int) -> List[str]:
+    """Режет слово шире max_width на куски по символам"""
+    pieces = []
+    piece = ""
+    for char in word:
+        if piece and font.size(piece + char)[0] > max_width:
+            pieces.append(piece)
+            piece = char
+        else:
+            piece += char
+    if piece:
+        pieces.append(piece)
+    return pieces
+
+
+def wrap_lines(text: str, font: pygame.font.Font, max_width: int) -> List[str]:
+    """Разбивает текст на строки не шире max_width пикселей"""
+    lines: List[str] = []
+    for paragraph in text.split("\n"):
+        line = ""
+        for word in paragraph.split():
+            candidate = f"{line} {word}" if line else word
+            if font.size(candidate)[0] <= max_width:
+                line = candidate
+                continue
+            if line:
+                lines.append(line)
+            if font.size(word)[0] <= max_width:
+                line = word
+            else:
+                *full, line = _split_long_word(word, font, max_width)
+                lines.extend(full)
+        lines.append(line)
+    return lines
+
+
+class LayoutCache:
+    """Кэш раскладок с вытеснением давно не использованных (LRU)"""
+
+    def __init__(self, font_getter: Callable[[int], pygame.font.Font], limit: int = LAYOUT_CACHE_LIMIT):
+        self.font_getter = font_getter
+        self.limit = limit
+        self._layouts: "OrderedDict[Tuple, TextLayout]" = OrderedDict()
+
+    def layout(self, text: str, size: int, max_width: int, max_lines: Optional[int] = None) -> TextLayout:
+        """Раскладывает текст; при max_lines уменьшает шрифт, пока текст не уместится"""
+        # Шрифт входит в ключ: после фоновой загрузки шрифтов раскладка пересчитывается
+        key = (text, max_width, size, max_lines, id(self.font_getter(size)))
+        cached = self._layouts.get(key)
+        if cached is not None:
+            self._layouts.move_to_end(key)
+            return cached
+
+        while True:
+            font = self.font_getter(size)
+            lines = wrap_lines(text, font, max_width)
+            if max_lines is None or len(lines) <= max_lines or size - FONT_STEP < MIN_FONT_SIZE:
+                break
+            size -= FONT_STEP
+        width = max((font.size(line)[0] for line in lines), default=0)
+        result = TextLayout(lines, size, font.get_linesize(), width)
+
+        self._layouts[key] = result
+        if len(self._layouts) > self.limit:
+            self._layouts.popitem(last=False)
+        return result
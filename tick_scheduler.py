@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Планировщик игрового цикла и профили сложности.
+
+Симуляция (движение змейки) идет с фиксированным шагом, частота которого
+растет вместе со счетом и длиной змейки по профилю сложности. Отрисовка идет
+со своей постоянной частотой. Сроки тиков и кадров считаются от предыдущего
+срока, а не от момента пробуждения, поэтому неточность sleep не накапливается
+и частота не "уплывает" даже на 240 Гц. Между сроками цикл спит, а последние
+SPIN_MARGIN секунд до срока крутится: sleep просыпается с опозданием до
+нескольких миллисекунд (на Windows - до 15), а на 240 Гц весь шаг - 4 мс.
+
+Дополнительно можно задать частоту опроса ввода: цикл будет просыпаться и чаще,
+чтобы нажатия получали более точные отметки времени.
+"""
+
+import time
+from typing import Callable, Dict, Optional
+
+RENDER_FPS = 60  # Частота отрисовки, не зависит от скорости змейки
+MIN_TICK_RATE = 1.0
+MAX_TICK_RATE = 240.0
+MAX_CATCH_UP_TICKS = 8  # Больше тиков за одну итерацию не догоняем (например, после перетаскивания окна)
+SPIN_MARGIN = 0.002  # Секунд до срока, которые цикл ждет активно, а не во сне
+
+
+def sleep_until(deadline: float, clock: Callable[[], float] = time.perf_counter,
+                sleep: Callable[[float], None] = time.sleep):
+    """Спит до deadline, не доходя SPIN_MARGIN, и дожидается срока в активном ожидании"""
+    remaining = deadline - clock() - SPIN_MARGIN
+    if remaining > 0:
+        sleep(remaining)
+    while clock() < deadline:
+        pass
+
+
+class DifficultyProfile:
+    """Кривая сложности: частота тиков в зависимости от счета и длины змейки"""
+
+    def __init__(self, name: str, base_rate: float, max_rate: float, per_point: float = 0.0,
+                 per_segment: float = 0.0, modes: Optional[Dict[str, Dict[str, float]]] = None,
+                 apple_lifetime: float = 0.0):
+        self.name = name
+        self.base_rate = base_rate  # Тиков в секунду в начале игры
+        self.max_rate = max_rate
+        self.per_point = per_point  # Прибавка за очко
+        self.per_segment = per_segment  # Прибавка за сегмент сверх первого
+        self.modes = modes or {}  # Режим -> переопределенные параметры
+        self.apple_lifetime = apple_lifetime  # Секунд до переезда несъеденного яблока (0 - не переезжает)
+
+    def rate(self, mode: str, score: int, length: int) -> float:
+        """Частота тиков для режима при текущем счете и длине змейки"""
+        params = self.modes.get(mode, {})
+        base_rate = params.get("base_rate", self.base_rate)
+        max_rate = params.get("max_rate", self.max_rate)
+        per_point = params.get("per_point", self.per_point)
+        per_segment = params.get("per_segment", self.per_segment)
+        rate = base_rate + score * per_point + (length - 1) * per_segment
+        return max(MIN_TICK_RATE, min(rate, max_rate, MAX_TICK_RATE))
+
+
+# В викторине и сборе слов очки даются по 10 за ответ/слово, поэтому прибавка за очко меньше
+DIFFICULTY_PROFILES: Dict[str, DifficultyProfile] = {
+    "classic": DifficultyProfile("classic", 10, 10),
+    "easy": DifficultyProfile("easy", 6, 12, per_point=0.2,
+                              modes={"quiz": {"per_point": 0.02}, "word_collection": {"per_point": 0.05}}),
+    "normal": DifficultyProfile("normal", 10, 20, per_point=0.3,
+                                modes={"quiz": {"per_point": 0.03}, "word_collection": {"per_point": 0.1}}),
+    "hard": DifficultyProfile("hard", 14, 30, per_point=0.3, per_segment=0.2,
+                              modes={"quiz": {"base_rate": 10, "per_point": 0.05}}, apple_lifetime=12.0),
+    "competitive": DifficultyProfile("competitive", 20, 60, per_point=0.5, per_segment=0.5,
+                                     modes={"quiz": {"base_rate": 12, "max_rate": 30}}, apple_lifetime=8.0),
+}
+DEFAULT_DIFFICULTY = "classic"
+
+
+class TickScheduler:
+    """Фиксированный шаг симуляции и отдельный шаг отрисовки по абсолютным срокам"""
+
+    def __init__(self, rate: float, render_fps: float = RENDER_FPS, poll_rate: float = 0.0,
+                 clock: Callable[[], float] = time.perf_counter, sleep: Callable[[float], None] = time.sleep):
+        self.clock = clock
+        self.sleep = sleep
+        self.frame_step = 1.0 / render_fps
+        # 0 - ввод опрашивается только по тикам и кадрам
+        self.poll_step = 1.0 / poll_rate if poll_rate > 0 else 0.0
+        self.rate = 0.0
+        self.step = 0.0
+        self.set_rate(rate)
+        now = clock()
+        self.next_tick = now
+        self.next_frame = now
+        self.next_poll = now
+        self._now = now
+        self._ticks_this_frame = 0
+
+    def set_rate(self, rate: float):
+        """Меняет частоту тиков; новый шаг действует со следующего тика"""
+        rate = max(MIN_TICK_RATE, min(rate, MAX_TICK_RATE))
+        if rate != self.rate:
+            self.rate = rate
+            self.step = 1.0 / rate
+
+    def reset(self):
+        """Первый тик - сразу (например, при старте игры)"""
+        self.next_tick = self.clock()
+
+    def deadline(self) -> float:
+        """Ближайший срок: тика, кадра или опроса ввода"""
+        deadline = min(self.next_tick, self.next_frame)
+        if self.poll_step:
+            deadline = min(deadline, self.next_poll)
+        return deadline
+
+    def wait(self):
+        """Ждет ближайшего срока (см. sleep_until)"""
+        sleep_until(self.deadline(), self.clock, self.sleep)
+        self.sync()
+
+    def sync(self, now: Optional[float] = None):
+        """Начинает итерацию цикла в момент now (когда ждет общий цикл нескольких игр)"""
+        self._now = self.clock() if now is None else now
+        self._ticks_this_frame = 0
+        if self.poll_step and self.next_poll <= self._now:
+            self.next_poll += self.poll_step
+            if self.next_poll <= self._now:
+                self.next_poll = self._now + self.poll_step
+
+    def tick_due(self) -> bool:
+        """Пора ли выполнить очередной тик симуляции (вызывать в цикле до False)"""
+        if self.next_tick > self._now:
+            return False
+        if self._ticks_this_frame >= MAX_CATCH_UP_TICKS:
+            # Сильно отстали - пропускаем лишние тики, чтобы не уйти в бесконечную догонялку
+            self.next_tick = self._now + self.step
+            return False
+        self.next_tick += self.step
+        self._ticks_this_frame += 1
+        return True
+
+    def frame_due(self) -> bool:
+        """Пора ли отрисовать кадр"""
+        if self.next_frame > self._now:
+            return False
+        self.next_frame += self.frame_step
+        if self.next_frame <= self._now:
+            self.next_frame = self._now + self.frame_step
+        return True
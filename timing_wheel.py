@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Иерархическое колесо таймеров для отложенных и периодических событий игры.
+
+Время идет тиками фиксированной длины (resolution), независимо от скорости
+змейки. Колесо нижнего уровня - кольцо из slots ячеек по одному тику; каждая
+ячейка следующего уровня покрывает полный оборот предыдущего. Таймер кладется
+в ячейку по сроку, а когда нижнее колесо делает оборот, ячейка верхнего уровня
+раскладывается ниже. Поэтому постановка, отмена и срабатывание стоят O(1)
+на таймер при любом числе ожидающих таймеров, а тик без таймеров ничего не стоит.
+
+Отмена ленивая: таймер помечается неактивным и выбрасывается, когда колесо
+дойдет до его ячейки.
+"""
+
+from typing import Any, Callable, List
+
+TIMER_RESOLUTION = 0.01  # Секунд в тике колеса
+WHEEL_SLOTS = 64  # Ячеек в колесе каждого уровня (степень двойки)
+WHEEL_LEVELS = 4  # 64**4 тиков по 10 мс - больше 46 часов
+
+
+class Timer:
+    """Запланированный вызов; отменяется через TimingWheel.cancel"""
+
+    __slots__ = ("deadline", "callback", "args", "period", "active")
+
+    def __init__(self, deadline: int, callback: Callable[..., Any], args: tuple, period: int):
+        self.deadline = deadline  # Тик колеса, в который сработает
+        self.callback = callback
+        self.args = args
+        self.period = period  # Тиков между повторами (0 - однократный)
+        self.active = True
+
+
+class TimingWheel:
+    """Колесо таймеров; продвигается игровым циклом через advance"""
+
+    def __init__(self, resolution: float = TIMER_RESOLUTION, slots: int = WHEEL_SLOTS,
+                 levels: int = WHEEL_LEVELS):
+        if slots < 2 or slots & (slots - 1):
+            raise ValueError(f"Число ячеек колеса должно быть степенью двойки: {slots}")
+        self.resolution = resolution
+        self.bits = slots.bit_length() - 1
+        self.mask = slots - 1
+        self.wheels: List[List[List[Timer]]] = [[[] for _ in range(slots)] for _ in range(levels)]
+        self.now = 0  # Последний обработанный тик
+        self.pending = 0  # Активных таймеров
+        self._carry = 0.0  # Остаток времени меньше тика
+
+    def __len__(self) -> int:
+        return self.pending
+
+    def ticks(self, seconds: float) -> int:
+        """Секунды в тики колеса (не меньше одного)"""
+        return max(1, int(round(seconds / self.resolution)))
+
+    def schedule(self, delay: float, callback: Callable[..., Any], *args, period: float = 0.0) -> Timer:
+        """Вызовет callback(*args) через delay секунд, затем каждые period секунд, если он задан"""
+        return self.schedule_ticks(self.ticks(delay), callback, *args,
+                                   period=self.ticks(period) if period > 0 else 0)
+
+    def schedule_ticks(self, delay: int, callback: Callable[..., Any], *args, period: int = 0) -> Timer:
+        """То же, что schedule, но сроки в тиках колеса"""
+        timer = Timer(self.now + max(1, delay), callback, args, max(0, period))
+        self._insert(timer)
+        self.pending += 1
+        return timer
+
+    def cancel(self, timer: Timer):
+        """Отменяет таймер (повторная отмена и отмена сработавшего безопасны)"""
+        if timer is not None and timer.active:
+            timer.active = False
+            self.pending -= 1
+
+    def clear(self):
+        """Отменяет все таймеры (например, при старте новой игры)"""
+        for wheel in self.wheels:
+            for slot in wheel:
+                for timer in slot:
+                    timer.active = False
+                slot.clear()
+        self.pending = 0
+        self._carry = 0.0
+
+    def advance(self, seconds: float) -> int:
+        """Продвигает колесо на прошедшее время; возвращает число сработавших таймеров"""
+        self._carry += seconds
+        ticks = int(self._carry / self.resolution)
+        if ticks <= 0:
+            return 0
+        self._carry -= ticks * self.resolution
+        return self.advance_ticks(ticks)
+
+    def advance_ticks(self, ticks: int) -> int:
+        """Продвигает колесо на ticks тиков"""
+        fired = 0
+        target = self.now + ticks
+        while self.now < target:
+            if not self.pending:
+                # Колеса пусты - раскладывать и вызывать нечего, просто переводим время
+                self.now = target
+                break
+            self.now += 1
+            self._cascade()
+            fired += self._fire()
+        return fired
+
+    def _insert(self, timer: Timer):
+        delta = timer.deadline - self.now
+        bits = self.bits
+        for level in range(len(self.wheels)):
+            if delta < 1 << (bits * (level + 1)):
+                self.wheels[level][(timer.deadline >> (bits * level)) & self.mask].append(timer)
+                return
+        # Дальше верхнего колеса: в последнюю ячейку оборота, при раскладке срок проверится снова
+        top = len(self.wheels) - 1
+        self.wheels[top][((self.now >> (bits * top)) - 1) & self.mask].append(timer)
+
+    def _cascade(self):
+        """На границе оборота раскладывает ячейки верхних колес ниже"""
+        bits = self.bits
+        for level in range(1, len(self.wheels)):
+            if (self.now >> (bits * (level - 1))) & self.mask:
+                break
+            wheel = self.wheels[level]
+            index = (self.now >> (bits * level)) & self.mask
+            timers, wheel[index] = wheel[index], []
+            for timer in timers:
+                if timer.active:
+                    self._insert(timer)
+
+    def _fire(self) -> int:
+        wheel = self.wheels[0]
+        index = self.now & self.mask
+        timers, wheel[index] = wheel[index], []
+        fired = 0
+        for timer in timers:
+            if not timer.active:
+                continue
+            fired += 1
+            if timer.period:
+                timer.deadline += timer.period
+                self._insert(timer)
+            else:
+                timer.active = False
+                self.pending -= 1
+            # Обработчик может отменить этот или другие таймеры и поставить новые
+            timer.callback(*timer.args)
+        return fired
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Индекс больших словарей для режима сбора слов.
+
+Источники лежат в папке words/:
+    ru.txt, en.txt, ko.txt  - по слову в строке, через табуляцию можно указать частоту
+    translations.tsv        - переводы; первая строка - коды языков (например: ru<TAB>en<TAB>ko)
+
+Индекс строится один раз, сохраняется на диск и перестраивается только при изменении
+исходных файлов. Слова раскладываются по уровням сложности заранее, и для каждого
+уровня заранее считаются накопленные веса по частотам, поэтому выбор слова нужного
+уровня - это random.choices по готовому списку (двоичный поиск по весам). Частые
+слова выпадают чаще, но вес растет логарифмически и редкие слова не пропадают.
+"""
+
+import math
+import os
+import pickle
+import random
+import tempfile
+from collections import Counter
+from itertools import accumulate
+from typing import Dict, List, Optional, Tuple
+
+import hangul
+
+INDEX_VERSION = 2
+MAX_LEVEL = 5
+COMMON_LETTER_SHARE = 0.9  # Буквы, покрывающие 90% вхождений, считаются частыми
+
+
+def split_letters(word: str, lang: str) -> List[str]:
+    """Буквы, которые игрок собирает по одной (для корейского - чамо)"""
+    if lang == "ko":
+        return hangul.decompose_word(word)
+    return list(word)
+
+
+def frequency_weight(frequency: int) -> float:
+    """Вес слова при выборе; слова без частоты получают вес 1"""
+    return 1.0 + math.log1p(max(frequency, 0))
+
+
+def length_band(letter_count: int) -> int:
+    """Базовый уровень сложности по числу собираемых букв"""
+    if letter_count <= 3:
+        return 1
+    if letter_count <= 5:
+        return 2
+    if letter_count <= 7:
+        return 3
+    return 4
+
+
+class WordIndex:
+    """Словари, разложенные по уровням сложности, и таблица переводов"""
+
+    def __init__(self):
+        self.ready = False
+        self.words: Dict[str, List[str]] = {}  # Слова языка, отсортированные по частоте
+        self.frequencies: Dict[str, Dict[str, int]] = {}  # Язык -> слово -> частота из словаря
+        self.levels: Dict[str, List[List[int]]] = {}  # Язык -> уровень -> номера слов
+        self.level_weights: Dict[str, List[List[float]]] = {}  # Накопленные веса слов уровня
+        self.common_letters: Dict[str, str] = {}  # Частые буквы языка
+        self.pairs: List[Dict[str, str]] = []  # Строки таблицы переводов
+        self.pair_levels: Dict[Tuple[str, str], List[List[int]]] = {}  # (откуда, куда) -> уровень -> строки
+        self.pair_weights: Dict[Tuple[str, str], List[List[float]]] = {}  # Накопленные веса строк уровня
+        self.pair_of: Dict[str, Dict[str, int]] = {}  # Язык -> слово -> строка таблицы переводов
+
+    # --- Загрузка ---
+
+    @staticmethod
+    def _sources(words_dir: str) -> List[str]:
+        if not os.path.isdir(words_dir):
+            return []
+        return sorted(os.path.join(words_dir, name) for name in os.listdir(words_dir)
+                      if name.endswith(".txt") or name == "translations.tsv")
+
+    @staticmethod
+    def _signature(sources: List[str]) -> List[Tuple[str, int, int]]:
+        signature = []
+        for path in sources:
+            stat = os.stat(path)
+            signature.append((os.path.basename(path), stat.st_mtime_ns, stat.st_size))
+        return signature
+
+    def load(self, words_dir: str, cache_path: Optional[str] = None) -> bool:
+        """Загружает индекс из кэша или строит его заново. Возвращает True, если слова есть"""
+        sources = self._sources(words_dir)
+        if not sources:
+            return False
+        signature = self._signature(sources)
+
+        if cache_path and os.path.exists(cache_path):
+            try:
+                with open(cache_path, "rb") as f:
+                    cached = pickle.load(f)
+                if cached.get("version") == INDEX_VERSION and cached.get("signature") == signature:
+                    self.__dict__.update(cached["index"])
+                    self.ready = True
+                    return True
+            except Exception as e:
+                print(f"⚠ Кэш словаря поврежден, перестраиваем: {e}")
+
+        self._build(sources)
+        if cache_path:
+            self._save_cache(cache_path, signature)
+        self.ready = True
+        return True
+
+    def _save_cache(self, cache_path: str, signature: List[Tuple[str, int, int]]):
+        index = {key: value for key, value in self.__dict__.items() if key != "ready"}
+        data = pickle.dumps({"version": INDEX_VERSION, "signature": signature, "index": index},
+                            protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path = None
+        try:
+            cache_dir = os.path.dirname(cache_path)
+            os.makedirs(cache_dir, exist_ok=True)
+            # Свой временный файл у каждой записи: кэш могут одновременно строить несколько процессов
+            with tempfile.NamedTemporaryFile("wb", dir=cache_dir, prefix="word_index.", suffix=".tmp",
+                                             delete=False) as f:
+                tmp_path = f.name
+                f.write(data)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            print(f"⚠ Не удалось сохранить кэш словаря: {e}")
+
+    def _build(self, sources: List[str]):
+        """Строит индекс по исходным файлам"""
+        for path in sources:
+            name = os.path.basename(path)
+            if name == "translations.tsv":
+                self._read_translations(path)
+            else:
+                self._read_word_list(name[:-len(".txt")], path)
+
+        # Переводы тоже участвуют в частотах букв
+        for row in self.pairs:
+            for lang in row:
+                self.words.setdefault(lang, [])
+
+        for lang, words in self.words.items():
+            letter_counts: Counter = Counter()
+            for word in words:
+                letter_counts.update(split_letters(word, lang))
+            for row in self.pairs:
+                if lang in row:
+                    letter_counts.update(split_letters(row[lang], lang))
+            self.common_letters[lang] = self._common_letters(letter_counts)
+            self.levels[lang] = self._bucket(lang, words)
+            frequencies = self.frequencies.get(lang, {})
+            self.level_weights[lang] = [self._cumulative(frequencies.get(words[i], 0) for i in bucket)
+                                        for bucket in self.levels[lang]]
+
+        langs = sorted(self.words)
+        for src in langs:
+            for dst in langs:
+                if src == dst:
+                    continue
+                rows = [i for i, row in enumerate(self.pairs) if src in row and dst in row]
+                buckets: List[List[int]] = [[] for _ in range(MAX_LEVEL + 1)]
+                for i in rows:
+                    # Сложность определяется словом, которое собирает игрок (язык игры)
+                    buckets[self.word_level(self.pairs[i][dst], dst)].append(i)
+                self.pair_levels[(src, dst)] = buckets
+                # Вес строки - частота собираемого слова в словаре языка игры
+                frequencies = self.frequencies.get(dst, {})
+                self.pair_weights[(src, dst)] = [
+                    self._cumulative(frequencies.get(self.pairs[i][dst], 0) for i in bucket) for bucket in buckets]
+
+    def _read_word_list(self, lang: str, path: str):
+        entries: List[Tuple[int, int, str]] = []
+        frequencies: Dict[str, int] = {}
+        seen = set()
+        with open(path, encoding="utf-8") as f:
+            for order, line in enumerate(f):
+                parts = line.rstrip("\n").split("\t")
+                word = parts[0].strip().upper()
+                if not word or word.startswith("#") or word in seen:
+                    continue
+                seen.add(word)
+                try:
+                    frequency = int(parts[1]) if len(parts) > 1 else 0
+                except ValueError:
+                    frequency = 0
+                entries.append((-frequency, order, word))
+                if frequency > 0:
+                    frequencies[word] = frequency
+        # Без частот сохраняется порядок файла (списки обычно уже отсортированы по частоте)
+        entries.sort()
+        self.words[lang] = [word for _, _, word in entries]
+        self.frequencies[lang] = frequencies
+
+    def _read_translations(self, path: str):
+        with open(path, encoding="utf-8") as f:
+            header = [code.strip() for code in f.readline().rstrip("\n").split("\t")]
+            for line in f:
+                cells = line.rstrip("\n").split("\t")
+                row = {lang: cell.strip().upper() for lang, cell in zip(header, cells) if cell.strip()}
+                if len(row) < 2:
+                    continue
+                index = len(self.pairs)
+                self.pairs.append(row)
+                for lang, word in row.items():
+                    self.pair_of.setdefault(lang, {}).setdefault(word, index)
+
+    @staticmethod
+    def _common_letters(letter_counts: Counter) -> str:
+        total = sum(letter_counts.values())
+        common = []
+        covered = 0
+        for letter, count in letter_counts.most_common():
+            if covered >= total * COMMON_LETTER_SHARE:
+                break
+            common.append(letter)
+            covered += count
+        return "".join(common)
+
+    def word_level(self, word: str, lang: str) -> int:
+        """Уровень сложности слова: длина плюс наличие редких букв"""
+        letters = split_letters(word, lang)
+        level = length_band(len(letters))
+        common = self.common_letters.get(lang, "")
+        if common and any(letter not in common for letter in letters):
+            level += 1
+        return min(level, MAX_LEVEL)
+
+    @staticmethod
+    def _cumulative(frequencies) -> List[float]:
+        return list(accumulate(frequency_weight(frequency) for frequency in frequencies))
+
+    def _bucket(self, lang: str, words: List[str]) -> List[List[int]]:
+        buckets: List[List[int]] = [[] for _ in range(MAX_LEVEL + 1)]
+        for i, word in enumerate(words):
+            buckets[self.word_level(word, lang)].append(i)
+        return buckets
+
+    # --- Выбор слов ---
+
+    @staticmethod
+    def _nearest_level(buckets: List[List[int]], level: int) -> int:
+        """Ближайший к level непустой уровень; 0, если все уровни пусты"""
+        # Уровней всего несколько, поэтому поиск ближайшего непустого - O(1)
+        level = max(1, min(level, MAX_LEVEL))
+        for delta in range(MAX_LEVEL):
+            for candidate in (level - delta, level + delta):
+                if 1 <= candidate <= MAX_LEVEL and buckets[candidate]:
+                    return candidate
+        return 0
+
+    def pick(self, display_lang: str, game_lang: str, level: int) -> Optional[Tuple[str, str]]:
+        """Выбирает слово уровня level: (слово на языке интерфейса, слово на языке игры)"""
+        if not self.ready:
+            return None
+        if display_lang == game_lang:
+            words = self.words.get(game_lang)
+            buckets = self.levels.get(game_lang)
+            level = self._nearest_level(buckets, level) if words and buckets else 0
+            if not level:
+                return None
+            word = words[random.choices(buckets[level], cum_weights=self.level_weights[game_lang][level])[0]]
+            return word, word
+
+        key = (display_lang, game_lang)
+        buckets = self.pair_levels.get(key)
+        level = self._nearest_level(buckets, level) if buckets else 0
+        if not level:
+            return None
+        row = self.pairs[random.choices(buckets[level], cum_weights=self.pair_weights[key][level])[0]]
+        return row[display_lang], row[game_lang]
+
+    def translate(self, word: str, from_lang: str, to_lang: str) -> Optional[str]:
+        """Переводит слово по таблице переводов"""
+        index = self.pair_of.get(from_lang, {}).get(word)
+        if index is None:
+            return None
+        return self.pairs[index].get(to_lang)